@@ -0,0 +1,42 @@
+"""Time of the README chart data, total points of every position in every team,
+by one filter per team and position against one `ElementGroup.aggregate()`.
+
+Run from the repository root, with a snapshot from `fpld snapshot`:
+```
+FPLD_SNAPSHOT=replay:snapshots/2022-12-10 python -m benchmarks.bench_aggregate
+```
+"""
+from timeit import repeat
+from typing import Any, Callable
+import fpld
+
+
+NUMBER = 5
+
+
+def best_ms(func: Callable[[], Any]) -> float:
+    return min(repeat(func, number=NUMBER, repeat=5)) / NUMBER * 1000
+
+
+def by_filter() -> list[list[int]]:
+    players = fpld.Player.get_all()
+
+    return [[sum(p.total_points for p in players.filter(team=team, element_type=position)) for team in fpld.Team.get_all()]
+            for position in fpld.Position.get_all()]
+
+
+def by_aggregate() -> list[list[int]]:
+    points = fpld.Player.get_all().aggregate(by=("team", "element_type"), total_points="sum")["total_points"].unstack()
+
+    return [points[position].tolist() for position in points.columns]
+
+
+def main() -> None:
+    assert by_filter() == by_aggregate()
+
+    print(f"chart, filter per team and position  {best_ms(by_filter):>8.2f} ms")
+    print(f"chart, aggregate                     {best_ms(by_aggregate):>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
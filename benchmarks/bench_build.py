@@ -0,0 +1,35 @@
+"""Time to build every player from downloaded data, with the teams and positions they link to already built.
+
+Cached queries and previously built players are dropped before each repeat, so every player is built again.
+
+Run from the repository root, with a snapshot from `fpld snapshot`:
+```
+FPLD_SNAPSHOT=replay:snapshots/2022-12-10 python -m benchmarks.bench_build
+```
+"""
+from statistics import median
+from time import perf_counter
+import fpld
+
+
+REPEATS = 20
+
+
+def main() -> None:
+    fpld.Player.get_all()
+
+    times = []
+    for _ in range(REPEATS):
+        fpld.Player.query_cache().clear()
+        fpld.Player._built = ({}, {})
+
+        start = perf_counter()
+        fpld.Player.get_all()
+        times.append(perf_counter() - start)
+
+    print(f"{len(fpld.Player.get_all())} players")
+    print(f"cold Player.get_all() {median(times) * 1000:>7.2f} ms median of {REPEATS}")
+
+
+if __name__ == "__main__":
+    main()
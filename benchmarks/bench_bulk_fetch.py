@@ -0,0 +1,40 @@
+"""Time taken to download every player's element summary from a local stand-in server,
+one at a time with `from_player_id()` against `from_player_ids()` with a pool of threads.
+
+Run from the repository root:
+```
+python -m benchmarks.bench_bulk_fetch
+```
+"""
+from time import perf_counter
+from fpld.constants import URLS
+from fpld.elements.player import BasePlayerFullDf
+from tests.server import StandInServer
+
+
+NUM_PLAYERS = 700
+SERVER_LATENCY = 0.02  # Seconds per request
+
+
+def main() -> None:
+    body = b'{"fixtures": [], "history": [], "history_past": []}'
+    routes = {f"/element-summary/{i}/": body for i in range(1, NUM_PLAYERS + 1)}
+    player_ids = list(range(1, NUM_PLAYERS + 1))
+
+    with StandInServer(routes) as server:
+        server.response_delay = SERVER_LATENCY
+        URLS["ELEMENT-SUMMARY"] = server.url("/element-summary/{}/")
+
+        start = perf_counter()
+        for player_id in player_ids:
+            BasePlayerFullDf.from_player_id(player_id)
+        print(f"{'serial':<15} {perf_counter() - start:>8.3f}s")
+
+        for concurrency in (4, 8):
+            start = perf_counter()
+            BasePlayerFullDf.from_player_ids(player_ids, concurrency=concurrency, rate=1000)
+            print(f"{f'concurrency={concurrency}':<15} {perf_counter() - start:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
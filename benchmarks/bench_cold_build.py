@@ -0,0 +1,54 @@
+"""Time of queries that build their elements from cold, and which other classes they build.
+
+Elements link to each other, e.g. fixtures to events and teams, and events to players.
+Linked elements are only built when a link is first read, so a query on fixtures
+should not build every player.
+
+Run from the repository root, with a snapshot from `fpld snapshot`:
+```
+FPLD_SNAPSHOT=replay:snapshots/2022-12-10 python -m benchmarks.bench_cold_build
+```
+"""
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable
+import fpld
+
+
+REPEATS = 10
+LINKED_CLASSES = (fpld.Fixture, fpld.Event, fpld.Player, fpld.Team, fpld.Position)
+QUERIES: dict[str, Callable[[], Any]] = {
+    "Fixture.get_all()": fpld.Fixture.get_all,
+    "Event.get_current_gw()": fpld.Event.get_current_gw
+}
+
+
+def make_cold() -> None:
+    """Drop every built element and cached query, keeping the downloaded API data.
+    """
+    for class_ in LINKED_CLASSES:
+        class_.query_cache().clear()
+        class_._built = ({}, {})
+
+
+def built_classes() -> list[str]:
+    return [class_.__name__ for class_ in LINKED_CLASSES if len(class_.__dict__.get("_built", ({}, {}))[1]) > 0]
+
+
+def main() -> None:
+    for class_ in LINKED_CLASSES:
+        class_.get_api()
+
+    for name, query in QUERIES.items():
+        times = []
+        for _ in range(REPEATS):
+            make_cold()
+            start = perf_counter()
+            query()
+            times.append(perf_counter() - start)
+
+        print(f"cold {name:<24} {median(times) * 1000:>8.1f} ms median of {REPEATS}, built {', '.join(built_classes())}")
+
+
+if __name__ == "__main__":
+    main()
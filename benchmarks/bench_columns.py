@@ -0,0 +1,55 @@
+"""Time for whole-table work on every player, a filter, a sort, and a dataframe of numeric and text fields,
+on a group backed by the column store against a group of the same elements that is not.
+
+Elements are built once, columns of the store are built by the first repeat.
+The plain group is made again before each repeat, outside the time, so nothing a call leaves on it,
+e.g. a store made for derived attributes, is used by the next repeat.
+
+Run from the repository root, with a snapshot from `fpld snapshot`:
+```
+FPLD_SNAPSHOT=replay:snapshots/2022-12-10 python -m benchmarks.bench_columns
+```
+"""
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable
+import fpld
+from fpld.elements.element import ElementGroup
+
+
+REPEATS = 20
+DF_FIELDS = ("web_name", "now_cost", "total_points", "minutes", "goals_scored", "assists", "bonus", "status")
+
+
+WORK: list[tuple[str, Callable[[ElementGroup[Any]], Any]]] = [
+    ("filter", lambda players: players.filter(now_cost__between=(45, 80), minutes__gt=900, status="a")),
+    ("sort", lambda players: players.sort("total_points")),
+    ("to_df", lambda players: players.to_df(*DF_FIELDS))
+]
+
+
+def time_call(make_group: Callable[[], ElementGroup[Any]], call: Callable[[ElementGroup[Any]], Any]) -> float:
+    times = []
+    for _ in range(REPEATS):
+        players = make_group()
+        start = perf_counter()
+        call(players)
+        times.append(perf_counter() - start)
+
+    return median(times)
+
+
+def main() -> None:
+    columnar = fpld.Player.get_all()
+    elements = columnar.to_list()
+
+    for name, call in WORK:
+        column_ms = time_call(fpld.Player.get_all, call) * 1000
+        plain_ms = time_call(lambda: ElementGroup(elements), call) * 1000
+        print(f"{name:<7} columns {column_ms:>7.2f} ms   elements {plain_ms:>7.2f} ms")
+
+    print(f"{len(columnar)} players, {columnar.columns().nbytes / 1024:.1f} KiB of columns built")
+
+
+if __name__ == "__main__":
+    main()
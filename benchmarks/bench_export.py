@@ -0,0 +1,49 @@
+"""Time to export every field of every player to a dataframe, and the dtypes it has.
+
+A new group has no column store, so is read from each element, against the row by row
+loop `to_df()` used before columns.
+
+Run from the repository root, with a snapshot from `fpld snapshot`:
+```
+FPLD_SNAPSHOT=replay:snapshots/2022-12-10 python -m benchmarks.bench_export
+```
+"""
+from dataclasses import fields
+from timeit import repeat
+from typing import Any, Callable
+import fpld
+from fpld.elements.element import ElementGroup
+
+
+NUMBER = 5
+
+
+def best_ms(func: Callable[[], Any]) -> float:
+    return min(repeat(func, number=NUMBER, repeat=5)) / NUMBER * 1000
+
+
+def row_loop(elements: list[Any], names: list[str]) -> Any:
+    import pandas as pd
+
+    group = ElementGroup(elements)
+    df_rows = [[getattr(element, attr) for attr in names] for element in group]
+
+    return pd.DataFrame(df_rows, index=list(range(1, len(group) + 1)), columns=names)
+
+
+def main() -> None:
+    players = fpld.Player.get_all()
+    names = [f.name for f in fields(fpld.Player)]
+
+    print(f"{len(players)} players, {len(names)} fields")
+    print(f"every field, columnar       {best_ms(lambda: players.to_df(*names)):>8.2f} ms")
+    print(f"every field, new group      {best_ms(lambda: ElementGroup(players.to_list()).to_df(*names)):>8.2f} ms")
+    print(f"every field, row loop       {best_ms(lambda: row_loop(players.to_list(), names)):>8.2f} ms")
+    print(f"every field, ids for links  {best_ms(lambda: players.to_df(*names, links='id')):>8.2f} ms")
+
+    dtypes = players.to_df(*names, links="id").dtypes.astype(str).value_counts()
+    print("dtypes: " + ", ".join(f"{dtype} {count}" for dtype, count in dtypes.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Time for the queries behind `Team.players`, `Team.players_by_pos`,
+`Fixture.get_all_team_fixtures` and `get_players`, for every team and position,
+and for a screen of range queries, by index against a scan of the column store,
+a compiled scan of the elements and a hand-written loop,
+and for `Player.in_cost_range()` on a group not backed by a column store, against the loop it replaced.
+
+Elements are built once, cached queries and indexes are dropped before each repeat.
+
+Run from the repository root, with a snapshot from `fpld snapshot`:
+```
+FPLD_SNAPSHOT=replay:snapshots/2022-12-10 python -m benchmarks.bench_filter
+```
+"""
+from functools import cache
+from statistics import median
+from time import perf_counter
+from typing import Callable
+import fpld
+from fpld.elements.element import ElementGroup
+
+
+REPEATS = 10
+
+
+def queries() -> None:
+    positions = fpld.Position.get_all()
+
+    for team in fpld.Team.get_all():
+        team.players
+        for position in positions:
+            team.players_by_pos(position)
+        fpld.Fixture.get_all_team_fixtures(team.id)
+
+    fpld.Player.get(element_type=tuple(positions), team=tuple(fpld.Team.get_all()))
+
+
+SCREEN = [
+    {"now_cost__between": (45, 80)},
+    {"now_cost__lt": 55, "total_points__gt": 30},
+    {"form__gt": 5},
+    {"bonus__ge": 10},
+    {"minutes__between": (900, 1800), "element_type": 2},
+    {"status__in": ("i", "d")}
+]
+
+
+def screen_by_index() -> None:
+    get = fpld.Player.get.__wrapped__  # Skip the query cache, keep the indexes
+    for conditions in SCREEN:
+        get(fpld.Player, **conditions)
+
+
+def screen_by_columns() -> None:
+    players = fpld.Player.get_all()
+    for conditions in SCREEN:
+        players.filter(**conditions)
+
+
+@cache
+def plain_players() -> ElementGroup[fpld.Player]:
+    """Every player in a group not backed by a column store, made once, as `get_all()` is for the loop.
+
+    Filters on fields never give a plain group a store, so the group stays plain between repeats.
+    """
+    return ElementGroup(fpld.Player.get_all().to_list())
+
+
+def screen_by_scan() -> None:
+    players = plain_players()
+    for conditions in SCREEN:
+        players.filter(**conditions)
+
+
+def screen_by_loop() -> None:
+    players = fpld.Player.get_all()
+    ElementGroup([p for p in players if 45 <= p.now_cost <= 80])  # Grouped, as `filter()` returns
+    ElementGroup([p for p in players if p.now_cost < 55 and p.total_points > 30])
+    ElementGroup([p for p in players if p.form > 5])
+    ElementGroup([p for p in players if p.bonus >= 10])
+    ElementGroup([p for p in players if 900 <= p.minutes <= 1800 and p.element_type.id == 2])
+    ElementGroup([p for p in players if p.status in ("i", "d")])
+
+
+def cost_ranges_by_filter() -> None:
+    players = ElementGroup(fpld.Player.get_all().to_list())
+    for lower in range(40, 130, 10):
+        fpld.Player.in_cost_range(players, lower=lower, upper=lower + 20)
+        fpld.Player.in_cost_range(players, lower=lower, upper=lower + 20, include_boundaries=False)
+
+
+def cost_ranges_by_loop() -> None:
+    players = ElementGroup(fpld.Player.get_all().to_list())
+    for lower in range(40, 130, 10):
+        for include_boundaries in (True, False):
+            upper = lower + 20
+            players_found = []
+
+            for player in players:  # `in_cost_range()` before filters took operators
+                if (lower <= player.now_cost and include_boundaries) or (lower < player.now_cost):
+                    if (player.now_cost <= upper and include_boundaries) or (player.now_cost < upper):
+                        players_found.append(player)
+
+            ElementGroup(players_found)
+
+
+def time_screen(screen: Callable[[], None]) -> float:
+    screen()  # Build indexes
+    times = []
+    for _ in range(REPEATS):
+        start = perf_counter()
+        screen()
+        times.append(perf_counter() - start)
+
+    return median(times)
+
+
+def main() -> None:
+    fpld.Fixture.get_all()
+
+    times = []
+    for _ in range(REPEATS):
+        for class_ in (fpld.Player, fpld.Fixture):
+            class_.query_cache().clear()
+            class_.get_all()  # Reuses the elements already built
+
+        start = perf_counter()
+        queries()
+        times.append(perf_counter() - start)
+
+    print(f"all team queries {median(times) * 1000:>8.2f} ms median of {REPEATS}")
+
+    screens = (("index", screen_by_index), ("column scan", screen_by_columns), ("compiled scan", screen_by_scan), ("loop", screen_by_loop))
+    for name, screen in screens:
+        print(f"screen by {name:<13} {time_screen(screen) * 1000:>8.2f} ms")
+
+    for name, screen in (("filter", cost_ranges_by_filter), ("loop", cost_ranges_by_loop)):
+        print(f"cost ranges by {name:<8} {time_screen(screen) * 1000:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Time of `ElementGroup.split()` and membership tests on every player and every fixture.
+
+Run from the repository root, with a snapshot from `fpld snapshot`:
+```
+FPLD_SNAPSHOT=replay:snapshots/2022-12-10 python -m benchmarks.bench_group
+```
+"""
+from timeit import repeat
+from typing import Any, Callable
+import fpld
+
+
+NUMBER = 5
+
+
+def best_ms(func: Callable[[], Any]) -> float:
+    return min(repeat(func, number=NUMBER, repeat=5)) / NUMBER * 1000
+
+
+def main() -> None:
+    players = fpld.Player.get_all()
+    fixtures = fpld.Fixture.get_all()
+    plain_players = fpld.ElementGroup(players.to_list())
+    pool = fpld.ElementGroup(players.to_list())
+
+    print(f"{len(players)} players, {len(fixtures)} fixtures")
+    print(f"split players, columnar   {best_ms(lambda: players.split(now_cost__lt=60)):>8.2f} ms")
+    print(f"split players, elements   {best_ms(lambda: plain_players.split(now_cost__lt=60)):>8.2f} ms")
+    print(f"split fixtures            {best_ms(lambda: fixtures.split(finished=True)):>8.2f} ms")
+    print(f"every player in pool      {best_ms(lambda: all(player in pool for player in players)):>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Time for `import fpld` in a fresh interpreter, and the heavy modules it pulls in.
+
+Run from the repository root:
+```
+python -m benchmarks.bench_import
+```
+"""
+import os
+import subprocess
+import sys
+from statistics import median
+
+
+REPEATS = 10
+HEAVY_MODULES = ("pandas", "numpy", "requests", "urllib3", "pulp")
+CODE = f"""
+from time import perf_counter
+import sys
+start = perf_counter()
+import fpld
+print((perf_counter() - start) * 1000, [m for m in {HEAVY_MODULES!r} if m in sys.modules])
+"""
+
+
+def main() -> None:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(["src", os.environ.get("PYTHONPATH", "")]))
+    times = []
+
+    for _ in range(REPEATS):
+        output = subprocess.run(
+            [sys.executable, "-c", CODE], env=env, capture_output=True, text=True, check=True).stdout
+        milliseconds, modules = output.split(" ", 1)
+        times.append(float(milliseconds))
+
+    print(f"import fpld {median(times):>8.1f} ms median of {REPEATS}")
+    print(f"heavy modules loaded {modules.strip()}")
+
+
+if __name__ == "__main__":
+    main()
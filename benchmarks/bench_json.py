@@ -0,0 +1,56 @@
+"""Time and peak memory to parse a recorded bootstrap-static payload,
+by the old text path (`response.text` -> `unicode_escape` -> `json.loads`)
+against parsing straight from bytes with `json` and `orjson`.
+
+Run from the repository root, with a snapshot from `fpld snapshot`:
+```
+python -m benchmarks.bench_json snapshots/2022-12-10
+```
+"""
+import json
+import os
+import sys
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable
+from fpld.util import external
+
+
+REPEATS = 20
+
+
+def old_text_path(content: bytes) -> Any:
+    text = content.decode("utf8")  # `response.text`
+    return json.loads(text.encode("utf8").decode("unicode_escape"))
+
+
+def measure(func: Callable[[bytes], Any], content: bytes) -> tuple[float, float]:
+    start = perf_counter()
+    for _ in range(REPEATS):
+        func(content)
+    seconds = (perf_counter() - start) / REPEATS
+
+    tracemalloc.start()
+    func(content)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return seconds, peak / 2 ** 20
+
+
+def main() -> None:
+    with open(os.path.join(sys.argv[1], "bootstrap-static.json"), "rb") as f:
+        content = f.read()
+
+    paths: dict[str, Callable[[bytes], Any]] = {"old text path": old_text_path, "json bytes": json.loads}
+    if external._fast_loads is not None:
+        paths["orjson bytes"] = external._fast_loads
+
+    print(f"payload {len(content) / 2 ** 20:.2f} MiB")
+    for name, func in paths.items():
+        seconds, peak = measure(func, content)
+        print(f"{name:<15} {seconds * 1000:>8.2f} ms {peak:>8.2f} MiB peak")
+
+
+if __name__ == "__main__":
+    main()
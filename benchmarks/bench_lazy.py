@@ -0,0 +1,50 @@
+"""Time of a scouting query chaining five operations, run one at a time and as one `LazyQuery` plan.
+
+Run from the repository root, with a snapshot from `fpld snapshot`:
+```
+FPLD_SNAPSHOT=replay:snapshots/2022-12-10 python -m benchmarks.bench_lazy
+```
+"""
+from timeit import repeat
+from typing import Any, Callable
+import fpld
+
+
+NUMBER = 50
+TEAMS = tuple(range(1, 11))
+
+
+def best_ms(func: Callable[[], Any]) -> float:
+    return min(repeat(func, number=NUMBER, repeat=5)) / NUMBER * 1000
+
+
+def eager_group() -> Any:
+    return fpld.Player.get(team=TEAMS).filter(element_type=3).filter(now_cost__lt=80) \
+        .sort("form").get_top_n_elements("total_points", 10)
+
+
+def lazy_query() -> Any:
+    return fpld.Player.lazy().filter(team=TEAMS).filter(element_type=3).filter(now_cost__lt=80) \
+        .sort("form").get_top_n_elements("total_points", 10)
+
+
+def eager() -> Any:
+    return eager_group().to_df("web_name", "total_points")
+
+
+def lazy() -> Any:
+    return lazy_query().to_df("web_name", "total_points")
+
+
+def main() -> None:
+    assert eager().equals(lazy())
+
+    print(lazy_query().explain())
+    print(f"group, one operation at a time  {best_ms(eager_group):>8.3f} ms")
+    print(f"group, lazy query               {best_ms(lambda: lazy_query().collect()):>8.3f} ms")
+    print(f"to_df, one operation at a time  {best_ms(eager):>8.3f} ms")
+    print(f"to_df, lazy query               {best_ms(lazy):>8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
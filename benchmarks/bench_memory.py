@@ -0,0 +1,51 @@
+"""Memory held by the elements of each class, in bytes per element.
+
+Each class is built from its own copy of the API data, which is then dropped,
+so what is left is what the elements hold, e.g. strings, dates and `Fixture.stats`.
+This is the memory kept for each season of elements held at once.
+
+Run from the repository root, with a snapshot from `fpld snapshot`:
+```
+FPLD_SNAPSHOT=replay:snapshots/2022-12-10 python -m benchmarks.bench_memory
+```
+"""
+import gc
+import json
+import sys
+import tracemalloc
+from datetime import datetime
+import fpld
+
+
+CLASSES = (fpld.Position, fpld.Team, fpld.Player, fpld.Event, fpld.Fixture)
+
+
+def main() -> None:
+    for class_ in CLASSES:
+        class_.get_all()
+        class_.id_index()  # Linked elements are found by ID while building
+    datetime.strptime("2022", "%Y")  # Imports `_strptime` outside the measurement
+
+    tracemalloc.start()
+    kept = []  # Elements of every class stay alive, so freeing one class is not counted against the next
+
+    for class_ in CLASSES:
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        api_data = json.loads(json.dumps(class_.get_api()))  # Objects not shared with anything else
+
+        elements = [class_.from_dict(elem) for elem in api_data]
+        del api_data
+        gc.collect()
+        held = tracemalloc.get_traced_memory()[0] - before
+        kept.append(elements)
+
+        instance = elements[0]
+        print(f"{class_.__name__:<9} {len(elements):>4} elements {held / len(elements):>8.0f} bytes each   "
+              f"instance {sys.getsizeof(instance):>4} bytes{' + __dict__' if hasattr(instance, '__dict__') else ''}")
+
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Time of `get_players()` sorted by each player's share of their team's goal contributions.
+
+Cached queries are dropped before each repeat, as they would be by new data.
+
+Run from the repository root, with a snapshot from `fpld snapshot`:
+```
+FPLD_SNAPSHOT=replay:snapshots/2022-12-10 python -m benchmarks.bench_percent
+```
+"""
+from timeit import repeat
+from typing import Any, Callable
+import fpld
+from fpld.elements.fplelems import get_players
+
+
+NUMBER = 3
+
+
+def best_ms(func: Callable[[], Any]) -> float:
+    def cold() -> Any:
+        fpld.Player.query_cache().clear()
+        return func()
+
+    return min(repeat(cold, number=NUMBER, repeat=3)) / NUMBER * 1000
+
+
+def main() -> None:
+    print(f"get_players by Percent Position  {best_ms(lambda: get_players(sort_by='Percent Position')):>8.2f} ms")
+    print(f"get_players by Percent Team      {best_ms(lambda: get_players(sort_by='Percent Team')):>8.2f} ms")
+    print(f"percent_pos of every player      {best_ms(lambda: [p.percent_pos for p in fpld.Player.get_all()]):>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
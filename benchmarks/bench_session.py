@@ -0,0 +1,42 @@
+"""Connections opened and time taken to fetch 700 element summaries from a local stand-in server,
+with a new connection per request (`requests.get`) against the shared `FPLSession`.
+
+Run from the repository root:
+```
+python -m benchmarks.bench_session
+```
+"""
+from time import perf_counter
+from typing import Any, Callable
+import requests
+from fpld.util import FPLSession
+from tests.server import StandInServer
+
+
+NUM_PLAYERS = 700
+HANDSHAKE_DELAY = 0.002  # Seconds, a fast TCP + TLS handshake
+
+
+def fetch_all(server: StandInServer, get: Callable[[str], Any]) -> tuple[int, float]:
+    server.connections = 0
+    start = perf_counter()
+
+    for i in range(1, NUM_PLAYERS + 1):
+        get(server.url(f"/element-summary/{i}/"))
+
+    return server.connections, perf_counter() - start
+
+
+def main() -> None:
+    routes = {f"/element-summary/{i}/": b'{"history": [], "history_past": []}' for i in range(1, NUM_PLAYERS + 1)}
+
+    with StandInServer(routes) as server:
+        server.connect_delay = HANDSHAKE_DELAY
+
+        for name, get in (("requests.get", requests.get), ("FPLSession", FPLSession().get)):
+            connections, seconds = fetch_all(server, get)
+            print(f"{name:<15} {connections:>5} connections {seconds:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
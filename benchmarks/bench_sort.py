@@ -0,0 +1,37 @@
+"""Time of leaderboard queries on every player, e.g. the top 10 by total points.
+
+Run from the repository root, with a snapshot from `fpld snapshot`:
+```
+FPLD_SNAPSHOT=replay:snapshots/2022-12-10 python -m benchmarks.bench_sort
+```
+"""
+from timeit import repeat
+from typing import Any, Callable
+import fpld
+
+
+NUMBER = 20
+
+
+def best_ms(func: Callable[[], Any]) -> float:
+    return min(repeat(func, number=NUMBER, repeat=5)) / NUMBER * 1000
+
+
+def main() -> None:
+    players = fpld.Player.get_all()
+    plain = fpld.ElementGroup(players.to_list())
+    midfielders = players.filter(element_type=3)
+
+    print(f"{len(players)} players")
+    print(f"top 10, columnar              {best_ms(lambda: players.get_top_n_elements('total_points', 10)):>8.3f} ms")
+    print(f"top 10, elements              {best_ms(lambda: plain.get_top_n_elements('total_points', 10)):>8.3f} ms")
+    print(f"sort, columnar                {best_ms(lambda: players.sort('total_points')):>8.3f} ms")
+    print(f"sort filtered, columnar       {best_ms(lambda: midfielders.sort('total_points')):>8.3f} ms")
+    print(f"sort 2 keys, columnar         {best_ms(lambda: players.sort('total_points', 'now_cost', reverse=(True, False))):>8.3f} ms")
+    print(f"sort ppm, columnar            {best_ms(lambda: players.sort('ppm')):>8.3f} ms")
+    print(f"filter ppm, columnar          {best_ms(lambda: players.filter(ppm__gt=1)):>8.3f} ms")
+    print(f"sort 2 keys, elements         {best_ms(lambda: plain.sort('total_points', 'now_cost', reverse=(True, False))):>8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
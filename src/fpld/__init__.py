@@ -1,6 +1,17 @@
+from typing import Any
+from importlib import import_module
 from .elements import (Player, Event, Team, Fixture, Position, Label, ElementGroup, get_events, get_fixtures, get_players)
 from .constants import URLS
-from .team import Squad
 from .formation import Formation
 from .fplplayer import FPLPlayer
 from . import predict
+
+
+def __getattr__(name: str) -> Any:
+    # `team` needs PuLP, so it is only imported when first used
+    if name == "team":
+        return import_module(".team", __name__)
+    if name == "Squad":
+        return import_module(".team", __name__).Squad
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,69 @@
+from __future__ import annotations
+from argparse import ArgumentParser
+from typing import Optional, Sequence
+from .constants import URLS
+from .util import API, Snapshot
+from .elements.playerfull import _PlayerFull
+
+
+def snapshot(directory: str, player_ids: Optional[list[int]] = None, *, concurrency: int = 8, rate: float = 20.0) -> int:
+    """Record bootstrap-static, fixtures and every player's element summary to a snapshot directory.
+
+    Parameters
+    ----------
+    directory : str
+        Folder to record the snapshot in.
+    player_ids : Optional[list[int]], optional
+        Players to record element summaries for, by default None (all players)
+    concurrency : int, optional
+        Maximum element summary requests in progress at once, by default 8
+    rate : float, optional
+        Maximum average element summary requests started per second, by default 20.0
+
+    Returns
+    -------
+    int
+        Exit code, 1 if any player could not be recorded.
+    """
+    API.snapshot = Snapshot(directory, "record")
+
+    bootstrap_static = API(URLS["BOOTSTRAP-STATIC"]).data
+    API(URLS["FIXTURES"])
+
+    if player_ids is None:
+        player_ids = [player["id"] for player in bootstrap_static["elements"]]
+
+    summaries = _PlayerFull.get_api_bulk(player_ids, concurrency=concurrency, rate=rate)
+    failed: dict[int, Exception] = {}
+
+    for player_id, summary in summaries.items():
+        if isinstance(summary, Exception):
+            failed[player_id] = summary
+        elif "history" not in summary:  # E.g. player ID does not exist
+            failed[player_id] = ValueError("No player history in response.")
+
+    print(f"Recorded {len(summaries) - len(failed)} of {len(summaries)} players to '{directory}'.")
+    for player_id, e in failed.items():
+        print(f"Player {player_id} failed: {e!r}")
+
+    return 1 if failed else 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = ArgumentParser(prog="fpld", description="Python interface for Fantasy Premier League API")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    snapshot_parser = commands.add_parser("snapshot", help="record the API to a directory, for use offline")
+    snapshot_parser.add_argument("directory", help="folder to record the snapshot in")
+    snapshot_parser.add_argument(
+        "--players", type=lambda s: [int(id_) for id_ in s.split(",")], default=None,
+        help="comma separated player IDs, by default all players")
+    snapshot_parser.add_argument("--concurrency", type=int, default=8)
+    snapshot_parser.add_argument("--rate", type=float, default=20.0, help="requests per second")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "snapshot":
+        return snapshot(args.directory, args.players, concurrency=args.concurrency, rate=args.rate)
+
+    return 0
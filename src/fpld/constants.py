@@ -6,6 +6,7 @@ URLS = {
     "API": API_URL_STEM,
     "BOOTSTRAP-STATIC": API_URL_STEM + "bootstrap-static/",
     "ELEMENT-SUMMARY": API_URL_STEM + "element-summary/{}/",
+    "EVENT-LIVE": API_URL_STEM + "event/{}/live/",
     "FIXTURES": API_URL_STEM + "fixtures/"
 }
 
@@ -0,0 +1,663 @@
+from __future__ import annotations
+from dataclasses import dataclass, fields, is_dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Sequence
+import numpy as np
+from .query import COMPARISONS, Condition, comparable
+from .link import LinkedField
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass(frozen=True)
+class Column:
+    """Values of one field for every element in a `ColumnStore`.
+
+    `kind` is one of:
+    - 'number', ints and floats in a NumPy array. Ints with missing values are stored as floats, with NaN.
+    - 'bool', a NumPy bool array, with no missing values.
+    - 'string', dictionary encoded, `values` are codes into the sorted `categories`, -1 if missing.
+    - 'object', anything else, e.g. dates or lists, in a NumPy object array.
+
+    Linked elements are stored by unique ID.
+    """
+    kind: str
+    values: np.ndarray
+    nulls: Optional[np.ndarray] = None  # True where the value is None, None if there are no missing values
+    categories: tuple[str, ...] = ()
+    linked: bool = False
+
+    @classmethod
+    def from_values(cls, values: list[Any], linked: bool = False) -> Column:
+        """Store `values` in the smallest kind that holds all of them.
+
+        Parameters
+        ----------
+        values : list[Any]
+            One value per element, elements already swapped for their unique ID.
+        linked : bool, optional
+            Whether the values came from linked elements, by default False
+
+        Returns
+        -------
+        Column
+            New column.
+        """
+        types = {type(value) for value in values}
+        nulls = None
+
+        if type(None) in types:
+            types.discard(type(None))
+            nulls = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+
+        if len(types) == 0:
+            return cls.__object_column(values, nulls, linked)
+
+        if types == {bool} and nulls is None:
+            return cls("bool", np.array(values, dtype=bool), None, (), linked)
+
+        if types <= {int, float}:
+            try:
+                if types == {int} and nulls is None:
+                    array = np.array(values, dtype=np.int64)
+                else:
+                    array = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+            except OverflowError:
+                return cls.__object_column(values, nulls, linked)
+
+            return cls("number", array, nulls, (), linked)
+
+        if types == {str}:
+            categories = sorted({value for value in values if value is not None})
+            code_of = {category: code for code, category in enumerate(categories)}
+            codes = np.fromiter((-1 if value is None else code_of[value] for value in values),
+                                dtype=np.int32, count=len(values))
+
+            return cls("string", codes, nulls, tuple(categories), linked)
+
+        return cls.__object_column(values, nulls, linked)
+
+    @classmethod
+    def __object_column(cls, values: list[Any], nulls: Optional[np.ndarray], linked: bool) -> Column:
+        array = np.empty(len(values), dtype=object)
+        for i, value in enumerate(values):  # One at a time, so lists are not unpacked into a 2D array
+            array[i] = value
+
+        return cls("object", array, nulls, (), linked)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the arrays of the column.
+
+        Returns
+        -------
+        int
+            Bytes, not counting the objects of an 'object' column or the strings of the categories.
+        """
+        return self.values.nbytes + (0 if self.nulls is None else self.nulls.nbytes)
+
+    def take(self, rows: np.ndarray) -> Column:
+        """Column of the values at `rows`, of the same kind.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            Rows wanted, in order.
+
+        Returns
+        -------
+        Column
+            New column.
+        """
+        nulls = None if self.nulls is None else self.nulls[rows]
+
+        return Column(self.kind, self.values[rows], None if nulls is None or not nulls.any() else nulls,
+                      self.categories, self.linked)
+
+    def decoded(self) -> np.ndarray:
+        """Values of the column, with strings decoded.
+
+        Returns
+        -------
+        np.ndarray
+            Numeric array for 'number' and 'bool', object array otherwise.
+        """
+        if self.kind == "string":
+            lookup = np.array(self.categories + (None,), dtype=object)  # Code -1 is the last item, None
+
+            decoded: np.ndarray = lookup[self.values]
+            return decoded
+
+        return self.values
+
+    def mask(self, condition: Condition) -> Optional[np.ndarray]:
+        """Which values meet `condition`, the same as `ElementGroup.filter()` would find.
+
+        Parameters
+        ----------
+        condition : Condition
+            Condition on this column.
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            Bool array, None if the condition compares values that cannot be compared.
+        """
+        try:
+            if self.kind in ("number", "bool"):
+                return self.__number_mask(condition)
+            if self.kind == "string":
+                table = np.array([condition.test(category) for category in self.categories] + [condition.test(None)], dtype=bool)
+                mask: np.ndarray = table[self.values]
+                return mask
+
+            return np.fromiter((condition.test(value) for value in self.values), dtype=bool, count=len(self.values))
+        except (TypeError, OverflowError):
+            return None
+
+    def sort_key(self) -> Optional[np.ndarray]:
+        """Array that sorts in the same order as the values.
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            Codes for strings, as the categories are sorted. None if there are missing values,
+            or the values are objects.
+        """
+        if self.nulls is not None or self.kind == "object":
+            return None
+        if self.kind == "bool":
+            return self.values.astype(np.int8)
+
+        return self.values
+
+    def __number_mask(self, condition: Condition) -> np.ndarray:
+        values, nulls = self.values, self.nulls
+
+        if condition.operator == "in":
+            numbers = [value for value in condition.values if _is_number(value)]
+            mask = np.isin(values, numbers) if numbers else np.zeros(len(values), dtype=bool)
+
+            if nulls is not None and None in condition.values:
+                mask |= nulls
+            return mask
+
+        if condition.operator == "ne":
+            other = condition.values[0]
+
+            if other is None:
+                return np.ones(len(values), dtype=bool) if nulls is None else ~nulls
+            if not _is_number(other):
+                return np.ones(len(values), dtype=bool)  # A number is never equal to anything else
+
+            not_equal: np.ndarray = values != other  # NaN, so None, is never equal
+            return not_equal
+
+        if not all(_is_number(value) for value in condition.values):
+            raise TypeError(f"Cannot compare numbers with {condition.values}.")
+
+        if condition.operator == "between":
+            lower, upper = condition.values
+            between: np.ndarray = (values >= lower) & (values <= upper)  # False for NaN
+            return between
+
+        compared: np.ndarray = COMPARISONS[condition.operator](values, condition.values[0])
+        return compared
+
+
+_REDUCTIONS: dict[str, Any] = {"sum": np.add, "mean": np.add, "count": None, "min": np.minimum, "max": np.maximum}
+_SCALAR_TYPES = frozenset({int, float, str, bool, type(None)})
+
+
+def _in_store_order(rows: np.ndarray) -> bool:
+    """Whether `rows` are in ascending order, e.g. from `ColumnStore.select()`.
+    """
+    return len(rows) < 2 or bool(np.all(rows[1:] > rows[:-1]))
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and value == value  # NaN is never equal in a query
+
+
+class ColumnStore:
+    """Struct-of-arrays copy of a list of elements, one NumPy array per field.
+
+    Each column is built the first time it is used, so only fields that are queried are stored.
+    Numbers are held in numeric arrays, and strings are dictionary encoded,
+    so filters and sorts over every element are vectorised.
+    Elements are kept, an `ElementGroup` backed by a store only holds the rows it contains.
+    A store is made once per data generation by `get_all()`, so the orders it keeps from `order()` stay valid.
+
+    Example
+    -------
+    ```
+    > store = Player.get_all().columns()
+    > store.column("total_points").values
+    array([ 47,  72,   0, ...])
+    ```
+    """
+
+    def __init__(self, elements: list[Any]):
+        self.__elements = elements
+        self.__columns: dict[str, Optional[Column]] = {}
+        self.__orders: dict[tuple[tuple[str, ...], tuple[bool, ...]], np.ndarray] = {}  # Every row, by fields and directions
+
+        if len(elements) > 0 and is_dataclass(elements[0]):
+            self.__fields = tuple(f.name for f in fields(elements[0]))
+        else:
+            self.__fields = ()
+        self.__field_names = frozenset(self.__fields)
+
+    def __len__(self) -> int:
+        return len(self.__elements)
+
+    def __str__(self) -> str:
+        return f"ColumnStore of {len(self)} elements, {len(self.built)} of {len(self.__field_names)} columns built."
+
+    @property
+    def elements(self) -> list[Any]:
+        """Elements the columns are made from, in row order.
+
+        Returns
+        -------
+        list[Any]
+            Elements.
+        """
+        return self.__elements
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Fields of the elements, in the order declared.
+
+        Returns
+        -------
+        tuple[str, ...]
+            Field names, empty if there are no elements.
+        """
+        return self.__fields
+
+    @property
+    def built(self) -> list[str]:
+        """Fields and derived attributes with a column built so far.
+
+        Returns
+        -------
+        list[str]
+            Field names.
+        """
+        return [name for name, column in self.__columns.items() if column is not None]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the arrays of every column built so far.
+
+        Returns
+        -------
+        int
+            Bytes.
+        """
+        return sum(column.nbytes for column in self.__columns.values() if column is not None)
+
+    def column(self, name: str) -> Optional[Column]:
+        """Column of a field or derived attribute, built on first use.
+
+        Derived attributes, see `_Element.derive()`, are computed over every element of `get_all()`,
+        and taken from its store by unique ID for other stores.
+
+        Parameters
+        ----------
+        name : str
+            Field of the elements, e.g. 'now_cost', or derived attribute, e.g. 'ppm'.
+
+        Returns
+        -------
+        Optional[Column]
+            None if `name` is neither, e.g. a property.
+            None for a derived attribute, if an element is not in `get_all()`.
+
+        Raises
+        ------
+        AttributeError
+            If a derived attribute depends on an attribute that does not exist for the elements.
+        ValueError
+            If a derived attribute does not give one value per element.
+        """
+        if name not in self.__columns:
+            if name in self.__field_names:
+                self.__columns[name] = self.__build(name)
+            else:
+                self.__columns[name] = self.__derive(name)
+
+        return self.__columns[name]
+
+    def select(self, conditions: Iterable[Condition], func: Callable[[Iterable[bool]], bool],
+               rows: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Rows meeting all (or any) of the conditions, in order.
+
+        Parameters
+        ----------
+        conditions : Iterable[Condition]
+            Conditions to test.
+        func : Callable[[Iterable[bool]], bool]
+            `all` or `any`.
+        rows : Optional[np.ndarray], optional
+            Rows to select from, by default None (every row)
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            Selected rows. None if a condition is not on a field, or cannot be vectorised.
+        """
+        masks = []
+
+        for condition in conditions:
+            column = self.column(condition.attr)
+            mask = None if column is None else column.mask(condition)
+
+            if mask is None:
+                return None
+            masks.append(mask)
+
+        if len(masks) == 0:
+            return None
+
+        combined = np.logical_and.reduce(masks) if func is all else np.logical_or.reduce(masks)
+
+        if rows is None:
+            return np.flatnonzero(combined)
+
+        selected: np.ndarray = rows[combined[rows]]
+        return selected
+
+    def order(self, names: Sequence[str], reverse: Sequence[bool],
+              rows: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Rows sorted by one or more fields, equal values keep their order, like `sorted()`.
+
+        The order of every row is kept for each set of fields and directions, and reused for rows
+        in store order, e.g. from `filter()`, so repeated sorts of the same data only select rows.
+
+        Parameters
+        ----------
+        names : Sequence[str]
+            Fields to sort by, the first field first, then the next for equal values, and so on.
+        reverse : Sequence[bool]
+            True for descending order, one per field.
+        rows : Optional[np.ndarray], optional
+            Rows to sort, by default None (every row)
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            Sorted rows. None if a field has no sortable column.
+        """
+        names, reverse = tuple(names), tuple(reverse)
+
+        if rows is not None and not _in_store_order(rows):
+            keys = self.__sort_keys(names, reverse)
+
+            if keys is None:
+                return None
+
+            ordered: np.ndarray = rows[np.lexsort([key[rows] for key in reversed(keys)])]  # Last key sorts first
+            return ordered
+
+        every_row = self.__orders.get((names, reverse))
+
+        if every_row is None:
+            keys = self.__sort_keys(names, reverse)
+
+            if keys is None:
+                return None
+
+            every_row = np.lexsort(keys[::-1])
+            self.__orders[(names, reverse)] = every_row
+
+        if rows is None:
+            return every_row
+
+        in_rows = np.zeros(len(self), dtype=bool)
+        in_rows[rows] = True
+
+        selected: np.ndarray = every_row[in_rows[every_row]]
+        return selected
+
+    def top(self, name: str, n: int, *, reverse: bool = False, rows: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """First `n` rows of `order()` by one field, found by a partial sort, without sorting every row.
+
+        Parameters
+        ----------
+        name : str
+            Field to sort by.
+        n : int
+            Number of rows.
+        reverse : bool, optional
+            True for the highest values, by default False
+        rows : Optional[np.ndarray], optional
+            Rows to choose from, by default None (every row)
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            At most `n` rows, in order. None if the field has no sortable column.
+        """
+        every_row = self.__orders.get(((name,), (reverse,)))
+
+        if every_row is not None and rows is None:
+            return every_row[:max(n, 0)]
+
+        keys = self.__sort_keys((name,), (reverse,))
+
+        if keys is None:
+            return None
+        if rows is None:
+            rows = np.arange(len(self))
+        if n <= 0:
+            return rows[:0]
+
+        row_keys = keys[0][rows]
+
+        if n < len(rows):
+            nth = np.partition(row_keys, n - 1)[n - 1]
+            candidates = np.flatnonzero(row_keys <= nth)  # Every row that can be in the first `n`, in order
+        else:
+            candidates = np.arange(len(rows))
+
+        first: np.ndarray = rows[candidates[np.argsort(row_keys[candidates], kind="stable")[:n]]]
+        return first
+
+    def __sort_keys(self, names: tuple[str, ...], reverse: tuple[bool, ...]) -> Optional[list[np.ndarray]]:
+        """Array per field that sorts in ascending order of the wanted direction, None if a field cannot be sorted.
+        """
+        keys = []
+
+        for name, descending in zip(names, reverse):
+            column = self.column(name)
+            key = None if column is None else column.sort_key()
+
+            if key is None:
+                return None
+            keys.append(-key if descending else key)
+
+        return keys
+
+    def aggregate(self, by: Sequence[str], attr_to_func: dict[str, str], rows: np.ndarray,
+                  links: str = "element") -> Optional[pd.DataFrame]:
+        """Reduce fields for each group of rows with the same values of `by`, see `ElementGroup.aggregate()`.
+
+        Rows are sorted by group once, and every field is reduced with `np.ufunc.reduceat()`.
+
+        Parameters
+        ----------
+        by : Sequence[str]
+            Fields to group rows by.
+        attr_to_func : dict[str, str]
+            Field to reduce, to 'sum', 'mean', 'count', 'min' or 'max'.
+        rows : np.ndarray
+            Rows to group.
+        links : str, optional
+            Linked elements in `by` as 'element', 'id' or 'category', see `ElementGroup.to_df()`, by default "element"
+
+        Returns
+        -------
+        Optional[pd.DataFrame]
+            One row per group, in order of the values of `by`. None if a field has missing values or is not a number,
+            or a reduction is not one of the above.
+        """
+        import pandas as pd
+
+        if len(rows) == 0 or any(func not in _REDUCTIONS for func in attr_to_func.values()):
+            return None
+
+        key_columns = [self.column(name) for name in by]
+        value_columns = {attr: self.column(attr) for attr in attr_to_func}
+        keys = [None if column is None else column.sort_key() for column in key_columns]
+
+        if any(key is None for key in keys) or \
+                any(column is None or column.kind not in ("number", "bool") or column.nulls is not None
+                    for column in value_columns.values()):
+            return None
+
+        codes, sizes = [], []
+        for key in keys:
+            uniques, inverse = np.unique(np.asarray(key)[rows], return_inverse=True)
+            codes.append(inverse.ravel())
+            sizes.append(len(uniques))
+
+        group = np.ravel_multi_index(codes, sizes) if len(codes) > 1 else codes[0]
+        order = np.argsort(group, kind="stable")
+        sorted_group = group[order]
+        starts = np.flatnonzero(np.concatenate([[True], sorted_group[1:] != sorted_group[:-1]]))
+        counts = np.diff(np.append(starts, len(rows)))
+
+        data = {}
+        for attr, func in attr_to_func.items():
+            values = value_columns[attr].values[rows[order]]  # type: ignore[union-attr]
+
+            if func == "count":
+                data[attr] = counts
+            elif func in ("sum", "mean"):
+                totals = np.add.reduceat(values.astype(np.int64) if values.dtype == bool else values, starts)
+                data[attr] = totals if func == "sum" else totals / counts
+            else:
+                data[attr] = _REDUCTIONS[func].reduceat(values, starts)
+
+        first_rows = rows[order[starts]]
+        labels = [self.export(name, first_rows, links) for name in by]
+
+        if len(by) == 1:
+            index = pd.Index(labels[0], name=by[0])
+        else:
+            index = pd.MultiIndex.from_arrays(labels, names=list(by))
+
+        return pd.DataFrame(data, index=index)
+
+    def export(self, name: str, rows: np.ndarray, links: str = "element") -> Any:
+        """Values of an attribute for a column of a dataframe, typed from the column where there is one.
+
+        Parameters
+        ----------
+        name : str
+            Attribute of the elements, read from each element if it is not a field, e.g. a property.
+        rows : np.ndarray
+            Rows wanted, in order.
+        links : str, optional
+            Linked elements as 'element', 'id' or 'category', see `ElementGroup.to_df()`, by default "element"
+
+        Returns
+        -------
+        Any
+            NumPy array, pandas array, or list of values.
+
+        Raises
+        ------
+        AttributeError
+            If the attribute does not exist for the elements.
+        """
+        column = self.column(name)
+
+        if column is None or (column.linked and links == "element"):
+            return [getattr(self.__elements[row], name) for row in rows.tolist()]
+        if column.linked and column.kind == "number":
+            return self.__export_links(name, column, rows, links)
+        if column.kind == "object":
+            return column.values[rows].tolist()  # Left to pandas to infer, e.g. datetimes
+
+        return column.decoded()[rows]
+
+    def __export_links(self, name: str, column: Column, rows: np.ndarray, links: str) -> Any:
+        """Unique IDs of linked elements, as integers, or a categorical of their names.
+        """
+        import pandas as pd
+
+        ids = column.values[rows]
+        nulls = np.zeros(len(rows), dtype=bool) if column.nulls is None else column.nulls[rows]
+        codes = np.where(nulls, 0, ids).astype(np.int64)
+
+        if links == "id":
+            return codes if column.nulls is None else pd.arrays.IntegerArray(codes, nulls)
+
+        unique_ids, first = np.unique(codes[~nulls], return_index=True)
+        present = rows[~nulls]
+        labels = [str(getattr(self.__elements[row], name)) for row in present[first].tolist()]  # Finds one element per ID
+        categories = sorted(set(labels))  # Elements with the same name share a category
+        code_of = {label: code for code, label in enumerate(categories)}
+        label_codes = np.array([code_of[label] for label in labels], dtype=np.int64)
+
+        category_codes = np.full(len(rows), -1, dtype=np.int64)
+        category_codes[~nulls] = label_codes[np.searchsorted(unique_ids, codes[~nulls])]
+
+        return pd.Categorical.from_codes(category_codes, categories)
+
+    def __derive(self, name: str) -> Optional[Column]:
+        if len(self.__elements) == 0:
+            return None
+
+        element_class = type(self.__elements[0])
+        derived_attributes: Callable[[], dict[str, Any]] = getattr(element_class, "derived_attributes", dict)
+        derived = derived_attributes().get(name)
+
+        if derived is None:
+            return None
+
+        every_element: ColumnStore = element_class.get_all().columns()
+
+        if every_element is not self:
+            index = element_class.attr_index("unique_id")
+            rows = [index.get(elem.unique_id, (None,))[0] for elem in self.__elements]
+            column = every_element.column(name)
+
+            if column is None or None in rows:
+                return None
+            return column.take(np.array(rows, dtype=np.intp))
+
+        arrays = []
+        for dependency in derived.depends_on:
+            column = self.column(dependency)
+
+            if column is not None:
+                arrays.append(column.decoded())
+            else:  # A property
+                arrays.append(np.array([getattr(elem, dependency) for elem in self.__elements]))
+
+        values = np.asarray(derived.func(*arrays))
+
+        if values.shape != (len(self),):
+            raise ValueError(f"'{name}' must give one value per element, not an array of shape {values.shape}.")
+
+        return Column.from_values(values.tolist())
+
+    def __build(self, name: str) -> Column:
+        linked_field = getattr(type(self.__elements[0]), name, None)
+
+        if isinstance(linked_field, LinkedField):  # IDs, without finding the linked elements
+            return Column.from_values([linked_field.linked_id(elem) for elem in self.__elements], True)
+
+        values = [getattr(elem, name) for elem in self.__elements]
+
+        if {type(value) for value in values} <= _SCALAR_TYPES:  # Cannot hold an element
+            return Column.from_values(values)
+
+        compared = [comparable(value) for value in values]
+        linked = any(a is not b for a, b in zip(values, compared))
+
+        return Column.from_values(compared, linked)
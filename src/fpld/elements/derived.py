@@ -0,0 +1,24 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class Derived:
+    """Attribute computed from other attributes, for every element at once, see `_Element.derive()`.
+
+    `func` is given one NumPy array per name in `depends_on`, in the same order, holding that attribute
+    for every element in `get_all()`, and returns one value per element.
+    Arrays are read from the elements' `ColumnStore`, so linked elements are given as unique IDs,
+    and may be other derived attributes.
+
+    Example
+    -------
+    ```
+    > Player.derive("points_per_game", ("total_points", "starts"), lambda points, starts: points / np.maximum(starts, 1))
+    > Player.get_all().top_n("points_per_game", 5)
+    ```
+    """
+    name: str
+    depends_on: tuple[str, ...]
+    func: Callable[..., Any]
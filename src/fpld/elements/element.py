@@ -1,24 +1,105 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, Iterator, Optional, SupportsIndex, Type, TypeVar, Generic, Union, overload, Callable
-from dataclasses import fields
-from ..util import all_attributes_present, all_field_names, Percentile
-from functools import cache
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Sequence, SupportsIndex, Type, TypeVar, Generic, Union, overload, Callable
+from dataclasses import fields, is_dataclass
+from ..util import all_field_names, Percentile, BOOTSTRAP_STATIC, QueryCache
+from ..constants import URLS
+from functools import cache, wraps
 from random import choice, sample
-import pandas as pd
+from operator import attrgetter, itemgetter
+from heapq import nlargest, nsmallest
+from .query import Condition, compile_predicate, filter_for, parse_conditions, comparable, field_ids
+from .loader import Loader, compile_loader
+from .link import LinkedField
+from .derived import Derived
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    from .columns import ColumnStore
+    from .lazy import LazyQuery
 
 
 element = TypeVar("element", bound="_Element[Any]")  # generic type of `Element`
+query = TypeVar("query", bound=Callable[..., Any])
+
+
+def generation_cache(func: query) -> query:
+    """Cache a classmethod's results in the class's `query_cache()`, like `functools.cache`,
+    but bounded, and dropping every result when the class's `data_generation()` changes.
+
+    Parameters
+    ----------
+    func : query
+        Classmethod to cache, arguments must be hashable.
+
+    Returns
+    -------
+    query
+        Cached classmethod.
+    """
+    return _cached(func, pinned=False)
+
+
+def generation_index(func: query) -> query:
+    """Cache a classmethod's results in the class's `query_cache()` until the class's `data_generation()` changes,
+    never evicted by other results, see `generation_cache()`.
+
+    For the indexes other queries are answered from, so they are built once per generation
+    however many different queries are cached.
+
+    Parameters
+    ----------
+    func : query
+        Classmethod to cache, arguments must be hashable.
+
+    Returns
+    -------
+    query
+        Cached classmethod.
+    """
+    return _cached(func, pinned=True)
+
+
+def _cached(func: query, pinned: bool) -> query:
+    @wraps(func)
+    def wrapper(cls: Any, *args: Any, **kwargs: Any) -> Any:
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        cache = cls.query_cache()
+        found, result = cache.lookup(key, cls.data_generation())
+
+        if found:
+            return result
+
+        result = func(cls, *args, **kwargs)
+        # Data may have been downloaded for the first time during `func`, so store against the latest generation.
+        cache.store(key, result, cls.data_generation(), pinned)
+
+        return result
+
+    return wrapper  # type: ignore[return-value]
 
 
 class _Element(ABC, Generic[element]):
     """Template class for an FPL element.
 
     E.g. Players, Teams, Fixtures
+
+    Elements are dataclasses with `slots=True`, so have no `__dict__`.
+    `slots=True` creates a new class, so their methods call `super()` with explicit arguments.
     """
+    __slots__ = ()
 
     UNIQUE_ID_COL: str = "id"
-    _api = None
+    _api: Optional[list[dict[str, Any]]] = None
+    _api_version: int = 0  # Version of `BOOTSTRAP_STATIC` used to create `_api`
+    _generation: int = 0  # Increased each time `_api` is refreshed
+    QUERY_CACHE_SIZE: int = 512  # Most query results kept per class, not counting indexes, see `generation_index()`
+    QUERY_CACHE_TTL: Optional[float] = None  # Seconds a query result is used for, None for as long as the data
+    _query_cache: Optional[QueryCache] = None  # Results of `get()`, `get_all()` and indexes
+    _built: tuple[dict[Any, dict[str, Any]], dict[Any, Any]] = ({}, {})  # API data and elements by ID, last `get_all()`
+    _changed_ids: frozenset[Any] = frozenset()  # IDs rebuilt by the last `get_all()`
+    _derived: Optional[dict[str, Derived]] = None  # Attributes registered on the class by `derive()`
     _ATTR_FOR_STR: str = "name"
 
     @classmethod
@@ -117,31 +198,67 @@ class _Element(ABC, Generic[element]):
         Returns
         -------
         element
-            Object based on attributes and values from `new_instance`.
+            Object based on attributes and values from `new_instance`, see `from_dicts()`.
 
         Raises
         ------
         KeyError
             If `new_instance` is missing attributes from class.
         """
-        class_fields = fields(cls)  # `cls` must be a dataclass.
-        field_names = {f.name for f in class_fields}
+        elem: element = cls.from_dicts([new_instance])[0]  # type: ignore[attr-defined]
 
-        if all_attributes_present(cls, new_instance):
-            required_attrs = {attr: new_instance[attr]
-                              for attr in field_names}
-            edited_attrs = cls.__pre_init__(required_attrs)
-            return cls(**edited_attrs)
+        return elem
 
-        raise KeyError(
-            f"Missing: {field_names.difference(set(new_instance.keys()))}")
+    @classmethod
+    def from_dicts(cls, api_data: list[dict[str, Any]]) -> list[element]:
+        """Converts dictionaries of attributes to objects of the class, in one pass.
+
+        Fields declared as `float` are converted from strings, as the API sends some numbers as strings,
+        e.g. 'selected_by_percent', and strings are interned, so repeated values share one object.
+        Fields in `linked_fields()` keep the ID from the API, and find the element with that ID when first read.
+
+        Parameters
+        ----------
+        api_data : list[dict[str, Any]]
+            Attributes of each new object.
+
+        Returns
+        -------
+        list[element]
+            One object per dictionary, in order.
+
+        Raises
+        ------
+        KeyError
+            If a dictionary is missing attributes from class.
+        """
+        return cls.loader()(api_data)
 
     @classmethod
     @cache
+    def loader(cls) -> Loader:
+        """Function building objects of the class from API data, generated once per class.
+
+        Returns
+        -------
+        Loader
+            Used by `from_dicts()`.
+        """
+        cls.linked_fields()  # Installed before any element holds an ID
+        overrides_pre_init = cls.__pre_init__.__func__ is not _Element.__pre_init__.__func__  # type: ignore[attr-defined]
+
+        return compile_loader(cls, cls.__pre_init__ if overrides_pre_init else None)
+
+    @classmethod
+    @generation_cache
     def get(cls, *, method_: str = "all", **attr_to_value: Union[Any, Iterable[Any]]) -> ElementGroup[element]:
         """Gets a group of elements based on filters and conditions passed.
 
-        Conditions passed by `attr_to_value`. E.g. `web_name="Spurs"`
+        Conditions passed by `attr_to_value`. E.g. `web_name="Spurs"`, or with an operator,
+        `now_cost__between=(45, 80)`, see `ElementGroup.filter()`.
+
+        Answered from the indexes in `attr_index()` and `sorted_index()` where possible,
+        rather than checking every element.
 
         Parameters
         ----------
@@ -153,24 +270,328 @@ class _Element(ABC, Generic[element]):
         ElementGroup[element]
             All elements that satisfy the filters passed, may also be empty.
         """
+        return cls.__where(parse_conditions(attr_to_value), method_)
+
+    @classmethod
+    @generation_cache
+    def where(cls, conditions: tuple[Condition, ...], *, method_: str = "all") -> ElementGroup[element]:
+        """Same as `get()`, with conditions already parsed, see `Condition.parse()`.
+
+        Parameters
+        ----------
+        conditions : tuple[Condition, ...]
+            Conditions to test, may be on the same attribute more than once.
+        method_ : str, optional
+            "all" if all conditions must be met, "or" for any condition to be met, by default "all"
+
+        Returns
+        -------
+        ElementGroup[element]
+            All elements that satisfy the conditions, may also be empty.
+        """
+        return cls.__where(conditions, method_)
+
+    @classmethod
+    def __where(cls, conditions: Sequence[Condition], method_: str) -> ElementGroup[element]:
         all_elems = cls.get_all()
+        func = _method_choice(method_)
+        positions_by_condition = [cls.__condition_positions(condition) for condition in conditions]
+
+        if len(conditions) == 0 or any(positions is None for positions in positions_by_condition):
+            return all_elems.where(conditions, method_=method_)
 
-        return all_elems.filter(method_=method_, **attr_to_value)
+        position_sets = [positions for positions in positions_by_condition if positions is not None]
+
+        if func is all:
+            found = set.intersection(*position_sets)
+        else:
+            found = set.union(*position_sets)
+
+        return all_elems.take(sorted(found))
 
     @classmethod
-    @cache
+    def __condition_positions(cls, condition: Condition) -> Optional[set[int]]:
+        """Positions in `get_all()` of elements meeting `condition`, found from an index.
+
+        None if there is no index that can answer the condition.
+        """
+        if condition.attr in cls.derived_attributes():  # Tested on its column instead
+            return None
+
+        if condition.operator in ("in", "ne"):
+            index = cls.attr_index(condition.attr)
+
+            if index is None:
+                return None
+
+            positions: set[int] = set().union(*(index.get(value, ()) for value in condition.values))
+
+            if condition.operator == "ne":
+                positions = set(range(len(cls.get_all()))) - positions
+
+            return positions
+
+        sorted_index = cls.sorted_index(condition.attr)
+
+        if sorted_index is None:
+            return None
+
+        try:
+            return set(condition.positions(*sorted_index))
+        except TypeError:  # Values cannot be compared with the query
+            return None
+
+    @classmethod
+    @generation_index
+    def attr_index(cls, attr: str) -> Optional[dict[Any, list[int]]]:
+        """Inverted index of an attribute, built on first use and once per data generation.
+
+        Used by `get()` to answer queries without checking every element.
+
+        Parameters
+        ----------
+        attr : str
+            Attribute to index, e.g. 'team'. Linked elements are indexed by unique ID.
+
+        Returns
+        -------
+        Optional[dict[Any, list[int]]]
+            Value to positions in `get_all()` of elements with that value.
+            None if the attribute has values that cannot be hashed, e.g. lists.
+
+        Raises
+        ------
+        AttributeError
+            If the attribute does not exist for the elements.
+        """
+        index: dict[Any, list[int]] = {}
+
+        for position, elem in enumerate(cls.get_all()):
+            value = getattr(elem, attr)
+
+            if isinstance(value, _Element):
+                value = value.unique_id
+
+            try:
+                index.setdefault(value, []).append(position)
+            except TypeError:  # Unhashable
+                return None
+
+        return index
+
+    @classmethod
+    @generation_index
+    def sorted_index(cls, attr: str) -> Optional[tuple[list[Any], list[int]]]:
+        """Values of an attribute in ascending order, built on first use and once per data generation.
+
+        Used by `get()` to answer range queries, e.g. `now_cost__between=(45, 80)`, by binary search.
+
+        Parameters
+        ----------
+        attr : str
+            Attribute to sort by, e.g. 'now_cost'. None values are left out.
+
+        Returns
+        -------
+        Optional[tuple[list[Any], list[int]]]
+            Sorted values, and the position in `get_all()` of the element each value came from.
+            None if the values cannot be sorted.
+
+        Raises
+        ------
+        AttributeError
+            If the attribute does not exist for the elements.
+        """
+        pairs = [(comparable(getattr(elem, attr)), position) for position, elem in enumerate(cls.get_all())]
+        pairs = [pair for pair in pairs if pair[0] is not None]
+
+        try:
+            pairs.sort(key=itemgetter(0))
+        except TypeError:
+            return None
+
+        return [value for value, _ in pairs], [position for _, position in pairs]
+
+    @classmethod
+    def lazy(cls) -> LazyQuery[element]:
+        """Query on every element, run as one plan when the result is needed, see `LazyQuery`.
+
+        Filters before any `head()` or `top_n()` are answered from the indexes, like `get()`.
+
+        Returns
+        -------
+        LazyQuery[element]
+            Query with no steps.
+        """
+        from .lazy import LazyQuery
+
+        return LazyQuery[element](cls.get_all(), cls)
+
+    @classmethod
+    @generation_index
     def get_all(cls) -> ElementGroup[element]:
         """Gets all elements as objects of parent class `Element`.
 
+        After a refresh, only elements whose data has changed are rebuilt, see `refresh()`.
+
         Returns
         -------
         ElementGroup[element]
             All elements.
         """
-        elements = cls.get_api()
-        elements_sorted = sorted([cls.from_dict(elem) for elem in elements], key=lambda p: p.unique_id)
+        from .columns import ColumnStore
+
+        elements = cls.__build_changed(cls.get_api())
+        elements_sorted = sorted(elements, key=lambda p: p.unique_id)
+
+        return ElementGroup[element].from_rows(ColumnStore(elements_sorted))
+
+    @classmethod
+    def refresh(cls) -> frozenset[Any]:
+        """Download the latest data, rebuilding only the elements that have changed.
+
+        Unchanged elements keep their identity, so references held elsewhere stay valid.
+        An element is also rebuilt if an element it links to, e.g. a player's team, was rebuilt.
+
+        Returns
+        -------
+        frozenset[Any]
+            Unique IDs of elements added, removed or changed.
+        """
+        cls.get_api(refresh_api=True)
+        cls.get_all()
+
+        return cls._changed_ids
+
+    @classmethod
+    def __build_changed(cls, api_data: list[dict[str, Any]]) -> list[element]:
+        """Create elements from `api_data`, reusing those built from the same data by the previous call.
+        """
+        id_col = cls.UNIQUE_ID_COL
+        new_api = {elem[id_col]: elem for elem in api_data}
+
+        if len(new_api) != len(api_data):  # Repeated IDs, cannot match elements to data
+            cls._built = ({}, {})
+            cls._changed_ids = frozenset(new_api.keys())
+            return cls.from_dicts(api_data)
+
+        old_api, old_elements = cls.__dict__.get("_built", ({}, {}))
+        kept: dict[Any, element] = {}
+        changed = set(old_api.keys() - new_api.keys())
+
+        for id_, elem in new_api.items():
+            old_element = old_elements.get(id_)
+
+            if old_element is not None and old_api[id_] == elem and old_element.links_current():
+                kept[id_] = old_element
+            else:
+                changed.add(id_)
+
+        rebuilt_ids = [id_ for id_ in new_api if id_ not in kept]
+        rebuilt = zip(rebuilt_ids, cls.from_dicts([new_api[id_] for id_ in rebuilt_ids]))
+        elements = {**kept, **dict(rebuilt)}
+
+        cls._built = (new_api, elements)
+        cls._changed_ids = frozenset(changed)
+
+        return list(elements.values())
+
+    def links_current(self) -> bool:
+        """Whether every element this element links to is the latest version of that element.
+
+        Returns
+        -------
+        bool
+            False if a linked element has since been rebuilt. Links not read yet are current,
+            as they find the latest element when read.
+        """
+        return all(linked_field.is_current(self) for linked_field in type(self).linked_fields().values())
+
+    @classmethod
+    @cache
+    def linked_fields(cls) -> dict[str, LinkedField]:
+        """Fields holding an element from one of `linked_classes()`, found from the dataclass field types.
+
+        Each is installed on the class as a `LinkedField` on first call, so elements are built
+        holding the linked element's ID, and the linked element is only built when the field is read.
+
+        Returns
+        -------
+        dict[str, LinkedField]
+            Field name to the descriptor reading it.
+        """
+        linked_by_name = {linked_class.__name__: linked_class for linked_class in cls.linked_classes()}
+        linked_fields = {}
+
+        for f in fields(cls):  # type: ignore[arg-type]
+            if str(f.type) not in linked_by_name:
+                continue
+
+            slot = next(class_.__dict__[f.name] for class_ in cls.__mro__ if f.name in class_.__dict__)
+            linked_fields[f.name] = LinkedField(slot, linked_by_name[str(f.type)])
+            setattr(cls, f.name, linked_fields[f.name])
+
+        return linked_fields
+
+    @classmethod
+    def derive(cls, name: str, depends_on: Sequence[str], func: Callable[..., Any]) -> None:
+        """Register an attribute computed from other attributes for every element at once, see `Derived`.
+
+        It is computed over `get_all()` the first time it is used by `ElementGroup.filter()`, `sort()`,
+        `top_n()`, `to_df()` or `aggregate()`, then kept as a column until the data changes.
+        E.g. `Player.derive("xgi_per_90", ("expected_goal_involvements", "minutes"), func)`,
+        then `Player.get_all().sort("xgi_per_90")`.
+
+        Registering a name again replaces it, and drops cached queries of the class and its subclasses.
+
+        Parameters
+        ----------
+        name : str
+            Name of the attribute.
+        depends_on : Sequence[str]
+            Attributes `func` is computed from, fields, properties or other derived attributes.
+        func : Callable[..., Any]
+            Takes one NumPy array per attribute in `depends_on`, returns one value per element.
+
+        Raises
+        ------
+        ValueError
+            If `name` is a field of the class, or in `depends_on`.
+        """
+        if name in getattr(cls, "__dataclass_fields__", {}):
+            raise ValueError(f"'{name}' is a field of {cls.__name__}.")
+        if name in depends_on:
+            raise ValueError(f"'{name}' cannot depend on itself.")
+
+        derived: Optional[dict[str, Derived]] = cls.__dict__.get("_derived")
 
-        return ElementGroup[element](elements_sorted)
+        if derived is None:
+            derived = {}
+            cls._derived = derived
+
+        derived[name] = Derived(name, tuple(depends_on), func)
+
+        classes: list[type[_Element[Any]]] = [cls]
+        while classes:  # Queries may hold columns of the old attribute
+            class_ = classes.pop()
+            class_.query_cache().clear()
+            classes.extend(class_.__subclasses__())
+
+    @classmethod
+    def derived_attributes(cls) -> dict[str, Derived]:
+        """Attributes registered by `derive()` on the class and its parent classes.
+
+        Returns
+        -------
+        dict[str, Derived]
+            Name to attribute, a subclass's attribute replaces one of the same name.
+        """
+        derived: dict[str, Derived] = {}
+
+        for class_ in reversed(cls.__mro__):
+            derived.update(class_.__dict__.get("_derived") or {})
+
+        return derived
 
     @classmethod
     def get_api(cls, refresh_api: bool = False) -> list[dict[str, Any]]:
@@ -188,13 +609,77 @@ class _Element(ABC, Generic[element]):
         list[dict[str, Any]]
             Data for the class.
         """
-        if (refresh_api is True) or (cls._api is None):  # If api is empty or an update to api is requested.
+        uses_bootstrap = cls.api_link() == URLS["BOOTSTRAP-STATIC"]
+
+        if refresh_api is True and uses_bootstrap:
+            BOOTSTRAP_STATIC.refresh()  # Updates every class that reads bootstrap-static.
+
+        # If api is empty, an update to api is requested or the shared bootstrap-static has changed.
+        if (refresh_api is True) or (cls._api is None) or \
+                (uses_bootstrap and cls._api_version != BOOTSTRAP_STATIC.version):
             cls._api = cls.get_latest_api()
+            cls._api_version = BOOTSTRAP_STATIC.version
+
+        if refresh_api is True:
+            cls._generation += 1  # Invalidates cached queries, for this class and classes linked to it.
 
         return cls._api
 
     @classmethod
-    @cache
+    def linked_classes(cls) -> tuple[type[_Element[Any]], ...]:
+        """Element classes that objects of this class hold references to.
+
+        E.g. a linked `Fixture` holds `Team` and `Event` objects, so it must be
+        rebuilt when either is refreshed.
+        Fields declared with one of these classes hold an ID until read, see `linked_fields()`.
+
+        Returns
+        -------
+        tuple[type[_Element[Any]], ...]
+            Classes this class is built from, by default none.
+        """
+        return ()
+
+    @classmethod
+    def data_generation(cls) -> tuple[int, ...]:
+        """Identifies the version of data used by the class and every class linked to it.
+
+        Changes when `get_api(refresh_api=True)` is called on this class or any class it is linked to,
+        directly or through other classes.
+
+        Returns
+        -------
+        tuple[int, ...]
+            Generation numbers, compare for equality only.
+        """
+        uses_bootstrap = cls.api_link() == URLS["BOOTSTRAP-STATIC"]
+        generation: tuple[int, ...] = (cls._generation, BOOTSTRAP_STATIC.version if uses_bootstrap else 0)
+
+        for linked_class in cls.linked_classes():
+            generation += linked_class.data_generation()
+
+        return generation
+
+    @classmethod
+    def query_cache(cls) -> QueryCache:
+        """Cache of query results for this class, separate from every other class.
+
+        Created on first use, with `QUERY_CACHE_SIZE` and `QUERY_CACHE_TTL`, which do not apply to indexes.
+
+        Returns
+        -------
+        QueryCache
+            Results, and hit, miss and eviction counts.
+        """
+        cache: Optional[QueryCache] = cls.__dict__.get("_query_cache")
+
+        if cache is None:
+            cache = QueryCache(cls.QUERY_CACHE_SIZE, cls.QUERY_CACHE_TTL)
+            cls._query_cache = cache
+
+        return cache
+
+    @classmethod
     def get_by_id(cls, id_: Any) -> Optional[element]:
         """Get an element by their unique id.
 
@@ -207,16 +692,40 @@ class _Element(ABC, Generic[element]):
         -------
         Optional[element]
             The found element. May return None if no element has been found.
+
+        Raises
+        ------
+        IDNotUnique
+            If more than one element has the ID.
         """
-        filter_ = {cls.UNIQUE_ID_COL: id_}
-        element_group = cls.get(**filter_)
+        index, repeated_ids = cls.id_index()
 
-        try:
-            id_uniqueness_check(element_group)
-        except IDMatchesZeroElements:
-            return None
-        else:
-            return element_group[0]
+        if id_ in repeated_ids:
+            raise IDNotUnique(f"Expected only one element with ID {id_!r}.")
+
+        return index.get(id_)
+
+    @classmethod
+    @generation_index
+    def id_index(cls) -> tuple[dict[Any, element], frozenset[Any]]:
+        """Hash index of every element by unique ID, built once per data generation.
+
+        Used by `get_by_id()`.
+
+        Returns
+        -------
+        tuple[dict[Any, element], frozenset[Any]]
+            Element by unique ID, and IDs shared by more than one element.
+        """
+        index: dict[Any, element] = {}
+        repeated_ids = set()
+
+        for elem in cls.get_all():
+            if elem.unique_id in index:
+                repeated_ids.add(elem.unique_id)
+            index[elem.unique_id] = elem
+
+        return index, frozenset(repeated_ids)
 
     @classmethod
     @abstractmethod
@@ -247,6 +756,7 @@ class ElementGroup2(ABC, list[element], Generic[element]):
         pd.DataFrame
             `elements` data in a dataframe.
         """
+        import pandas as pd
 
         df_rows = [[getattr(element, attr) for attr in attributes]
                    for element in self]
@@ -297,11 +807,57 @@ class ElementGroup2(ABC, list[element], Generic[element]):
 
 class ElementGroup(ABC, Generic[element]):
     """Way to store and edit a group of common FPL elements.
+
+    A group is an ordered set, each element is held once, in the order first given.
+    Membership is tested against a hash set, and groups combine with
+    `union()` (`|`), `intersection()` (`&`) and `difference()` (`-`), keeping order.
+
+    Groups from `get_all()`, and groups made from them by `filter()`, `sort()`, slicing and `get()`,
+    are backed by a `ColumnStore`. They hold only the rows they contain, filter and sort on NumPy arrays,
+    and make their list of elements the first time it is asked for.
     """
 
     def __init__(self, objects: Iterable[element]):
-        # Need to find a method of removing duplicates whilst preserving order.
-        self.__objects = list(objects)
+        self.__objects: Optional[list[element]] = list(dict.fromkeys(objects))  # Repeats removed, order kept
+        self.__members: Optional[frozenset[element]] = None  # Set of the elements, made on first membership test
+        self.__store: Optional[ColumnStore] = None
+        self.__rows: Optional[np.ndarray] = None  # Rows of `__store` in the group, None for every row
+
+    @classmethod
+    def from_rows(cls, store: ColumnStore, rows: Optional[np.ndarray] = None) -> ElementGroup[element]:
+        """Group of rows of a column store, the elements are not listed until needed.
+
+        Parameters
+        ----------
+        store : ColumnStore
+            Columns of the elements.
+        rows : Optional[np.ndarray], optional
+            Rows in the group, in order, each at most once, by default None (every row)
+
+        Returns
+        -------
+        ElementGroup[element]
+            Group backed by `store`.
+        """
+        group: ElementGroup[element] = cls.__new__(cls)
+        group.__objects = store.elements if rows is None else None
+        group.__members = None
+        group.__store = store
+        group.__rows = rows
+
+        return group
+
+    @classmethod
+    def __from_distinct(cls, elements: list[element]) -> ElementGroup[element]:
+        """Group of elements already known to be distinct, e.g. filtered from a group, without checking for repeats.
+        """
+        group: ElementGroup[element] = cls.__new__(cls)
+        group.__objects = elements
+        group.__members = None
+        group.__store = None
+        group.__rows = None
+
+        return group
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ElementGroup):
@@ -310,13 +866,22 @@ class ElementGroup(ABC, Generic[element]):
         return other.to_list() == self.to_list()
 
     def __add__(self, other: ElementGroup[element]) -> ElementGroup[element]:
-        if not isinstance(other, ElementGroup):
-            raise NotImplementedError
+        return self.union(other)
 
-        if not self.is_compatible(other):
-            raise Exception("ElementGroups must have same type.")
+    def __or__(self, other: ElementGroup[element]) -> ElementGroup[element]:
+        return self.union(other)
 
-        return ElementGroup[element](self.to_list() + other.to_list())
+    def __and__(self, other: ElementGroup[element]) -> ElementGroup[element]:
+        return self.intersection(other)
+
+    def __sub__(self, other: ElementGroup[element]) -> ElementGroup[element]:
+        return self.difference(other)
+
+    def __contains__(self, elem: object) -> bool:
+        if self.__members is None:
+            self.__members = frozenset(self.to_list())
+
+        return elem in self.__members
 
     @overload
     def __getitem__(self, idx: SupportsIndex) -> element: ...
@@ -326,17 +891,24 @@ class ElementGroup(ABC, Generic[element]):
     def __getitem__(self, idx: Any) -> Any:
         if isinstance(idx, slice):
             # slicing creates new ElementGroup
-            return ElementGroup(self.__objects[idx])
+            if self.__store is not None:
+                return ElementGroup[element].from_rows(self.__store, self.__all_rows()[idx])
+            return ElementGroup[element].__from_distinct(self.to_list()[idx])
         elif isinstance(idx, SupportsIndex):
-            return self.__objects[idx]
+            if self.__objects is None and self.__store is not None and self.__rows is not None:
+                return self.__store.elements[self.__rows[idx]]  # Only this element is looked up
+            return self.to_list()[idx]
         else:
             raise NotImplementedError
 
     def __iter__(self) -> Iterator[element]:
-        return iter(self.__objects)
+        return iter(self.to_list())
 
     def __len__(self) -> int:
-        return len(self.__objects)
+        if self.__objects is None and self.__rows is not None:
+            return len(self.__rows)
+
+        return len(self.to_list())
 
     def __str__(self) -> str:
         """Description of contents in the class.
@@ -351,6 +923,15 @@ class ElementGroup(ABC, Generic[element]):
     def filter(self, *, method_: str = "all", **attr_to_value: Union[Any, tuple[Any]]) -> ElementGroup[element]:
         """Filters an ElementGroup into a group that satisfies all the conditions passed.
 
+        `attr=value` or `attr=(value1, value2)` match elements equal to any value.
+        Other comparisons add an operator to the attribute name:
+        `__ne`, `__gt`, `__ge`, `__lt`, `__le`, `__in=(...)` and `__between=(lower, upper)` (inclusive).
+        E.g. `group.filter(now_cost__between=(45, 80), form__gt=5)`.
+
+        Conditions on fields and derived attributes, see `_Element.derive()`, are tested on the arrays
+        of the group's `ColumnStore`, if it has one.
+        Otherwise, the conditions are compiled once into a single list comprehension.
+
         Parameters
         ----------
         method_ : bool, optional
@@ -365,33 +946,39 @@ class ElementGroup(ABC, Generic[element]):
         ------
         AttributeError
             If the attribute does not exist for the elements.
+        ValueError
+            If `__between` is not given a (lower, upper) pair.
         """
-        # Method check
-        func = _method_choice(method_)
-        attr_to_value = _format_attr_to_value(attr_to_value)
+        return self.where(parse_conditions(attr_to_value), method_=method_)
 
-        elements_found = []
+    def where(self, conditions: Sequence[Condition], *, method_: str = "all") -> ElementGroup[element]:
+        """Same as `filter()`, with conditions already parsed, see `Condition.parse()`.
 
-        for elem in self:
-            conditions_by_attr = []
+        Parameters
+        ----------
+        conditions : Sequence[Condition]
+            Conditions to test, may be on the same attribute more than once.
+        method_ : str, optional
+            "all" if all conditions must be met, "or" for any condition to be met, by default "all"
 
-            for attr, values in attr_to_value.items():
-                elem_attr = getattr(elem, attr)
+        Returns
+        -------
+        ElementGroup[element]
+            All elements that satisfy the conditions.
+        """
+        func = _method_choice(method_)
+        store = self.__store_for(condition.attr for condition in conditions)
 
-                if isinstance(elem_attr, _Element):
-                    elem_attr = elem_attr.unique_id
+        if store is not None:
+            rows = store.select(conditions, func, self.__rows)
 
-                for value in values:
-                    if elem_attr == value:
-                        conditions_by_attr.append(True)
-                        break
-                else:
-                    conditions_by_attr.append(False)
+            if rows is not None:
+                return ElementGroup[element].from_rows(store, rows)
 
-            if func(conditions_by_attr):
-                elements_found.append(elem)
+        elements = self.to_list()
+        filter_ = filter_for(conditions, func, elements[0] if elements else None)
 
-        return ElementGroup[element](elements_found)
+        return ElementGroup[element].__from_distinct(filter_(elements))
 
     def get_top_n_elements(self, col_by: str, n: int, reverse: bool = True) -> ElementGroup[element]:
         """Gets top n elements of an attribute and returns them in a new ElementGroup.
@@ -408,9 +995,61 @@ class ElementGroup(ABC, Generic[element]):
         Returns
         -------
         ElementGroup[element]
-            Group of top elements of size `n`.
+            Group of top elements of size `n`, see `top_n()` and `bottom_n()`.
+        """
+        return self.top_n(col_by, n) if reverse else self.bottom_n(col_by, n)
+
+    def top_n(self, sort_by: str, n: int) -> ElementGroup[element]:
+        """The `n` elements with the highest values of an attribute, highest first.
+
+        The same as `sort(sort_by)[:n]`, without sorting the whole group.
+        Found by a partial sort of the group's `ColumnStore`, or a heap of `n` elements otherwise, O(len * log n).
+
+        Parameters
+        ----------
+        sort_by : str
+            Attribute to rank elements by.
+        n : int
+            Number of elements to keep.
+
+        Returns
+        -------
+        ElementGroup[element]
+            At most `n` elements.
         """
-        return ElementGroup[element](self.sort(col_by, reverse=reverse)[:n])
+        return self.__first_n(sort_by, n, reverse=True)
+
+    def bottom_n(self, sort_by: str, n: int) -> ElementGroup[element]:
+        """The `n` elements with the lowest values of an attribute, lowest first.
+
+        The same as `sort(sort_by, reverse=False)[:n]`, without sorting the whole group, see `top_n()`.
+
+        Parameters
+        ----------
+        sort_by : str
+            Attribute to rank elements by.
+        n : int
+            Number of elements to keep.
+
+        Returns
+        -------
+        ElementGroup[element]
+            At most `n` elements.
+        """
+        return self.__first_n(sort_by, n, reverse=False)
+
+    def __first_n(self, sort_by: str, n: int, *, reverse: bool) -> ElementGroup[element]:
+        store = self.__store_for((sort_by,))
+
+        if store is not None:
+            rows = store.top(sort_by, n, reverse=reverse, rows=self.__rows)
+
+            if rows is not None:
+                return ElementGroup[element].from_rows(store, rows)
+
+        select = nlargest if reverse else nsmallest  # Both keep the order of equal elements, like `sorted()`
+
+        return ElementGroup[element].__from_distinct(select(n, self.to_list(), key=attrgetter(sort_by)))
 
     def get_random(self) -> element:
         """Gets random element from objects list.
@@ -420,7 +1059,7 @@ class ElementGroup(ABC, Generic[element]):
         element
             Random element selected.
         """
-        return choice(self.__objects)
+        return choice(self.to_list())
 
     def get_sample(self, n: int) -> ElementGroup[element]:
         """Gets `n` random elements from `self`.
@@ -435,7 +1074,7 @@ class ElementGroup(ABC, Generic[element]):
         ElementGroup[element]
             `n` elements from random sample.
         """
-        return ElementGroup[element](list(sample(self.__objects, n)))
+        return ElementGroup[element](list(sample(self.to_list(), n)))
 
     def group_by(self, group_by_attr: str) -> dict[Any, ElementGroup[element]]:
         """Split an ElementGroup into multiple sub-groups by an attribute value.
@@ -472,6 +1111,59 @@ class ElementGroup(ABC, Generic[element]):
 
         return {attr: ElementGroup[element](elems) for attr, elems in groups.items()}
 
+    def aggregate(self, by: Union[str, Sequence[str]], *, links: str = "element", **attr_to_func: str) -> pd.DataFrame:
+        """Reduce attributes of the elements for each group of elements with the same values of `by`.
+
+        E.g. `Player.get_all().aggregate(by=("team", "element_type"), total_points="sum", minutes="mean")`
+        gives the total points and average minutes of every position in every team.
+        Fields of numbers are reduced on the arrays of the group's `ColumnStore`, in one pass per field,
+        rather than filtering the group once per key. Otherwise, by a pandas group by of `to_df()`.
+
+        Parameters
+        ----------
+        by : Union[str, Sequence[str]]
+            Attribute, or attributes, to group elements by.
+        links : str, optional
+            Linked elements in `by` as "element", "id" or "category", see `to_df()`, by default "element"
+        **attr_to_func : str
+            Attribute to reduce, to one of 'sum', 'mean', 'count', 'min', 'max', 'median' or 'std'.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per group, sorted, indexed by the values of `by`, one column per attribute reduced.
+            Use `.unstack()` to pivot the last attribute of `by` into columns.
+
+        Raises
+        ------
+        AttributeError
+            If an attribute does not exist for the elements.
+        ValueError
+            If no attribute is given to group by or reduce, or a reduction is not one of the options.
+        """
+        import pandas as pd
+
+        by = (by,) if isinstance(by, str) else tuple(by)
+        unknown = {func for func in attr_to_func.values() if func not in _AGGREGATIONS}
+
+        if len(by) == 0 or len(attr_to_func) == 0:
+            raise ValueError("Give at least one attribute to group by, and one to reduce.")
+        if len(unknown) > 0:
+            raise ValueError(f"Cannot aggregate with {unknown}, choose from {_AGGREGATIONS}.")
+
+        store = self.__store if self.__store is not None else self.columns()
+        aggregated = store.aggregate(by, attr_to_func, self.__all_rows(), links)
+
+        if aggregated is not None:
+            return aggregated
+
+        values = self.to_df(*attr_to_func)
+        keys = [pd.Series(store.export(attr, self.__all_rows(), links), index=values.index, name=attr) for attr in by]
+
+        grouped = values.groupby(keys, sort=True, dropna=False, observed=True)
+
+        return grouped.agg(**{attr: (attr, func) for attr, func in attr_to_func.items()})
+
     def is_compatible(self, other: ElementGroup[Any]) -> bool:
         """Checks if two ElementGroups store the same element.
 
@@ -498,35 +1190,60 @@ class ElementGroup(ABC, Generic[element]):
 
         return True
 
-    def sort(self, sort_by: str, *, reverse: bool = True) -> ElementGroup[element]:
-        """Sorts a list of like elements by an attribute.
+    def sort(self, *sort_by: str, reverse: Union[bool, Sequence[bool]] = True) -> ElementGroup[element]:
+        """Sorts a list of like elements by one or more attributes.
+
+        E.g. `group.sort("total_points", "now_cost", reverse=(True, False))` for the most points first,
+        and the cheapest first for equal points. Equal elements keep their order.
+
+        Sorts of every element, or of a filtered group, reuse the order kept by the group's `ColumnStore`
+        for the same attributes, so are not sorted again until the data changes.
 
         Parameters
         ----------
-        sort_by : str
-            Attribute name to sort `elements` by.
-        reverse : bool, optional
-            True if in descending order, by default True
+        *sort_by : str
+            Attribute names to sort `elements` by, the first attribute first.
+        reverse : Union[bool, Sequence[bool]], optional
+            True if in descending order, by default True. One for all attributes, or one per attribute.
 
         Returns
         -------
         list[element]
             `elements` sorted by `sort_by`.
+
+        Raises
+        ------
+        ValueError
+            If no attribute is given, or `reverse` has a different length to `sort_by`.
         """
+        reverses = (reverse,) * len(sort_by) if isinstance(reverse, bool) else tuple(reverse)
+
+        if len(sort_by) == 0 or len(reverses) != len(sort_by):
+            raise ValueError("Give at least one attribute to sort by, and one 'reverse' for all attributes or for each.")
+
+        if len(self) == 0:
+            return ElementGroup[element].__from_distinct(self.to_list())
 
-        def foo(elem: _Element[Any]) -> Any:
-            return getattr(elem, sort_by)
+        store = self.__store_for(sort_by)
 
-        if self.__objects == []:
-            return ElementGroup[element](self.__objects)
+        if store is not None:
+            rows = store.order(sort_by, reverses, rows=self.__rows)
 
-        elements_sorted = sorted(self.__objects, key=foo, reverse=reverse)
+            if rows is not None:
+                return ElementGroup[element].from_rows(store, rows)
 
-        return ElementGroup[element](elements_sorted)
+        elements_sorted = self.to_list()
+
+        for attr, attr_reverse in reversed(list(zip(sort_by, reverses))):  # Sorts are stable, so the first attribute is sorted last
+            elements_sorted = sorted(elements_sorted, key=attrgetter(attr), reverse=attr_reverse)
+
+        return ElementGroup[element].__from_distinct(elements_sorted)
 
     def split(self, *, method_: str = "all", **attr_to_value: Union[Any, Iterable[Any]]) -> tuple[ElementGroup[element], ElementGroup[element]]:
         """Splits an ElementGroup into two sub-groups, where one group satisfies the filters, the other does not.
 
+        Conditions are the same as `filter()`, and each element is tested once.
+
         Parameters
         ----------
         method_ : bool, optional
@@ -535,34 +1252,280 @@ class ElementGroup(ABC, Generic[element]):
         Returns
         -------
         tuple[ElementGroup[element], ElementGroup[element]]
-            The first group satisfies the filter, the other does not.
+            The first group satisfies the filter, the other does not. Both keep the order of the group.
         """
-        filtered_elems = self.filter(method_=method_, **attr_to_value)
+        func = _method_choice(method_)
+        conditions = parse_conditions(attr_to_value)
+        store = self.__store_for(condition.attr for condition in conditions)
 
-        not_filtered_elems = ElementGroup[element](
-            [elem for elem in self if elem not in filtered_elems.to_list()])
+        if store is not None:
+            rows = self.__all_rows()
+            selected = store.select(conditions, func, rows)
 
-        return filtered_elems, not_filtered_elems
+            if selected is not None:
+                import numpy as np
 
-    def to_df(self, *attributes: str) -> pd.DataFrame:
+                return (ElementGroup[element].from_rows(store, selected),
+                        ElementGroup[element].from_rows(store, rows[~np.isin(rows, selected)]))
+
+        elements = self.to_list()
+        predicate = compile_predicate(conditions, func, field_ids(elements[0]) if elements else None)
+        filtered_elems: list[element] = []
+        not_filtered_elems: list[element] = []
+
+        for elem in elements:
+            (filtered_elems if predicate(elem) else not_filtered_elems).append(elem)
+
+        return ElementGroup[element].__from_distinct(filtered_elems), ElementGroup[element].__from_distinct(not_filtered_elems)
+
+    def union(self, other: ElementGroup[element]) -> ElementGroup[element]:
+        """Elements in either group, those in this group first, then those only in `other`, each in order.
+
+        Parameters
+        ----------
+        other : ElementGroup[element]
+            Group to add.
+
+        Returns
+        -------
+        ElementGroup[element]
+            New group.
+
+        Raises
+        ------
+        NotImplementedError
+            If `other` is not an ElementGroup.
+        Exception
+            If the groups hold different types of element.
+        """
+        own_rows, other_rows = self.__shared_rows(other)
+
+        if own_rows is not None and other_rows is not None:
+            import numpy as np
+
+            rows = np.concatenate([own_rows, other_rows[~np.isin(other_rows, own_rows)]])
+            return ElementGroup[element].from_rows(self.__store, rows)  # type: ignore[arg-type]
+
+        if not self.is_compatible(other):
+            raise Exception("ElementGroups must have same type.")
+
+        return ElementGroup[element](self.to_list() + other.to_list())
+
+    def intersection(self, other: ElementGroup[element]) -> ElementGroup[element]:
+        """Elements in both groups, in the order of this group.
+
+        Parameters
+        ----------
+        other : ElementGroup[element]
+            Group to compare with.
+
+        Returns
+        -------
+        ElementGroup[element]
+            New group.
+
+        Raises
+        ------
+        NotImplementedError
+            If `other` is not an ElementGroup.
+        """
+        own_rows, other_rows = self.__shared_rows(other)
+
+        if own_rows is not None and other_rows is not None:
+            import numpy as np
+
+            return ElementGroup[element].from_rows(self.__store, own_rows[np.isin(own_rows, other_rows)])  # type: ignore[arg-type]
+
+        return ElementGroup[element].__from_distinct([elem for elem in self if elem in other])
+
+    def difference(self, other: ElementGroup[element]) -> ElementGroup[element]:
+        """Elements in this group but not in `other`, in the order of this group.
+
+        Parameters
+        ----------
+        other : ElementGroup[element]
+            Group of elements to remove.
+
+        Returns
+        -------
+        ElementGroup[element]
+            New group.
+
+        Raises
+        ------
+        NotImplementedError
+            If `other` is not an ElementGroup.
+        """
+        own_rows, other_rows = self.__shared_rows(other)
+
+        if own_rows is not None and other_rows is not None:
+            import numpy as np
+
+            return ElementGroup[element].from_rows(self.__store, own_rows[~np.isin(own_rows, other_rows)])  # type: ignore[arg-type]
+
+        return ElementGroup[element].__from_distinct([elem for elem in self if elem not in other])
+
+    def __shared_rows(self, other: ElementGroup[element]) -> tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Rows of both groups, if they are backed by the same `ColumnStore`, otherwise None.
+        """
+        if not isinstance(other, ElementGroup):
+            raise NotImplementedError
+
+        if self.__store is None or self.__store is not other.__store:
+            return None, None
+
+        return self.__all_rows(), other.__all_rows()
+
+    def to_df(self, *attributes: str, all_fields: bool = False, links: str = "element") -> pd.DataFrame:
         """Gets a list of like elements and puts them into a dataframe.
 
-        With the chosen attributes as columns.
+        With the chosen attributes as columns, indexed from 1.
+        Fields and derived attributes, see `_Element.derive()`, are copied from the group's `ColumnStore`,
+        if it has one, so each column has one dtype, e.g. int64, float64 (ints with missing values), bool or str.
+        Other attributes, e.g. properties, and every attribute of a group with no store, are read from each element,
+        with dtypes inferred by pandas. Derived attributes and linked IDs of a group with no store
+        come from a store made for the export, which the group does not keep.
+
+        Parameters
+        ----------
+        all_fields : bool, optional
+            Add every field of the elements not in `attributes`, in the order declared, by default False
+        links : str, optional
+            Linked elements, e.g. a player's team, as:
+            - "element", the elements, by default
+            - "id", their unique IDs, as int64, or Int64 if any are missing
+            - "category", a categorical of their names, e.g. team names.
 
         Returns
         -------
         pd.DataFrame
             `elements` data in a dataframe.
+
+        Raises
+        ------
+        AttributeError
+            If an attribute does not exist for the elements.
+        ValueError
+            If `links` is not one of the options.
         """
+        import pandas as pd
 
-        df_rows = [[getattr(element, attr) for attr in attributes]
-                   for element in self]
+        if links not in ("element", "id", "category"):
+            raise ValueError(f"'links' must be 'element', 'id' or 'category', not {links!r}.")
+        if len(self) == 0:
+            return pd.DataFrame([], index=pd.RangeIndex(1, 1), columns=pd.Index(attributes))
 
-        df = pd.DataFrame(df_rows, index=list(
-            range(1, len(self) + 1)), columns=attributes)
+        if self.__store is None:
+            attributes, values = self.__export_elements(attributes, all_fields, links)
+        else:
+            rows = self.__all_rows()
+
+            if all_fields:
+                attributes += tuple(name for name in self.__store.fields if name not in attributes)
+
+            values = [self.__store.export(attr, rows, links) for attr in attributes]
+
+        df = pd.DataFrame(dict(enumerate(values)), index=pd.RangeIndex(1, len(self) + 1))
+        df.columns = pd.Index(attributes)
 
         return df
 
+    def __export_elements(self, attributes: tuple[str, ...], all_fields: bool,
+                          links: str) -> tuple[tuple[str, ...], list[Any]]:
+        """Attributes for `to_df()`, with every field if `all_fields`, and their values,
+        read from each element of a group with no store.
+        """
+        elements = self.to_list()
+        class_: Any = type(elements[0])
+        derived_attributes: Callable[[], dict[str, Any]] = getattr(class_, "derived_attributes", dict)
+        linked_fields: Callable[[], dict[str, Any]] = getattr(class_, "linked_fields", dict)
+        from_store = set(derived_attributes()) | (set(linked_fields()) if links != "element" else set())
+        store: Optional[ColumnStore] = None
+
+        if all_fields and is_dataclass(class_):
+            attributes += tuple(f.name for f in fields(class_) if f.name not in attributes)
+
+        values: list[Any] = []
+        for attr in attributes:
+            if attr not in from_store:
+                values.append([getattr(elem, attr) for elem in elements])
+                continue
+
+            if store is None:
+                import numpy as np
+                from .columns import ColumnStore
+
+                store = ColumnStore(elements)
+            values.append(store.export(attr, np.arange(len(elements)), links))
+
+        return attributes, values
+
+    def take(self, positions: Iterable[int]) -> ElementGroup[element]:
+        """Elements at `positions` in the group, sharing the group's `ColumnStore`.
+
+        Parameters
+        ----------
+        positions : Iterable[int]
+            Positions in the group, in the order wanted. Repeated positions are taken once.
+
+        Returns
+        -------
+        ElementGroup[element]
+            New group.
+        """
+        positions = dict.fromkeys(positions)
+
+        if self.__store is not None:
+            import numpy as np
+
+            rows = self.__all_rows()[np.fromiter(positions, dtype=np.intp)]
+            return ElementGroup[element].from_rows(self.__store, rows)
+
+        elements = self.to_list()
+
+        return ElementGroup[element].__from_distinct([elements[position] for position in positions])
+
+    def lazy(self) -> LazyQuery[element]:
+        """Query on the group, run as one plan when the result is needed, see `LazyQuery`.
+
+        Returns
+        -------
+        LazyQuery[element]
+            Query with no steps.
+        """
+        from .lazy import LazyQuery
+
+        return LazyQuery[element](self)
+
+    def columns(self) -> ColumnStore:
+        """Columns of the elements in the group, one NumPy array per field.
+
+        Returns
+        -------
+        ColumnStore
+            Store backing the group, or a new store if the group is not backed by one,
+            or holds only some rows of its store.
+        """
+        from .columns import ColumnStore
+
+        if self.__store is None or self.__rows is not None:
+            self.__store, self.__rows = ColumnStore(self.to_list()), None
+
+        return self.__store
+
+    def __store_for(self, attributes: Iterable[str]) -> Optional[ColumnStore]:
+        """Store backing the group, made for the group if it has none and an attribute is derived,
+        as elements may not have it, see `_Element.derive()`.
+        """
+        if self.__store is None and len(self) > 0:
+            derived_attributes: Callable[[], dict[str, Any]] = getattr(type(self.to_list()[0]), "derived_attributes", dict)
+            derived = derived_attributes()
+
+            if any(attr in derived for attr in attributes):
+                return self.columns()
+
+        return self.__store
+
     def to_list(self) -> list[element]:
         """All elements in instance within a list.
 
@@ -571,8 +1534,23 @@ class ElementGroup(ABC, Generic[element]):
         list[element]
             `self.__object`.
         """
+        if self.__objects is None:
+            elements = self.__store.elements if self.__store is not None else []
+            rows = self.__rows.tolist() if self.__rows is not None else range(len(elements))
+            self.__objects = [elements[row] for row in rows]
+
         return self.__objects
 
+    def __all_rows(self) -> np.ndarray:
+        """Rows of `__store` in the group.
+        """
+        import numpy as np
+
+        if self.__rows is None:
+            return np.arange(len(self.to_list()))
+
+        return self.__rows
+
     def to_percentile(self, attr: str) -> Percentile[element]:
         """Ranks all elements in instance by percentile by `attr`.
 
@@ -612,6 +1590,9 @@ class ElementGroup(ABC, Generic[element]):
         return output
 
 
+_AGGREGATIONS = ("sum", "mean", "count", "min", "max", "median", "std")  # Reductions for `ElementGroup.aggregate()`
+
+
 class InvalidQueryResult(Exception):
     pass
 
@@ -682,45 +1663,6 @@ def _method_choice(method_: str) -> Callable[[Iterable[bool]], bool]:
     return func
 
 
-def _format_attr_to_value(attr_to_value: dict[str, Union[Any, tuple[Any, ...]]]) -> dict[str, tuple[Any, ...]]:
-    """Formats query so the values are all tuples.
-
-    Used by `ElementGroup.filter()`
-
-    Parameters
-    ----------
-    attr_to_value : dict[str, Union[Any, tuple[Any]]]
-        Original query
-
-    Returns
-    -------
-    dict[str, tuple[Any]]
-        Formatted query where values are stored in tuples by default.
-    """
-    # Attr_to_value check
-    for attr, values in attr_to_value.items():
-        # If single value for attr is passed
-        if isinstance(values, tuple):
-            attr_to_value[attr] = list(values)
-        else:
-            attr_to_value[attr] = [values]
-
-    no_elem_attr_to_value: dict[str, tuple[Any, ...]] = dict()
-
-    for attr, values in attr_to_value.items():
-        temp: list[Any] = []
-
-        for value in values:
-            if isinstance(value, _Element):
-                temp.append(value.unique_id)
-            else:
-                temp.append(value)
-
-        no_elem_attr_to_value[attr] = tuple(temp)
-
-    return no_elem_attr_to_value
-
-
 '''def elem_from_dict(elem_class: type[_Element], new_instance: dict[str, Any]) -> element:
     """Converts dictionary of attributes to an object of the class.
     Parameters
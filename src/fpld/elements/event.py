@@ -1,15 +1,18 @@
 from .element import _Element, ElementGroup
 from datetime import datetime
-from typing import Generic, TypeVar, Union, Any
-from ..util import API
+from typing import TYPE_CHECKING, Generic, TypeVar, Union, Any
+from ..util import BOOTSTRAP_STATIC
 from ..constants import URLS, string_to_datetime
 from dataclasses import dataclass, field
 
+if TYPE_CHECKING:
+    from .live import LiveFeed
+
 
 _event = TypeVar("_event", bound="_Event[Any]")
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class _Event(_Element[_event], Generic[_event]):
     """Event / Gameweek element, unlinked from other FPL elements.
     """
@@ -40,7 +43,7 @@ class _Event(_Element[_event], Generic[_event]):
 
     @classmethod
     def __pre_init__(cls, new_instance: dict[str, Any]) -> dict[str, Any]:
-        new_instance = super().__pre_init__(new_instance)
+        new_instance = super(_Event, cls).__pre_init__(new_instance)
 
         # converts string datetime to datetime object
         # TODO: regex support
@@ -52,6 +55,23 @@ class _Event(_Element[_event], Generic[_event]):
 
         return new_instance
 
+    def live(self, *, interval: float = 60.0) -> "LiveFeed":
+        """Follow the points of every player during this gameweek.
+
+        Parameters
+        ----------
+        interval : float, optional
+            Seconds between polls of the live endpoint, by default 60.0
+
+        Returns
+        -------
+        LiveFeed
+            Feed of changes to player stats.
+        """
+        from .live import LiveFeed  # Imports asyncio, so only when a feed is made
+
+        return LiveFeed(self.id, interval=interval)
+
     def __add__(self, other: int) -> _event:
         """Increments the event by `other` gameweeks.
 
@@ -217,9 +237,7 @@ class _Event(_Element[_event], Generic[_event]):
 
     @classmethod
     def get_latest_api(cls) -> list[dict[str, Any]]:
-        api = API(cls.api_link())
-
-        data: list[dict[str, Any]] = api.data["events"]
+        data: list[dict[str, Any]] = BOOTSTRAP_STATIC.section("events")
 
         # none
         data.append({
@@ -294,7 +312,7 @@ class _Event(_Element[_event], Generic[_event]):
         return ElementGroup[_event]([event for event in all_events if event != cls.none()])
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class BaseEvent(_Event["BaseEvent"]):
     """Independent Event element, not linked to any other FPL elements.
     """
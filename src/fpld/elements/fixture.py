@@ -1,4 +1,7 @@
-from typing import Generic, Optional, TypeVar, Any
+from __future__ import annotations
+from typing import Generic, Iterable, Iterator, Optional, TypeVar, Any
+from array import array
+from sys import intern
 from .element import _Element, ElementGroup
 from ..util import API
 from ..constants import URLS, string_to_datetime
@@ -9,7 +12,150 @@ from dataclasses import dataclass, field
 _fixture = TypeVar("_fixture", bound="_Fixture[Any]")
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+class FixtureStats:
+    """Stats of the players in a fixture, e.g. goals, assists and bonus points, for each side.
+
+    Held as one array of (player ID, value) pairs per stat and side,
+    rather than the nested dictionaries sent by the API.
+
+    Example
+    -------
+    ```
+    > fixture.stats.home("goals_scored")
+    {283: 1}
+    > fixture.stats.for_player(283)
+    {"goals_scored": 1, "bps": 31}
+    ```
+    """
+    __slots__ = ("__identifiers", "__sides")
+
+    def __init__(self, identifiers: Iterable[str], sides: Iterable[tuple[array[int], array[int]]]):
+        self.__identifiers = tuple(intern(identifier) for identifier in identifiers)
+        self.__sides = tuple(sides)  # (home, away) per identifier, player IDs and values alternating
+
+    @classmethod
+    def from_api(cls, stats: list[dict[str, Any]]) -> FixtureStats:
+        """Compact copy of the 'stats' of a fixture from the API.
+
+        Parameters
+        ----------
+        stats : list[dict[str, Any]]
+            E.g. `[{"identifier": "goals_scored", "a": [{"value": 1, "element": 283}], "h": []}]`.
+
+        Returns
+        -------
+        FixtureStats
+            Same stats.
+        """
+        return cls((stat["identifier"] for stat in stats),
+                   ((_pairs(stat["h"]), _pairs(stat["a"])) for stat in stats))
+
+    def __len__(self) -> int:
+        return len(self.__identifiers)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__identifiers)
+
+    def __contains__(self, identifier: object) -> bool:
+        return identifier in self.__identifiers
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FixtureStats):
+            return NotImplemented
+
+        return self.to_list() == other.to_list()
+
+    def __repr__(self) -> str:
+        return f"FixtureStats({', '.join(self.__identifiers)})"
+
+    def home(self, identifier: str) -> dict[int, int]:
+        """Values of a stat for home players.
+
+        Parameters
+        ----------
+        identifier : str
+            Stat, e.g. 'bps'.
+
+        Returns
+        -------
+        dict[int, int]
+            Player ID to value, empty if the stat is not recorded.
+        """
+        return self.__side(identifier, 0)
+
+    def away(self, identifier: str) -> dict[int, int]:
+        """Values of a stat for away players.
+
+        Parameters
+        ----------
+        identifier : str
+            Stat, e.g. 'bps'.
+
+        Returns
+        -------
+        dict[int, int]
+            Player ID to value, empty if the stat is not recorded.
+        """
+        return self.__side(identifier, 1)
+
+    def for_player(self, player_id: int) -> dict[str, int]:
+        """Every stat recorded for one player.
+
+        Parameters
+        ----------
+        player_id : int
+            ID of the player.
+
+        Returns
+        -------
+        dict[str, int]
+            Stat to value, empty if the player has no stats in the fixture.
+        """
+        found = {}
+
+        for identifier in self.__identifiers:
+            for side in (0, 1):
+                value = self.__side(identifier, side).get(player_id)
+                if value is not None:
+                    found[identifier] = value
+
+        return found
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """Stats in the form sent by the API.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            One dictionary per stat, with 'identifier', 'a' and 'h'.
+        """
+        return [{"identifier": identifier,
+                 "a": [{"value": value, "element": id_} for id_, value in self.away(identifier).items()],
+                 "h": [{"value": value, "element": id_} for id_, value in self.home(identifier).items()]}
+                for identifier in self.__identifiers]
+
+    def __side(self, identifier: str, side: int) -> dict[int, int]:
+        if identifier not in self.__identifiers:
+            return {}
+
+        pairs = self.__sides[self.__identifiers.index(identifier)][side]
+
+        return dict(zip(pairs[::2], pairs[1::2]))
+
+
+def _pairs(entries: list[dict[str, int]]) -> array[int]:
+    """Player IDs and values of one side of a stat, alternating in one array.
+    """
+    pairs = array("i")
+
+    for entry in entries:
+        pairs.append(entry["element"])
+        pairs.append(entry["value"])
+
+    return pairs
+
+
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class _Fixture(_Element[_fixture], Generic[_fixture]):
     """Fixture / result element, unlinked from other FPL elements.
     """
@@ -28,7 +174,7 @@ class _Fixture(_Element[_fixture], Generic[_fixture]):
     team_a_score: Optional[int] = field(hash=False, repr=False, compare=False)
     team_h: Any = field(hash=False, compare=False)
     team_h_score: Optional[int] = field(hash=False, repr=False, compare=False)
-    stats: list[dict[str, Any]] = field(hash=False, repr=False, compare=False)
+    stats: FixtureStats = field(hash=False, repr=False, compare=False)
     team_h_difficulty: int = field(hash=False, repr=False, compare=False)
     team_a_difficulty: int = field(hash=False, repr=False, compare=False)
     pulse_id: int = field(repr=False, compare=False)
@@ -38,7 +184,7 @@ class _Fixture(_Element[_fixture], Generic[_fixture]):
 
     @classmethod
     def __pre_init__(cls, new_instance: dict[str, Any]) -> dict[str, Any]:
-        new_instance = super().__pre_init__(new_instance)
+        new_instance = super(_Fixture, cls).__pre_init__(new_instance)
 
         if new_instance["kickoff_time"] is None:
             new_instance["kickoff_time"] = datetime.max
@@ -47,6 +193,8 @@ class _Fixture(_Element[_fixture], Generic[_fixture]):
             new_instance["kickoff_time"] = \
                 string_to_datetime(new_instance["kickoff_time"])
 
+        new_instance["stats"] = FixtureStats.from_api(new_instance["stats"])
+
         return new_instance
 
     @property
@@ -160,7 +308,7 @@ class _Fixture(_Element[_fixture], Generic[_fixture]):
         return fixtures.filter(event=event_id)
 
 
-@ dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class BaseFixture(_Fixture["BaseFixture"]):
     """Independent Fixture element, not linked to any other FPL elements.
     """
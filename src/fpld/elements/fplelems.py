@@ -1,21 +1,24 @@
 from __future__ import annotations
 import math
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 from ..constants import datetime_to_string
-from ..util.percent import to_percent
+from ..util.percent import to_percent, to_group_percents
 from .team import BaseTeam
 from .player import _Player
-from .playerfull import _PlayerFull, _PlayerHistoryDf, _PlayerHistoryPastDf
 from .fixture import _Fixture
 from .event import _Event
 from .position import Position
 from .labels import Label
 from dataclasses import dataclass, field
-from .element import ElementGroup
-import pandas as pd
+from .element import _Element, ElementGroup, generation_index
+from .query import comparable
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from .playerfulldf import PlayerFullDf
 
-@dataclass(frozen=True, order=True, kw_only=True)
+
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class Team(BaseTeam["Team"]):
     @property
     def fixture_score(self) -> float:
@@ -102,7 +105,7 @@ class Team(BaseTeam["Team"]):
         ElementGroup[Player]
             All players from the team that play in that position.
         """
-        return self.players.filter(element_type=position)
+        return Player.get(team=self.unique_id, element_type=position)
 
     def player_total(self, *cols: str, by_position: Optional[Position] = None) -> float:
         """Total points for all the players in a team, for a given attribute.
@@ -150,6 +153,8 @@ class Team(BaseTeam["Team"]):
     def total_goal_contributions(self, *, by_position: Optional[Position] = None) -> int:
         """Total goal contributions for a team.
 
+        Looked up in `Player.contribution_totals()`.
+
         Parameters
         ----------
         by_position : Optional[Position], optional
@@ -160,67 +165,55 @@ class Team(BaseTeam["Team"]):
         int
             Total goals + total assists.
         """
-        cols = ["goals_scored", "assists"]
-
-        return int(self.player_total(*cols, by_position=by_position))
-
-
-class PlayerHistoryDf(_PlayerHistoryDf):
-    @classmethod
-    def _edit_stat_from_api(cls, field: str, attr_list: list[Any]) -> list[Any]:
-        if field == "fixture":
-            attr_list = [Fixture.get_by_id(id_) for id_ in attr_list]
-        elif field == "opponent_team":
-            attr_list = [Team.get_by_id(id_) for id_ in attr_list]
-
-        return attr_list
-
-    @classmethod
-    def from_api(cls, api_data: list[dict[str, Any]]) -> PlayerHistoryDf:
-        out: PlayerHistoryDf = super().from_api(api_data)
-
-        return out
+        position_id = None if by_position is None else comparable(by_position)
 
-
-class PlayerHistoryPastDf(_PlayerHistoryPastDf):
-    @classmethod
-    def from_api(cls, api_data: list[dict[str, Any]]) -> PlayerHistoryPastDf:
-        out: PlayerHistoryPastDf = super().from_api(api_data)
-
-        return out
+        return Player.contribution_totals().get((self.unique_id, position_id), 0)
 
 
-class PlayerFullDf(_PlayerFull[PlayerHistoryDf, PlayerHistoryPastDf]):
-    """Game by game, season by season data for a player, linked to other FPL elements.
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
+class Player(_Player["Player"]):
+    """Player element, linked to other FPL elements.
     """
+    team: Team = field(hash=False, compare=False)
+    element_type: Position = field(hash=False, compare=False)
 
     @classmethod
-    def from_player_id(cls, player_id: int) -> PlayerFullDf:
-        data = cls.get_api(player_id)
+    def linked_classes(cls) -> tuple[type[_Element[Any]], ...]:
+        return (Team, Position)
 
-        history = PlayerHistoryDf.from_api(data["history"])
-        history_past = PlayerHistoryPastDf.from_api(
-            data["history_past"])
+    @classmethod
+    @generation_index
+    def contribution_totals(cls) -> dict[tuple[Any, Any], int]:
+        """Total goal contributions of each team, in each position and in all positions,
+        built from one `aggregate()` once per data generation.
 
-        return PlayerFullDf(history, history_past)
+        Returns
+        -------
+        dict[tuple[Any, Any], int]
+            (team ID, position ID) to the total of the team's players in that position,
+            and (team ID, None) to the total of all the team's players.
+        """
+        table = cls.get_all().aggregate(by=("team", "element_type"), links="id",
+                                        goals_scored="sum", assists="sum")
+        totals: dict[tuple[Any, Any], int] = {}
 
+        for (team_id, position_id), goals, assists in zip(table.index, table["goals_scored"], table["assists"]):
+            total = int(goals) + int(assists)
+            totals[(team_id, position_id)] = total
+            totals[(team_id, None)] = totals.get((team_id, None), 0) + total
 
-@dataclass(frozen=True, order=True, kw_only=True)
-class Player(_Player["Player"]):
-    """Player element, linked to other FPL elements.
-    """
-    team: Team = field(hash=False, compare=False)
-    element_type: Position = field(hash=False, compare=False)
+        return totals
 
     @classmethod
-    def __pre_init__(cls, new_instance: dict[str, Any]) -> dict[str, Any]:
-        new_instance = super().__pre_init__(new_instance)
-
-        new_instance["element_type"] = Position.get_by_id(
-            new_instance["element_type"])
-        new_instance["team"] = Team.get_by_id(new_instance["team"])
+    def contribution_percents(cls) -> pd.DataFrame:
+        """`percent_pos` and `percent_team` of every player as columns, computed once per data generation.
 
-        return new_instance
+        Returns
+        -------
+        pd.DataFrame
+            Columns 'percent_pos' and 'percent_team', in the order of `get_all()`, indexed from 1 like `to_df()`.
+        """
+        return cls.get_all().to_df("percent_pos", "percent_team")
 
     @property
     def percent_pos(self) -> float:
@@ -232,8 +225,8 @@ class Player(_Player["Player"]):
         float
             player contributions / team position contributions.
         """
-        position_total = self.team.total_goal_contributions(
-            by_position=self.element_type)
+        position_total = Player.contribution_totals().get(
+            (self.team.unique_id, self.element_type.unique_id), 0)
         return to_percent(self.goal_contributions, position_total)
 
     @property
@@ -245,7 +238,7 @@ class Player(_Player["Player"]):
         float
             player contributions / team contributions.
         """
-        team_total = self.team.total_goal_contributions()
+        team_total = Player.contribution_totals().get((self.team.unique_id, None), 0)
         return to_percent(self.goal_contributions, team_total)
 
     '''def attribute_in_event(self, attribute: str, event: Event) -> list[Any]:
@@ -286,10 +279,12 @@ class Player(_Player["Player"]):
         return values'''
 
     def in_full(self) -> PlayerFullDf:
+        from .playerfulldf import PlayerFullDf
+
         return PlayerFullDf.from_player_id(self.id)
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class Event(_Event["Event"]):
     """Event / gameweek element, linked to other FPL elements.
     """
@@ -300,21 +295,8 @@ class Event(_Event["Event"]):
     most_vice_captained: Player = field(hash=False, repr=False, compare=False)
 
     @classmethod
-    def __pre_init__(cls, new_instance: dict[str, Any]) -> dict[str, Any]:
-        new_instance = super().__pre_init__(new_instance)
-
-        new_instance["most_selected"] = \
-            Player.get_by_id(new_instance["most_selected"])
-        new_instance["most_transferred_in"] = \
-            Player.get_by_id(new_instance["most_transferred_in"])
-        new_instance["top_element"] = \
-            Player.get_by_id(new_instance["top_element"])
-        new_instance["most_captained"] = \
-            Player.get_by_id(new_instance["most_captained"])
-        new_instance["most_vice_captained"] = \
-            Player.get_by_id(new_instance["most_vice_captained"])
-
-        return new_instance
+    def linked_classes(cls) -> tuple[type[_Element[Any]], ...]:
+        return (Player,)
 
     @property
     def fixtures(self) -> ElementGroup[Fixture]:
@@ -328,7 +310,7 @@ class Event(_Event["Event"]):
         return Fixture.get(event=self)
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class Fixture(_Fixture["Fixture"]):
     """Fixture / result element, linked to other FPL elements.
     """
@@ -337,14 +319,8 @@ class Fixture(_Fixture["Fixture"]):
     team_a: Team = field(hash=False, compare=False)
 
     @classmethod
-    def __pre_init__(cls, new_instance: dict[str, Any]) -> dict[str, Any]:
-        new_instance = super().__pre_init__(new_instance)
-
-        new_instance["event"] = Event.get_by_id(new_instance["event"])
-        new_instance["team_h"] = Team.get_by_id(new_instance["team_h"])
-        new_instance["team_a"] = Team.get_by_id(new_instance["team_a"])
-
-        return new_instance
+    def linked_classes(cls) -> tuple[type[_Element[Any]], ...]:
+        return (Event, Team)
 
     def get_difficulty(self, team: Union[int, Team]) -> int:
         """Gets the difficulty of a fixture for a team.
@@ -425,6 +401,11 @@ class Fixture(_Fixture["Fixture"]):
         return super().group_fixtures_by_gameweek(fixtures)'''
 
 
+# Columns of the properties above, see `_Element.derive()`
+Player.derive("percent_pos", ("goal_contributions", "team", "element_type"), to_group_percents)
+Player.derive("percent_team", ("goal_contributions", "team"), to_group_percents)
+
+
 def get_players(*, team: str = "All", position: str = "All", sort_by: str = "Total Points") -> pd.DataFrame:
     if team == "All":
         teams_found = Team.get()
@@ -442,10 +423,8 @@ def get_players(*, team: str = "All", position: str = "All", sort_by: str = "Tot
     label = Label.get(label=sort_by)[0]
     players_sorted = players_found.sort(label.name)
 
-    df = players_sorted.to_df("element_type", label.name)
-    df["player"] = players_sorted
-    df["team"] = [player.team for player in players_sorted]
-    df = df[["player", "team", "element_type", label.name]]
+    df = players_sorted.to_df("team", "element_type", label.name)
+    df.insert(0, "player", players_sorted.to_list())
 
     return df
 
@@ -487,3 +466,13 @@ def get_events() -> pd.DataFrame:
         lambda date_: datetime_to_string(date_))
 
     return df
+
+
+def __getattr__(name: str) -> Any:
+    # DataFrame classes moved to `playerfulldf`, so pandas is only imported when needed
+    if name in ("PlayerHistoryDf", "PlayerHistoryPastDf", "PlayerFullDf"):
+        from . import playerfulldf
+
+        return getattr(playerfulldf, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
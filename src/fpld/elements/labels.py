@@ -1,16 +1,18 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from ..util import API
+from typing import ClassVar
+from ..util import BOOTSTRAP_STATIC
 from ..constants import URLS
 from .element import _Element
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class Label(_Element["Label"]):
     """Name for FPL player attribute.
     """
     UNIQUE_ID_COL = "name"
     _ATTR_FOR_STR = "label"
+    _added: ClassVar[dict[str, str]] = {}  # Attribute name to label, from `add()`
 
     label: str
     name: str
@@ -19,10 +21,43 @@ class Label(_Element["Label"]):
     def api_link(cls) -> str:
         return URLS["BOOTSTRAP-STATIC"]
 
+    @classmethod
+    def add(cls, *, label: str, name: str) -> None:
+        """Add a label for an attribute, e.g. one registered by `Player.derive()`,
+        so players can be sorted by it in `get_players()`.
+
+        Parameters
+        ----------
+        label : str
+            Label shown, e.g. 'xGI per 90'.
+        name : str
+            Attribute, e.g. 'xgi_per_90'.
+        """
+        cls._added[name] = label
+        cls._api = None  # Read again from bootstrap-static held in memory, with the new label
+        cls._generation += 1
+
+    @classmethod
+    def remove(cls, name: str) -> None:
+        """Remove a label added by `add()`.
+
+        Parameters
+        ----------
+        name : str
+            Attribute the label was added for.
+
+        Raises
+        ------
+        KeyError
+            If no label was added for `name`.
+        """
+        del cls._added[name]
+        cls._api = None  # Read again from bootstrap-static held in memory, without the label
+        cls._generation += 1
+
     @classmethod
     def get_latest_api(cls) -> list[dict[str, str]]:
-        api = API(cls.api_link())
-        data: list[dict[str, str]] = api.data["element_stats"]
+        data: list[dict[str, str]] = BOOTSTRAP_STATIC.section("element_stats")
 
         # New player labels
         data.append({"label": "Goal Contributions",
@@ -34,5 +69,6 @@ class Label(_Element["Label"]):
         data.append({"label": "Total Points", "name": "total_points"})
         data.append({"label": "Transfers in for next Gameweek", "name": "transfers_in_event"})
         data.append({"label": "Transfers out for next Gameweek", "name": "transfers_out_event"})
+        data.extend({"label": label, "name": name} for name, label in cls._added.items())
 
         return data
@@ -0,0 +1,322 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Generic, Iterator, Optional, Sequence, Union
+from .element import ElementGroup, element
+from .query import Condition, parse_conditions
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+Step = tuple[Any, ...]  # ("filter", method_, conditions), ("sort", attributes, reverses) or ("head", n)
+
+
+class LazyQuery(Generic[element]):
+    """Chain of filters, sorts and top n on a group, only run when the result is needed.
+
+    Made by `_Element.lazy()` or `ElementGroup.lazy()`. Each method returns a new query,
+    nothing is run until `collect()`, `to_df()`, `to_list()` or iteration, then the steps are
+    run as one plan, see `explain()`:
+    - Filters are moved before sorts, which keep the order of equal elements, and every filter
+      with `method_="all"` between two `head()` or `top_n()` calls is tested as one, with one mask.
+    - Filters on every element of a class are answered from the class's indexes, see `_Element.where()`.
+    - Sorts are merged into one sort by several attributes, and a following `top_n()` or `head()`
+      takes the first rows of that order, by a partial sort if there is one attribute.
+    - `to_df()` reads attributes for the final rows only.
+
+    Example
+    -------
+    ```
+    > query = Player.lazy().filter(element_type=3).filter(now_cost__lt=80).top_n("form", 10)
+    > print(query.explain())
+    > query.to_df("web_name", "form")
+    ```
+    """
+    __slots__ = ("__source", "__element_class", "__steps")
+
+    def __init__(self, source: ElementGroup[element], element_class: Optional[type[Any]] = None,
+                 steps: tuple[Step, ...] = ()):
+        self.__source = source
+        self.__element_class = element_class  # Class whose `get_all()` is `source`, so filters can use its indexes
+        self.__steps = steps
+
+    def __iter__(self) -> Iterator[element]:
+        return iter(self.collect())
+
+    def filter(self, *, method_: str = "all", **attr_to_value: Union[Any, tuple[Any]]) -> LazyQuery[element]:
+        """Adds a filter, see `ElementGroup.filter()`.
+
+        Parameters
+        ----------
+        method_ : str, optional
+            "all" if all conditions must be met, "or" for any condition to be met, by default "all"
+
+        Returns
+        -------
+        LazyQuery[element]
+            New query.
+
+        Raises
+        ------
+        ValueError
+            If `method_` is not "all" or "or", or `__between` is not given a (lower, upper) pair.
+        """
+        if method_ not in ("all", "or"):
+            raise ValueError(f"'method_' must be 'all' or 'or', not {method_!r}.")
+
+        return self.__then(("filter", method_, tuple(parse_conditions(attr_to_value))))
+
+    def sort(self, *sort_by: str, reverse: Union[bool, Sequence[bool]] = True) -> LazyQuery[element]:
+        """Adds a sort, see `ElementGroup.sort()`.
+
+        Parameters
+        ----------
+        *sort_by : str
+            Attribute names to sort by, the first attribute first.
+        reverse : Union[bool, Sequence[bool]], optional
+            True if in descending order, by default True. One for all attributes, or one per attribute.
+
+        Returns
+        -------
+        LazyQuery[element]
+            New query.
+
+        Raises
+        ------
+        ValueError
+            If no attribute is given, or `reverse` has a different length to `sort_by`.
+        """
+        reverses = (reverse,) * len(sort_by) if isinstance(reverse, bool) else tuple(reverse)
+
+        if len(sort_by) == 0 or len(reverses) != len(sort_by):
+            raise ValueError("Give at least one attribute to sort by, and one 'reverse' for all attributes or for each.")
+
+        return self.__then(("sort", tuple(sort_by), reverses))
+
+    def head(self, n: int) -> LazyQuery[element]:
+        """Keeps the first `n` elements.
+
+        Parameters
+        ----------
+        n : int
+            Number of elements to keep.
+
+        Returns
+        -------
+        LazyQuery[element]
+            New query.
+        """
+        return self.__then(("head", max(n, 0)))
+
+    def top_n(self, sort_by: str, n: int) -> LazyQuery[element]:
+        """Keeps the `n` elements with the highest values of an attribute, see `ElementGroup.top_n()`.
+
+        Parameters
+        ----------
+        sort_by : str
+            Attribute to rank elements by.
+        n : int
+            Number of elements to keep.
+
+        Returns
+        -------
+        LazyQuery[element]
+            New query.
+        """
+        return self.sort(sort_by).head(n)
+
+    def bottom_n(self, sort_by: str, n: int) -> LazyQuery[element]:
+        """Keeps the `n` elements with the lowest values of an attribute, see `ElementGroup.bottom_n()`.
+
+        Parameters
+        ----------
+        sort_by : str
+            Attribute to rank elements by.
+        n : int
+            Number of elements to keep.
+
+        Returns
+        -------
+        LazyQuery[element]
+            New query.
+        """
+        return self.sort(sort_by, reverse=False).head(n)
+
+    def get_top_n_elements(self, col_by: str, n: int, reverse: bool = True) -> LazyQuery[element]:
+        """Keeps the top `n` elements of an attribute, see `ElementGroup.get_top_n_elements()`.
+
+        Parameters
+        ----------
+        col_by : str
+            Attribute to rank elements by.
+        n : int
+            Number of elements to keep.
+        reverse : bool, optional
+           For descending order, use True, by default True
+
+        Returns
+        -------
+        LazyQuery[element]
+            New query.
+        """
+        return self.top_n(col_by, n) if reverse else self.bottom_n(col_by, n)
+
+    def plan(self) -> list[Step]:
+        """Steps that will be run, after filters are moved and merged, and sorts are merged.
+
+        Returns
+        -------
+        list[Step]
+            ("where", method_, conditions) for filters from the class's indexes,
+            ("filter", method_, conditions), ("sort", attributes, reverses, n) with n None to keep every element,
+            or ("head", n).
+        """
+        plan: list[Step] = []
+
+        for segment, n in self.__segments():
+            conditions = tuple(condition for step in segment if step[0] == "filter" and step[1] == "all"
+                               for condition in step[2])
+            filters = [("filter", "all", conditions)] if len(conditions) > 0 else []
+            filters += [step for step in segment if step[0] == "filter" and step[1] == "or"]
+
+            keys: dict[str, bool] = {}
+            for step in reversed([step for step in segment if step[0] == "sort"]):  # The last sort sorts first
+                for attr, reverse in zip(step[1], step[2]):
+                    keys.setdefault(attr, reverse)  # Later keys only order elements already equal on the same key
+
+            if len(plan) == 0 and len(filters) > 0 and self.__element_class is not None:
+                filters[0] = ("where",) + filters[0][1:]
+
+            plan += filters
+
+            if len(keys) > 0:
+                plan.append(("sort", tuple(keys), tuple(keys.values()), n))
+            elif n is not None:
+                plan.append(("head", n))
+
+        return plan
+
+    def explain(self) -> str:
+        """The plan, one step per line, see `plan()`.
+
+        Returns
+        -------
+        str
+            E.g.
+            ```
+            LazyQuery on 700 elements of Player
+            1. where(element_type=3, now_cost__lt=80) from indexes
+            2. top 10 by form desc, partial sort
+            ```
+        """
+        name = self.__element_class.__name__ if self.__element_class is not None else "a group"
+        lines = [f"LazyQuery on {len(self.__source)} elements of {name}"]
+
+        for i, step in enumerate(self.plan(), start=1):
+            if step[0] in ("where", "filter"):
+                method = "" if step[1] == "all" else "method_='or', "
+                text = f"{step[0]}({method}{', '.join(_describe(condition) for condition in step[2])})"
+                text += " from indexes" if step[0] == "where" else ""
+            elif step[0] == "sort":
+                by = ", ".join(f"{attr} {'desc' if reverse else 'asc'}" for attr, reverse in zip(step[1], step[2]))
+
+                if step[3] is None:
+                    text = f"sort by {by}"
+                else:
+                    text = f"top {step[3]} by {by}, {'partial sort' if len(step[1]) == 1 else 'sort'}"
+            else:
+                text = f"head {step[1]}"
+
+            lines.append(f"{i}. {text}")
+
+        return "\n".join(lines)
+
+    def collect(self) -> ElementGroup[element]:
+        """Runs the plan.
+
+        Returns
+        -------
+        ElementGroup[element]
+            Result, the same as running each step on the group in order.
+
+        Raises
+        ------
+        AttributeError
+            If an attribute does not exist for the elements.
+        """
+        group = self.__source
+
+        for step in self.plan():
+            if step[0] == "where":
+                group = self.__element_class.where(step[2], method_=step[1])  # type: ignore[union-attr]
+            elif step[0] == "filter":
+                group = group.where(step[2], method_=step[1])
+            elif step[0] == "head":
+                group = group[:step[1]]
+            elif step[3] is None:
+                group = group.sort(*step[1], reverse=step[2])
+            elif len(step[1]) == 1:
+                group = group.top_n(step[1][0], step[3]) if step[2][0] else group.bottom_n(step[1][0], step[3])
+            else:
+                group = group.sort(*step[1], reverse=step[2])[:step[3]]
+
+        return group
+
+    def to_list(self) -> list[element]:
+        """Runs the plan, see `collect()`.
+
+        Returns
+        -------
+        list[element]
+            Elements of the result.
+        """
+        return self.collect().to_list()
+
+    def to_df(self, *attributes: str, all_fields: bool = False, links: str = "element") -> pd.DataFrame:
+        """Runs the plan, then reads `attributes` for the result, see `ElementGroup.to_df()`.
+
+        Parameters
+        ----------
+        all_fields : bool, optional
+            Add every field of the elements not in `attributes`, by default False
+        links : str, optional
+            Linked elements as "element", "id" or "category", by default "element"
+
+        Returns
+        -------
+        pd.DataFrame
+            Result in a dataframe, indexed from 1.
+        """
+        return self.collect().to_df(*attributes, all_fields=all_fields, links=links)
+
+    def __then(self, step: Step) -> LazyQuery[element]:
+        return LazyQuery[element](self.__source, self.__element_class, self.__steps + (step,))
+
+    def __segments(self) -> Iterator[tuple[list[Step], Optional[int]]]:
+        """Steps between each `head()`, and the smallest `n` of the heads ending them, None for the last steps.
+        """
+        segment: list[Step] = []
+        n: Optional[int] = None
+
+        for step in self.__steps:
+            if step[0] == "head":
+                n = step[1] if n is None else min(n, step[1])
+                continue
+
+            if n is not None:
+                yield segment, n
+                segment, n = [], None
+            segment.append(step)
+
+        if len(segment) > 0 or n is not None:
+            yield segment, n
+
+
+def _describe(condition: Condition) -> str:
+    """Condition as the keyword argument it was parsed from, e.g. 'now_cost__lt=80'.
+    """
+    value = condition.values if len(condition.values) > 1 else condition.values[0]
+
+    if condition.operator == "in":
+        return f"{condition.attr}={value!r}"
+
+    return f"{condition.attr}__{condition.operator}={value!r}"
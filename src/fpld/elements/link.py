@@ -0,0 +1,102 @@
+from __future__ import annotations
+from typing import Any, Optional
+
+
+class LinkedField:
+    """Field of an element holding an element of another class, e.g. a player's team.
+
+    The field is built holding the unique ID from the API, and swapped for the element
+    with that ID the first time it is read. So building fixtures does not build every event,
+    and building events does not build every player.
+
+    Installed on the class in place of the dataclass slot, see `_Element.linked_fields()`.
+
+    Example
+    -------
+    ```
+    > Player.linked_fields()["team"].linked_id(player)  # Does not build any team
+    1
+    > player.team
+    Arsenal
+    ```
+    """
+    __slots__ = ("__slot", "__linked_class")
+    __slot: Any  # Slot descriptor made by the dataclass, holds the ID or the element
+    __linked_class: Any
+
+    def __init__(self, slot: Any, linked_class: Any):
+        if isinstance(slot, LinkedField):
+            slot = slot.__slot
+
+        self.__slot = slot
+        self.__linked_class = linked_class
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+
+        value = self.__slot.__get__(instance, owner)
+
+        if value is None or isinstance(value, self.__linked_class):
+            return value
+
+        found = self.__linked_class.get_by_id(value)
+        if found is not None:
+            self.__slot.__set__(instance, found)  # Only swaps an ID for its element, so frozen elements still compare the same
+
+        return found
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self.__slot.__set__(instance, value)
+
+    @property
+    def linked_class(self) -> Any:
+        """Class of the element held by the field.
+
+        Returns
+        -------
+        Any
+            E.g. `Team`.
+        """
+        return self.__linked_class
+
+    def linked_id(self, instance: Any) -> Any:
+        """Unique ID of the linked element, without finding the element.
+
+        Parameters
+        ----------
+        instance : Any
+            Element holding the field.
+
+        Returns
+        -------
+        Any
+            ID, None if there is no linked element.
+        """
+        value = self.__slot.__get__(instance, type(instance))
+
+        if isinstance(value, self.__linked_class):
+            return value.unique_id
+
+        return value
+
+    def is_current(self, instance: Any) -> bool:
+        """Whether the field still leads to the latest element with its ID.
+
+        Parameters
+        ----------
+        instance : Any
+            Element holding the field.
+
+        Returns
+        -------
+        bool
+            False if the field holds an element that has since been rebuilt.
+            True if the field has not been read yet, as it will find the latest element.
+        """
+        value = self.__slot.__get__(instance, type(instance))
+
+        if not isinstance(value, self.__linked_class):
+            return True
+
+        return value is self.__linked_class.get_by_id(value.unique_id)
@@ -0,0 +1,254 @@
+from __future__ import annotations
+import asyncio
+from inspect import isawaitable
+from time import sleep
+from typing import Any, Awaitable, Callable, Iterator, Optional, Union
+from ..constants import URLS
+from ..util.external import API, decode_json
+
+
+PlayerDeltas = dict[int, dict[str, float]]  # Player ID to the change in each stat since the last poll
+LiveCallback = Callable[[PlayerDeltas], Union[None, Awaitable[None]]]
+
+
+class LiveFeed:
+    """Follows the live stats of every player in a gameweek.
+
+    Each poll is a conditional request, so an unchanged feed costs a 304 with no body.
+    Only stats that changed since the last poll are passed on.
+
+    Example
+    -------
+    ```
+    > feed = Event.get_current_gw().live(interval=30)
+    > for deltas in feed:
+    >     print(deltas)  # {427: {"total_points": 2.0, "minutes": 60.0}}
+    ```
+    """
+
+    def __init__(self, event_id: int, *, interval: float = 60.0):
+        if interval < 0:
+            raise ValueError("'interval' must not be negative.")
+
+        self.__event_id = event_id
+        self.__interval = interval
+        self.__stats: dict[int, dict[str, Any]] = {}
+        self.__etag: Optional[str] = None
+        self.__last_modified: Optional[str] = None
+        self.__polls = 0
+        self.__not_modified = 0
+        self.__callbacks: list[LiveCallback] = []
+
+    def __str__(self) -> str:
+        return f"LiveFeed(event={self.__event_id}, polls={self.__polls})"
+
+    def __iter__(self) -> Iterator[PlayerDeltas]:
+        return self.iter_deltas()
+
+    @property
+    def url(self) -> str:
+        """Live endpoint for the gameweek.
+
+        Returns
+        -------
+        str
+            URL polled.
+        """
+        return URLS["EVENT-LIVE"].format(self.__event_id)
+
+    @property
+    def polls(self) -> int:
+        """Number of polls made.
+
+        Returns
+        -------
+        int
+            Includes polls answered with 304.
+        """
+        return self.__polls
+
+    @property
+    def not_modified(self) -> int:
+        """Number of polls where the server had nothing new.
+
+        Returns
+        -------
+        int
+            Polls answered with 304.
+        """
+        return self.__not_modified
+
+    @property
+    def stats(self) -> dict[int, dict[str, Any]]:
+        """Latest stats for every player in the gameweek.
+
+        Returns
+        -------
+        dict[int, dict[str, Any]]
+            Player ID to stats, e.g. 'total_points', 'minutes', 'bonus'.
+        """
+        return self.__stats
+
+    @property
+    def points(self) -> dict[int, int]:
+        """Latest points for every player in the gameweek.
+
+        Returns
+        -------
+        dict[int, int]
+            Player ID to total points in the gameweek.
+        """
+        return {player_id: stats.get("total_points", 0) for player_id, stats in self.__stats.items()}
+
+    def poll(self) -> PlayerDeltas:
+        """Request the live endpoint once, updating `stats`.
+
+        Returns
+        -------
+        PlayerDeltas
+            Change in each numeric stat since the last poll, for players where something changed.
+            Empty if nothing changed. On the first poll, the change is from zero.
+        """
+        self.__polls += 1
+        content = self.__get_content()
+
+        if content is None:
+            self.__not_modified += 1
+            return {}
+
+        data = decode_json(content)
+        deltas: PlayerDeltas = {}
+
+        for player in data.get("elements", []):
+            new_stats: dict[str, Any] = player["stats"]
+            old_stats = self.__stats.get(player["id"], {})
+            player_deltas = _stat_deltas(old_stats, new_stats)
+
+            self.__stats[player["id"]] = new_stats
+            if player_deltas:
+                deltas[player["id"]] = player_deltas
+
+        return deltas
+
+    def iter_deltas(self, max_polls: Optional[int] = None) -> Iterator[PlayerDeltas]:
+        """Poll every `interval` seconds, yielding only polls where something changed.
+
+        Parameters
+        ----------
+        max_polls : Optional[int], optional
+            Stop after this many polls, by default None (never stop)
+
+        Yields
+        ------
+        Iterator[PlayerDeltas]
+            Changes since the previous poll.
+        """
+        polls = 0
+
+        while max_polls is None or polls < max_polls:
+            if polls > 0:
+                sleep(self.__interval)
+
+            deltas = self.poll()
+            polls += 1
+
+            if deltas:
+                yield deltas
+
+    def add_callback(self, callback: LiveCallback) -> None:
+        """Call `callback` with the changes from each poll where something changed, while `run()` is running.
+
+        Parameters
+        ----------
+        callback : LiveCallback
+            Function or coroutine function taking `PlayerDeltas`.
+        """
+        self.__callbacks.append(callback)
+
+    async def run(self, max_polls: Optional[int] = None) -> None:
+        """Poll every `interval` seconds without blocking the event loop, passing changes to every callback.
+
+        Parameters
+        ----------
+        max_polls : Optional[int], optional
+            Stop after this many polls, by default None (never stop)
+        """
+        polls = 0
+
+        while max_polls is None or polls < max_polls:
+            if polls > 0:
+                await asyncio.sleep(self.__interval)
+
+            deltas = await asyncio.to_thread(self.poll)
+            polls += 1
+
+            if not deltas:
+                continue
+
+            for callback in self.__callbacks:
+                result = callback(deltas)
+                if isawaitable(result):
+                    await result
+
+    def __get_content(self) -> Optional[bytes]:
+        """Body of the live endpoint, None if unchanged since the last poll.
+        """
+        snapshot = API.snapshot
+
+        if snapshot is not None and snapshot.mode == "replay":
+            return snapshot.read(self.url)
+
+        headers = {}
+        if self.__etag is not None:
+            headers["If-None-Match"] = self.__etag
+        if self.__last_modified is not None:
+            headers["If-Modified-Since"] = self.__last_modified
+
+        response = API.get_session().get(self.url, headers=headers)
+
+        if response.status_code == 304:
+            return None
+
+        response.raise_for_status()
+        self.__etag = response.headers.get("ETag")
+        self.__last_modified = response.headers.get("Last-Modified")
+        content: bytes = response.content
+
+        if snapshot is not None and snapshot.mode == "record":
+            snapshot.write(self.url, content)
+
+        return content
+
+
+def _stat_deltas(old_stats: dict[str, Any], new_stats: dict[str, Any]) -> dict[str, float]:
+    """Change in each numeric stat, leaving out stats that have not changed.
+    """
+    deltas: dict[str, float] = {}
+
+    for stat, new_value in new_stats.items():
+        new_number = _to_number(new_value)
+        old_number = _to_number(old_stats.get(stat, 0))
+
+        if new_number is None or old_number is None:
+            continue  # Not a numeric stat
+
+        if new_number != old_number:
+            deltas[stat] = new_number - old_number
+
+    return deltas
+
+
+def _to_number(value: Any) -> Optional[float]:
+    """`value` as a number, the API sends some stats as strings, e.g. 'influence'.
+    """
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+
+    return None
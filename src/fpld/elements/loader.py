@@ -0,0 +1,80 @@
+from __future__ import annotations
+from dataclasses import Field, fields
+from sys import intern
+from typing import Any, Callable, Optional
+
+
+Loader = Callable[[list[dict[str, Any]]], list[Any]]  # API data to elements
+
+_FLOAT_TYPES = ("float", "Optional[float]", float, Optional[float])  # The API sends some of these as strings
+_STR_TYPES = ("str", "Optional[str]", str, Optional[str])
+
+
+def compile_loader(cls: Any, pre_init: Optional[Callable[[dict[str, Any]], dict[str, Any]]] = None) -> Loader:
+    """Generate a function that builds elements of `cls` from a list of API dictionaries, in one pass.
+
+    The fields are read once, when the loader is made. For each dictionary, the generated source
+    reads every field by name, converts strings to floats for fields declared as `float`,
+    and interns strings for fields declared as `str`. Linked fields keep the ID from the API,
+    see `LinkedField`.
+
+    Parameters
+    ----------
+    cls : Any
+        Element class, must be a dataclass.
+    pre_init : Optional[Callable[[dict[str, Any]], dict[str, Any]]], optional
+        Edits the attributes before each element is created, by default None (no edits)
+
+    Returns
+    -------
+    Loader
+        Takes a list of API dictionaries, returns one element per dictionary, in order.
+
+    Raises
+    ------
+    KeyError
+        When the loader is called, if a dictionary is missing a field of `cls`.
+    """
+    class_fields = fields(cls)
+    attrs = ", ".join(f"{f.name!r}: {_read(f, f'_{i}')}" for i, f in enumerate(class_fields))
+
+    if pre_init is None:
+        body = f"        append(cls(**{{{attrs}}}))"
+    else:
+        body = f"        append(cls(**pre_init({{{attrs}}})))"
+
+    source = "\n".join([
+        "def load(rows):",
+        "    elements = []",
+        "    append = elements.append",
+        "    for row in rows:",
+        body,
+        "    return elements"
+    ])
+    namespace = {"cls": cls, "pre_init": pre_init, "intern": intern}
+    exec(compile(source, f"<{cls.__name__} loader>", "exec"), namespace)
+    load: Loader = namespace["load"]
+    field_names = {f.name for f in class_fields}
+
+    def loader(api_data: list[dict[str, Any]]) -> list[Any]:
+        try:
+            return load(api_data)
+        except KeyError:
+            for new_instance in api_data:  # Find the dictionary that is missing fields, once, for the message
+                missing = field_names.difference(new_instance.keys())
+                if missing:
+                    raise KeyError(f"Missing: {missing}") from None
+            raise
+
+    return loader
+
+
+def _read(field: Field[Any], name: str) -> str:
+    """Source reading one field from `row`, converted to its declared type.
+    """
+    if field.type in _FLOAT_TYPES:
+        return f"(float({name}) if type({name} := row[{field.name!r}]) is str else {name})"
+    if field.type in _STR_TYPES:
+        return f"(intern({name}) if type({name} := row[{field.name!r}]) is str else {name})"
+
+    return f"row[{field.name!r}]"
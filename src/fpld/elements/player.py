@@ -2,16 +2,18 @@ from __future__ import annotations
 from abc import abstractmethod
 from dataclasses import dataclass, field
 from .element import _Element, ElementGroup
-from typing import Optional, TypeVar, Generic, Any
-from ..util import API
+from typing import TYPE_CHECKING, Optional, TypeVar, Generic, Any
+from ..util import BOOTSTRAP_STATIC
 from ..constants import URLS, round_value
-from .playerfull import _PlayerFull, _PlayerHistoryDf, _PlayerHistoryPastDf
+
+if TYPE_CHECKING:
+    from .playerfulldf import BasePlayerFullDf
 
 
 _player = TypeVar("_player", bound="_Player[Any]")
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class _PlayerVars:
     id: int = field(repr=False)
 
@@ -92,16 +94,9 @@ class _PlayerVars:
 class _Player(_Element[_player], _PlayerVars, Generic[_player]):
     """Player element, unlinked from other FPL elements.
     """
+    __slots__ = ()
     _ATTR_FOR_STR = "web_name"
 
-    @classmethod
-    def __pre_init__(cls, new_instance: dict[str, Any]) -> dict[str, Any]:
-        new_instance = super().__pre_init__(new_instance)
-
-        new_instance["form"] = float(new_instance["form"])
-
-        return new_instance
-
     @ property
     def ppm(self) -> float:
         """Points per million cost.
@@ -152,9 +147,7 @@ class _Player(_Element[_player], _PlayerVars, Generic[_player]):
 
     @ classmethod
     def get_latest_api(cls) -> list[dict[str, Any]]:
-        api = API(cls.api_link())
-
-        data_from_api: list[dict[str, Any]] = api.data["elements"]
+        data_from_api: list[dict[str, Any]] = BOOTSTRAP_STATIC.section("elements")
 
         return data_from_api
 
@@ -180,18 +173,20 @@ class _Player(_Element[_player], _PlayerVars, Generic[_player]):
         ElementGroup[_player]
             Players between `lower` and `upper` costs.
         """
+        if include_boundaries:
+            return player_pool.filter(now_cost__between=(lower, upper))
 
-        players_found = []
+        return player_pool.filter(now_cost__gt=lower, now_cost__lt=upper)
 
-        for player in player_pool:
-            if (lower <= player.now_cost and include_boundaries) or (lower < player.now_cost):
-                if (player.now_cost <= upper and include_boundaries) or (player.now_cost < upper):
-                    players_found.append(player)
 
-        return ElementGroup[_player](players_found)
+# Columns of the properties above, for sorts and filters of every player, see `_Element.derive()`
+_Player.derive("goal_contributions", ("goals_scored", "assists"), lambda goals, assists: goals + assists)
+_Player.derive("ppm", ("total_points", "now_cost"),
+               lambda points, cost: [round_value(ppm) for ppm in (points / cost).tolist()])  # Rounded the same as `ppm`
+_Player.derive("transfer_diff", ("transfers_in_event", "transfers_out_event"), lambda in_, out: in_ - out)
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class BasePlayer(_Player["BasePlayer"]):
     """Independent Player element, not linked to any other FPL elements.
     """
@@ -199,32 +194,16 @@ class BasePlayer(_Player["BasePlayer"]):
     element_type: int = field(hash=False, compare=False)
 
     def in_full(self) -> BasePlayerFullDf:
-        return BasePlayerFullDf.from_player_id(self.id)
-
+        from .playerfulldf import BasePlayerFullDf
 
-class BasePlayerHistoryDf(_PlayerHistoryDf):
-    @classmethod
-    def from_api(cls, api_data: list[dict[str, Any]]) -> BasePlayerHistoryDf:
-        out: BasePlayerHistoryDf = super().from_api(api_data)
-
-        return out
-
-
-class BasePlayerHistoryPastDf(_PlayerHistoryPastDf):
-    @classmethod
-    def from_api(cls, api_data: list[dict[str, Any]]) -> BasePlayerHistoryPastDf:
-        out: BasePlayerHistoryPastDf = super().from_api(api_data)
-
-        return out
+        return BasePlayerFullDf.from_player_id(self.id)
 
 
-class BasePlayerFullDf(_PlayerFull[BasePlayerHistoryDf, BasePlayerHistoryPastDf]):
-    @classmethod
-    def from_player_id(cls, player_id: int) -> BasePlayerFullDf:
-        data = cls.get_api(player_id)
+def __getattr__(name: str) -> Any:
+    # DataFrame classes moved to `playerfulldf`, so pandas is only imported when needed
+    if name in ("BasePlayerHistoryDf", "BasePlayerHistoryPastDf", "BasePlayerFullDf"):
+        from . import playerfulldf
 
-        history = BasePlayerHistoryDf.from_api(data["history"])
-        history_past = BasePlayerHistoryPastDf.from_api(
-            data["history_past"])
+        return getattr(playerfulldf, name)
 
-        return BasePlayerFullDf(history, history_past)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,13 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Any
+from typing import TYPE_CHECKING, Iterable, Optional, TypeVar, Generic, Any, Union
+from concurrent.futures import ThreadPoolExecutor
 from ..constants import URLS
 from ..util import API
-import pandas as pd
+from ..util.ratelimit import TokenBucket
+
+if TYPE_CHECKING:
+    from .playerfulldf import _PlayerHistoryDf, _PlayerHistoryPastDf
 
 
 _player_history = TypeVar("_player_history", bound="_PlayerHistoryDf")
@@ -11,77 +15,6 @@ _player_history_past = TypeVar(
     "_player_history_past", bound="_PlayerHistoryPastDf")
 
 
-class _PlayerStatsDf(ABC, pd.DataFrame):
-    @classmethod
-    def _edit_stat_from_api(cls, field: str, attr_list: list[Any]) -> list[Any]:
-        """Pre-format API data before passing it into the class.
-
-        Like '__pre__init__()' from 'Element'.
-
-        Parameters
-        ----------
-        field : str
-            Attribute from class to create.
-        attr_list : list[Any]
-            Attribute values for `field`.
-
-        Returns
-        -------
-        list[Any]
-            Formatted `attr_list`.
-        """
-        return attr_list
-
-    @classmethod
-    def from_api(cls, api_data: list[dict[str, Any]]) -> Any:
-        """Converts data from API to a `_PlayerStatsDf` object.
-
-        Parameters
-        ----------
-        api_data : list[dict[str, Any]]
-            API data in JSON form.
-
-        Returns
-        -------
-        _PlayerStatsDf
-            Object containing `api_data`.
-        """
-
-        as_df = pd.json_normalize(api_data)
-
-        for col in as_df:
-            as_df[col] = cls._edit_stat_from_api(col, list(as_df[col]))
-
-        return cls(as_df)
-
-    @classmethod
-    @property
-    @abstractmethod
-    def unique_id_col(cls) -> str:
-        """The field that identifies each different data entry, e.g. fixture.
-
-        Returns
-        -------
-        str
-            Name of field.
-        """
-        return ""
-
-
-class _PlayerHistoryDf(_PlayerStatsDf):
-    @classmethod
-    @property
-    def unique_id_col(cls) -> str:
-        return "fixture"
-
-
-class _PlayerHistoryPastDf(_PlayerStatsDf):
-    @classmethod
-    @property
-    def unique_id_col(cls) -> str:
-        return "season_name"
-
-
 class _PlayerFull(ABC, Generic[_player_history, _player_history_past]):
     """Game by game, season by season data for a player, unlinked from other FPL elements.
     """
@@ -141,6 +74,113 @@ class _PlayerFull(ABC, Generic[_player_history, _player_history_past]):
 
         return output
 
+    @classmethod
+    def get_api_bulk(
+            cls, player_ids: Iterable[int], *,
+            concurrency: int = 8, rate: float = 20.0) -> dict[int, Union[dict[str, Any], Exception]]:
+        """Get element summaries for many players at once, using a pool of threads.
+
+        Parameters
+        ----------
+        player_ids : Iterable[int]
+            Unique IDs of players to get data for.
+        concurrency : int, optional
+            Maximum requests in progress at once, by default 8
+        rate : float, optional
+            Maximum average requests started per second, by default 20.0
+
+        Returns
+        -------
+        dict[int, Union[dict[str, Any], Exception]]
+            Element summary by player ID. If a player fails, the exception raised
+            is stored instead, so one player does not stop the others.
+        """
+        bucket = TokenBucket(rate, capacity=concurrency)
+
+        def get_one(player_id: int) -> dict[str, Any]:
+            bucket.acquire()
+            return cls.get_api(player_id)
+
+        player_ids = list(dict.fromkeys(player_ids))  # Remove duplicates, keeping order
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {player_id: executor.submit(get_one, player_id) for player_id in player_ids}
+
+        output: dict[int, Union[dict[str, Any], Exception]] = {}
+        for player_id, future in futures.items():
+            exception = future.exception()
+
+            if isinstance(exception, Exception):
+                output[player_id] = exception
+            else:
+                output[player_id] = future.result()
+
+        return output
+
     @classmethod
     @abstractmethod
-    def from_player_id(cls, player_id: int) -> Any: ...
+    def from_api(cls, api_data: dict[str, Any]) -> Any:
+        """Converts an element summary to a `_PlayerFull` object.
+
+        Parameters
+        ----------
+        api_data : dict[str, Any]
+            Element summary, from `get_api()`.
+
+        Returns
+        -------
+        _PlayerFull
+            Object containing `api_data`.
+        """
+        ...
+
+    @classmethod
+    def from_player_id(cls, player_id: int) -> Any:
+        return cls.from_api(cls.get_api(player_id))
+
+    @classmethod
+    def from_player_ids(
+            cls, player_ids: Iterable[int], *, concurrency: int = 8, rate: float = 20.0,
+            errors: Optional[dict[int, Exception]] = None) -> dict[int, Any]:
+        """Game by game, season by season data for many players, downloaded concurrently.
+
+        Parameters
+        ----------
+        player_ids : Iterable[int]
+            Unique IDs of players to get data for.
+        concurrency : int, optional
+            Maximum requests in progress at once, by default 8
+        rate : float, optional
+            Maximum average requests started per second, by default 20.0
+        errors : Optional[dict[int, Exception]], optional
+            If passed, filled with the exception for each player that failed, by default None
+
+        Returns
+        -------
+        dict[int, _PlayerFull]
+            Data by player ID. Players that failed are left out.
+        """
+        all_data = cls.get_api_bulk(player_ids, concurrency=concurrency, rate=rate)
+        output: dict[int, Any] = {}
+
+        for player_id, data in all_data.items():
+            try:
+                if isinstance(data, Exception):
+                    raise data
+
+                output[player_id] = cls.from_api(data)
+            except Exception as e:
+                if errors is not None:
+                    errors[player_id] = e
+
+        return output
+
+
+def __getattr__(name: str) -> Any:
+    # DataFrame classes moved to `playerfulldf`, so pandas is only imported when needed
+    if name in ("_PlayerStatsDf", "_PlayerHistoryDf", "_PlayerHistoryPastDf"):
+        from . import playerfulldf
+
+        return getattr(playerfulldf, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
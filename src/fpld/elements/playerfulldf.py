@@ -0,0 +1,171 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional, Any
+import pandas as pd
+from .playerfull import _PlayerFull
+from .fplelems import Fixture, Team
+
+
+class _PlayerStatsDf(ABC, pd.DataFrame):
+    @classmethod
+    def _edit_stat_from_api(cls, field: str, attr_list: list[Any]) -> list[Any]:
+        """Pre-format API data before passing it into the class.
+
+        Like '__pre__init__()' from 'Element'.
+
+        Parameters
+        ----------
+        field : str
+            Attribute from class to create.
+        attr_list : list[Any]
+            Attribute values for `field`.
+
+        Returns
+        -------
+        list[Any]
+            Formatted `attr_list`.
+        """
+        return attr_list
+
+    @classmethod
+    def from_api(cls, api_data: list[dict[str, Any]]) -> Any:
+        """Converts data from API to a `_PlayerStatsDf` object.
+
+        Parameters
+        ----------
+        api_data : list[dict[str, Any]]
+            API data in JSON form.
+
+        Returns
+        -------
+        _PlayerStatsDf
+            Object containing `api_data`.
+        """
+
+        as_df = pd.json_normalize(api_data)
+
+        for col in as_df:
+            as_df[col] = cls._edit_stat_from_api(col, list(as_df[col]))
+
+        return cls(as_df)
+
+    @classmethod
+    @property
+    @abstractmethod
+    def unique_id_col(cls) -> str:
+        """The field that identifies each different data entry, e.g. fixture.
+
+        Returns
+        -------
+        str
+            Name of field.
+        """
+        return ""
+
+
+class _PlayerHistoryDf(_PlayerStatsDf):
+    @classmethod
+    @property
+    def unique_id_col(cls) -> str:
+        return "fixture"
+
+
+class _PlayerHistoryPastDf(_PlayerStatsDf):
+    @classmethod
+    @property
+    def unique_id_col(cls) -> str:
+        return "season_name"
+
+
+class BasePlayerHistoryDf(_PlayerHistoryDf):
+    @classmethod
+    def from_api(cls, api_data: list[dict[str, Any]]) -> BasePlayerHistoryDf:
+        out: BasePlayerHistoryDf = super().from_api(api_data)
+
+        return out
+
+
+class BasePlayerHistoryPastDf(_PlayerHistoryPastDf):
+    @classmethod
+    def from_api(cls, api_data: list[dict[str, Any]]) -> BasePlayerHistoryPastDf:
+        out: BasePlayerHistoryPastDf = super().from_api(api_data)
+
+        return out
+
+
+class BasePlayerFullDf(_PlayerFull[BasePlayerHistoryDf, BasePlayerHistoryPastDf]):
+    @classmethod
+    def from_api(cls, api_data: dict[str, Any]) -> BasePlayerFullDf:
+        history = BasePlayerHistoryDf.from_api(api_data["history"])
+        history_past = BasePlayerHistoryPastDf.from_api(
+            api_data["history_past"])
+
+        return BasePlayerFullDf(history, history_past)
+
+    @classmethod
+    def from_player_id(cls, player_id: int) -> BasePlayerFullDf:
+        out: BasePlayerFullDf = super().from_player_id(player_id)
+
+        return out
+
+    @classmethod
+    def from_player_ids(
+            cls, player_ids: Iterable[int], *, concurrency: int = 8, rate: float = 20.0,
+            errors: Optional[dict[int, Exception]] = None) -> dict[int, BasePlayerFullDf]:
+        out: dict[int, BasePlayerFullDf] = super().from_player_ids(
+            player_ids, concurrency=concurrency, rate=rate, errors=errors)
+
+        return out
+
+
+class PlayerHistoryDf(_PlayerHistoryDf):
+    @classmethod
+    def _edit_stat_from_api(cls, field: str, attr_list: list[Any]) -> list[Any]:
+        if field == "fixture":
+            attr_list = [Fixture.get_by_id(id_) for id_ in attr_list]
+        elif field == "opponent_team":
+            attr_list = [Team.get_by_id(id_) for id_ in attr_list]
+
+        return attr_list
+
+    @classmethod
+    def from_api(cls, api_data: list[dict[str, Any]]) -> PlayerHistoryDf:
+        out: PlayerHistoryDf = super().from_api(api_data)
+
+        return out
+
+
+class PlayerHistoryPastDf(_PlayerHistoryPastDf):
+    @classmethod
+    def from_api(cls, api_data: list[dict[str, Any]]) -> PlayerHistoryPastDf:
+        out: PlayerHistoryPastDf = super().from_api(api_data)
+
+        return out
+
+
+class PlayerFullDf(_PlayerFull[PlayerHistoryDf, PlayerHistoryPastDf]):
+    """Game by game, season by season data for a player, linked to other FPL elements.
+    """
+
+    @classmethod
+    def from_api(cls, api_data: dict[str, Any]) -> PlayerFullDf:
+        history = PlayerHistoryDf.from_api(api_data["history"])
+        history_past = PlayerHistoryPastDf.from_api(
+            api_data["history_past"])
+
+        return PlayerFullDf(history, history_past)
+
+    @classmethod
+    def from_player_id(cls, player_id: int) -> PlayerFullDf:
+        out: PlayerFullDf = super().from_player_id(player_id)
+
+        return out
+
+    @classmethod
+    def from_player_ids(
+            cls, player_ids: Iterable[int], *, concurrency: int = 8, rate: float = 20.0,
+            errors: Optional[dict[int, Exception]] = None) -> dict[int, PlayerFullDf]:
+        out: dict[int, PlayerFullDf] = super().from_player_ids(
+            player_ids, concurrency=concurrency, rate=rate, errors=errors)
+
+        return out
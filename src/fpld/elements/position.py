@@ -1,12 +1,12 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
-from ..util import API
+from ..util import BOOTSTRAP_STATIC
 from ..constants import URLS
 from .element import _Element, IDMatchesZeroElements, id_uniqueness_check
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class Position(_Element["Position"]):
     """Position for FPL player. E.g. 'Midfielder'.
 
@@ -33,9 +33,7 @@ class Position(_Element["Position"]):
 
     @classmethod
     def get_latest_api(cls) -> list[dict[str, Any]]:
-        api = API(cls.api_link())
-
-        data_from_api: list[dict[str, Any]] = api.data["element_types"]
+        data_from_api: list[dict[str, Any]] = BOOTSTRAP_STATIC.section("element_types")
 
         return data_from_api
 
@@ -0,0 +1,409 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+import operator
+from types import CodeType
+from typing import Any, Callable, Iterable, Optional, Union
+from . import element as element_module  # Module, not class, as `element` imports this module
+
+
+OPERATORS = ("eq", "in", "ne", "gt", "ge", "lt", "le", "between")
+
+
+@dataclass(frozen=True)
+class Condition:
+    """One condition of a query, parsed from a keyword argument.
+
+    `attr=value` and `attr=(value1, value2)` mean equal to any value.
+    Other operators are added to the attribute with a double underscore, e.g. `now_cost__between=(45, 80)`.
+    """
+    attr: str
+    operator: str
+    values: tuple[Any, ...]
+
+    @classmethod
+    def parse(cls, key: str, value: Any) -> Condition:
+        """Create a condition from a keyword argument of a query.
+
+        Parameters
+        ----------
+        key : str
+            Attribute, with an optional operator, e.g. 'form__gt'.
+        value : Any
+            Value to compare with. A tuple for 'in', 'between' and plain equality.
+
+        Returns
+        -------
+        Condition
+            Parsed condition. Elements in `value` are replaced by their unique ID.
+
+        Raises
+        ------
+        ValueError
+            If 'between' is not given a (lower, upper) pair.
+        """
+        attr, sep, operator = key.rpartition("__")
+
+        if sep == "" or operator not in OPERATORS:
+            attr, operator = key, "eq"
+
+        values = tuple(value) if isinstance(value, tuple) else (value,)
+        values = tuple(comparable(value) for value in values)
+
+        if operator == "eq":
+            operator = "in"
+        if operator == "between" and len(values) != 2:
+            raise ValueError(f"'{key}' must be a (lower, upper) pair.")
+        if operator not in ("in", "between") and len(values) != 1:
+            raise ValueError(f"'{key}' takes a single value.")
+
+        return cls(attr, operator, values)
+
+    def expression(self, name: str, namespace: dict[str, Any], fields: Optional[dict[str, Optional[str]]] = None) -> str:
+        """Python source testing the condition against `elem`, for `compile_predicate()`.
+
+        Parameters
+        ----------
+        name : str
+            Unique name for this condition's variables, which are added to `namespace`.
+        namespace : dict[str, Any]
+            Globals the source will be evaluated with.
+        fields : Optional[dict[str, Optional[str]]], optional
+            Fields of `elem`, see `field_ids()`, by default None to check the type of every value.
+
+        Returns
+        -------
+        str
+            Boolean expression.
+
+        Raises
+        ------
+        AttributeError
+            If `attr` cannot be an attribute name.
+        """
+        self.__check_attr()
+        read = f"{name} := elem.{self.attr}"
+        value = self.__convert(name, f"({read})", fields)
+
+        return self.__compare(name, f"({read})" if value is None else f"({name} := ({value}))", namespace)
+
+    def clauses(self, name: str, namespace: dict[str, Any],
+                fields: Optional[dict[str, Optional[str]]] = None) -> tuple[str, str]:
+        """Python source reading the attribute of `elem` into `name` in a comprehension, and testing it,
+        for `compile_filter()`.
+
+        The attribute is bound by `for name in [elem.attr]`, not `:=`, which would make `name`
+        a variable of the function around the comprehension, slower to read and write.
+
+        Parameters
+        ----------
+        name : str
+            Unique name for this condition's variables, which are added to `namespace`.
+        namespace : dict[str, Any]
+            Globals the source will be evaluated with.
+        fields : Optional[dict[str, Optional[str]]], optional
+            Fields of `elem`, see `field_ids()`, by default None to check the type of every value.
+
+        Returns
+        -------
+        tuple[str, str]
+            `for` clauses, and boolean expression.
+
+        Raises
+        ------
+        AttributeError
+            If `attr` cannot be an attribute name.
+        """
+        self.__check_attr()
+        read = f"for {name} in [elem.{self.attr}]"
+        value = self.__convert(name, name, fields)
+
+        if value is not None:
+            read += f" for {name} in [{value}]"
+
+        return read, self.__compare(name, name, namespace)
+
+    def test(self, value: Any) -> bool:
+        """Whether a single value meets the condition, the same as the source from `expression()`.
+
+        Parameters
+        ----------
+        value : Any
+            Value of the attribute, elements already swapped for their unique ID.
+
+        Returns
+        -------
+        bool
+            True if the condition is met.
+
+        Raises
+        ------
+        TypeError
+            If `value` cannot be compared with the condition's values.
+        """
+        if self.operator == "in":
+            return value in self.values
+        if self.operator == "ne":
+            return bool(value != self.values[0])
+        if value is None:
+            return False
+        if self.operator == "between":
+            return bool(self.values[0] <= value <= self.values[1])
+
+        return bool(COMPARISONS[self.operator](value, self.values[0]))
+
+    def positions(self, sorted_values: list[Any], sorted_positions: list[int]) -> list[int]:
+        """Positions meeting a range condition, found by binary search of a sorted index.
+
+        Parameters
+        ----------
+        sorted_values : list[Any]
+            Values of the attribute in ascending order, with None left out.
+        sorted_positions : list[int]
+            Position of the element each value came from.
+
+        Returns
+        -------
+        list[int]
+            Positions of elements meeting the condition.
+        """
+        lower, upper = 0, len(sorted_values)
+
+        if self.operator == "between":
+            lower = bisect_left(sorted_values, self.values[0])
+            upper = bisect_right(sorted_values, self.values[1])
+        elif self.operator == "gt":
+            lower = bisect_right(sorted_values, self.values[0])
+        elif self.operator == "ge":
+            lower = bisect_left(sorted_values, self.values[0])
+        elif self.operator == "lt":
+            upper = bisect_left(sorted_values, self.values[0])
+        elif self.operator == "le":
+            upper = bisect_right(sorted_values, self.values[0])
+
+        return sorted_positions[lower:upper]
+
+    def __convert(self, name: str, read: str, fields: Optional[dict[str, Optional[str]]]) -> Optional[str]:
+        """Source swapping the value in `name`, first evaluated at `read`, for the value compared,
+        None if the value is compared as it is.
+        """
+        if fields is None or self.attr not in fields:
+            return f"{name} if type({read}) in _SCALAR_TYPES else _comparable({name})"
+
+        id_attr = fields[self.attr]
+        if id_attr is None:
+            return None
+
+        return f"None if {read} is None else {name}.{id_attr}"  # Linked element, by its unique ID
+
+    def __check_attr(self) -> None:
+        if not self.attr.isidentifier():
+            raise AttributeError(f"'{self.attr}' is not an attribute.")
+
+    def __compare(self, name: str, value: str, namespace: dict[str, Any]) -> str:
+        """Source comparing `value`, which sets `name`, to the condition's values, added to `namespace`.
+        """
+        if self.operator == "in":
+            namespace[f"{name}_values"] = self.values
+            return f"({value} in {name}_values)"
+
+        if self.operator == "between":
+            namespace[f"{name}_lower"], namespace[f"{name}_upper"] = self.values
+            return f"({value} is not None and {name}_lower <= {name} <= {name}_upper)"
+
+        namespace[f"{name}_other"] = self.values[0]
+        symbol = _SYMBOLS[self.operator]
+
+        if self.operator == "ne":
+            return f"({value} {symbol} {name}_other)"
+
+        return f"({value} is not None and {name} {symbol} {name}_other)"
+
+
+_SYMBOLS = {"ne": "!=", "gt": ">", "ge": ">=", "lt": "<", "le": "<="}
+COMPARISONS: dict[str, Callable[[Any, Any], Any]] = {"gt": operator.gt, "ge": operator.ge, "lt": operator.lt, "le": operator.le}
+_SCALAR_TYPES = frozenset((int, float, str, bool, type(None)))  # Never elements, so `comparable()` can be skipped
+_PLAIN_TYPES = frozenset(("int", "float", "str", "bool", "Optional[int]", "Optional[float]", "Optional[str]", "Optional[bool]"))
+
+
+def parse_conditions(attr_to_value: dict[str, Union[Any, tuple[Any, ...]]]) -> list[Condition]:
+    """Parse every keyword argument of a query.
+
+    Parameters
+    ----------
+    attr_to_value : dict[str, Union[Any, tuple[Any, ...]]]
+        Query, e.g. `{"team": 1, "now_cost__lt": 60}`.
+
+    Returns
+    -------
+    list[Condition]
+        One condition per keyword argument.
+    """
+    return [Condition.parse(key, value) for key, value in attr_to_value.items()]
+
+
+def compile_predicate(conditions: Iterable[Condition], func: Callable[[Iterable[bool]], bool],
+                      fields: Optional[dict[str, Optional[str]]] = None) -> Callable[[Any], bool]:
+    """Combine conditions into one predicate, compiled once per query.
+
+    Parameters
+    ----------
+    conditions : Iterable[Condition]
+        Conditions to test.
+    func : Callable[[Iterable[bool]], bool]
+        `all` or `any`.
+    fields : Optional[dict[str, Optional[str]]], optional
+        Fields of the elements, see `field_ids()`, by default None
+
+    Returns
+    -------
+    Callable[[Any], bool]
+        True if the element meets all (or any) of the conditions.
+    """
+    namespace = _namespace()
+    expressions = [condition.expression(f"_{i}", namespace, fields) for i, condition in enumerate(conditions)]
+    predicate: Callable[[Any], bool] = _compile(f"lambda elem: {_join(expressions, func)}", namespace)
+
+    return predicate
+
+
+def compile_filter(conditions: Iterable[Condition], func: Callable[[Iterable[bool]], bool],
+                   fields: Optional[dict[str, Optional[str]]] = None) -> Callable[[Iterable[Any]], list[Any]]:
+    """Combine conditions into one function that filters a sequence of elements.
+
+    The conditions are written into the source of a single list comprehension,
+    so there is no function call per element, like a hand-written loop.
+    Fields in `fields` are compared as read, or by the ID of their linked element, also like a hand-written loop.
+
+    Parameters
+    ----------
+    conditions : Iterable[Condition]
+        Conditions to test.
+    func : Callable[[Iterable[bool]], bool]
+        `all` or `any`.
+    fields : Optional[dict[str, Optional[str]]], optional
+        Fields of the elements, see `field_ids()`, by default None
+
+    Returns
+    -------
+    Callable[[Iterable[Any]], list[Any]]
+        Takes elements, returns those meeting all (or any) of the conditions, in order.
+    """
+    namespace = _namespace()
+    clauses = [condition.clauses(f"_{i}", namespace, fields) for i, condition in enumerate(conditions)]
+
+    if func is all:  # Each test straight after its read, so later attributes are only read if earlier tests pass
+        source = "".join(f" {read} if {test}" for read, test in clauses)
+    else:
+        source = "".join(f" {read}" for read, _ in clauses) + f" if {_join([test for _, test in clauses], func)}"
+
+    filter_: Callable[[Iterable[Any]], list[Any]] = _compile(f"lambda elems: [elem for elem in elems{source}]", namespace)
+
+    return filter_
+
+
+def filter_for(conditions: Iterable[Condition], func: Callable[[Iterable[bool]], bool],
+               elem: Any) -> Callable[[Iterable[Any]], list[Any]]:
+    """`compile_filter()` for elements of the same class as `elem`, with `field_ids()` of that class,
+    reused by later queries with equal conditions.
+
+    Parameters
+    ----------
+    conditions : Iterable[Condition]
+        Conditions to test.
+    func : Callable[[Iterable[bool]], bool]
+        `all` or `any`.
+    elem : Any
+        Element of the class to filter, None if there are no elements.
+
+    Returns
+    -------
+    Callable[[Iterable[Any]], list[Any]]
+        Takes elements, returns those meeting all (or any) of the conditions, in order.
+    """
+    conditions = tuple(conditions)
+
+    try:
+        hash(conditions)
+    except TypeError:  # Values that cannot be hashed, e.g. lists, compiled every time
+        return compile_filter(conditions, func, field_ids(elem))
+
+    cls: Any = type(elem)
+
+    return _filter_for(conditions, func, cls)
+
+
+@lru_cache(maxsize=256)
+def _filter_for(conditions: tuple[Condition, ...], func: Callable[[Iterable[bool]], bool],
+                cls: Any) -> Callable[[Iterable[Any]], list[Any]]:
+    fields = _field_ids(cls) if issubclass(cls, element_module._Element) else None
+
+    return compile_filter(conditions, func, fields)
+
+
+def field_ids(elem: Any) -> Optional[dict[str, Optional[str]]]:
+    """Fields of an element's class, with the unique ID attribute of the class each linked field holds.
+
+    Parameters
+    ----------
+    elem : Any
+        Element of the class to check.
+
+    Returns
+    -------
+    Optional[dict[str, Optional[str]]]
+        E.g. `{"team": "id", "web_name": None, ...}`, with fields of other types left out,
+        None if `elem` is not an element.
+    """
+    if not isinstance(elem, element_module._Element):
+        return None
+
+    return _field_ids(type(elem))
+
+
+@lru_cache(maxsize=None)
+def _field_ids(cls: Any) -> dict[str, Optional[str]]:
+    linked = cls.linked_fields()
+    ids = {name: field.linked_class.UNIQUE_ID_COL for name, field in linked.items()}
+
+    for name, field in getattr(cls, "__dataclass_fields__", {}).items():
+        if getattr(field.type, "__name__", field.type) in _PLAIN_TYPES:  # Annotations may be strings
+            ids[name] = None
+
+    return ids
+
+
+def _namespace() -> dict[str, Any]:
+    return {"_comparable": comparable, "_SCALAR_TYPES": _SCALAR_TYPES}
+
+
+def _join(tests: list[str], func: Callable[[Iterable[bool]], bool]) -> str:
+    """Source combining boolean expressions with `all` or `any`.
+    """
+    if len(tests) == 0:
+        return str(func(()))  # all() of nothing is True, any() is False
+
+    return (" and " if func is all else " or ").join(tests)
+
+
+def _compile(source: str, namespace: dict[str, Any]) -> Any:
+    """Evaluate the source of a query function with the conditions' values in `namespace`.
+    """
+    return eval(_compile_source(source), namespace)
+
+
+@lru_cache(maxsize=256)
+def _compile_source(source: str) -> CodeType:
+    """Compiled code for a query, reused by queries of the same shape with different values.
+    """
+    return compile(source, "<query>", "eval")
+
+
+def comparable(value: Any) -> Any:
+    """Value used in queries, elements are compared by unique ID.
+    """
+    if isinstance(value, element_module._Element):
+        return value.unique_id
+
+    return value
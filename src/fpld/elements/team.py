@@ -1,6 +1,6 @@
 from typing import TypeVar, Generic, Any
 from .element import _Element
-from ..util import API
+from ..util import BOOTSTRAP_STATIC
 from ..constants import URLS
 from dataclasses import dataclass, field
 
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 _team = TypeVar("_team", bound="BaseTeam[Any]")
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class BaseTeam(_Element[_team], Generic[_team]):
     """Element for team in the Premier League, unlinked from other FPL elements.
     """
@@ -41,9 +41,7 @@ class BaseTeam(_Element[_team], Generic[_team]):
 
     @classmethod
     def get_latest_api(cls) -> list[dict[str, Any]]:
-        api = API(cls.api_link())
-
-        data_from_api: list[dict[str, Any]] = api.data["teams"]
+        data_from_api: list[dict[str, Any]] = BOOTSTRAP_STATIC.section("teams")
 
         return data_from_api
 
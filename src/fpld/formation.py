@@ -82,7 +82,7 @@ class Formation:
         For a 5-4-1 formation,
         ```
                                 'Iversen'
-        'CanÃ³s' 'Johnson' 'Colwill' 'Dunk' 'Varane'
+        'Canós' 'Johnson' 'Colwill' 'Dunk' 'Varane'
                        'Sancho' 'Martinelli'
                'Bamford' 'Haaland' 'Firmino'
         ```
@@ -1,8 +1,8 @@
 from __future__ import annotations
+from typing import Any
 from ..elements.element import ElementGroup
 from ..elements import Player, Position
-from ..constants import URLS
-from ..util.external import API
+from ..util.external import BOOTSTRAP_STATIC
 from pulp import LpProblem, lpSum, LpMaximize, LpVariable
 
 
@@ -12,9 +12,18 @@ class FPLSquadSettings:
     E.g. squad size, and squad team limit.
     """
 
-    def __init__(self):
-        api = API(URLS["BOOTSTRAP-STATIC"])
-        self.__game_settings = api.data["game_settings"]
+    @property
+    def _game_settings(self) -> dict[str, Any]:
+        """Game settings from bootstrap-static, downloaded on first use rather than on import.
+
+        Returns
+        -------
+        dict[str, Any]
+            Rules for the current season.
+        """
+        game_settings: dict[str, Any] = BOOTSTRAP_STATIC.data["game_settings"]
+
+        return game_settings
 
     @property
     def squad_size(self) -> int:
@@ -25,7 +34,7 @@ class FPLSquadSettings:
         int
             Number of allowed players in both the starting team and bench.
         """
-        squad_size: int = int(self.__game_settings["squad_squadsize"])
+        squad_size: int = int(self._game_settings["squad_squadsize"])
 
         return squad_size
 
@@ -38,7 +47,7 @@ class FPLSquadSettings:
         int
             Number of players allowed in starting team (11).
         """
-        starting_size: int = int(self.__game_settings["squad_squadplay"])
+        starting_size: int = int(self._game_settings["squad_squadplay"])
 
         return starting_size
 
@@ -51,7 +60,7 @@ class FPLSquadSettings:
         int
             Number of players allowed per club.
         """
-        team_limit: int = int(self.__game_settings["squad_team_limit"])
+        team_limit: int = int(self._game_settings["squad_team_limit"])
 
         return team_limit
 
@@ -307,8 +316,10 @@ class SquadConstraints:
         Exception
             If a player in `required_players` is not in the player pool.
         """
+        player_pool = self.__lp_squad.player_pool
+
         for player in required_players:
-            if player not in self.__lp_squad.player_pool:
+            if player not in player_pool:
                 raise Exception("Required player not in pool")
 
             var = self.__lp_squad.player_lp_variable(player)
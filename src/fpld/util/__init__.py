@@ -1,3 +1,18 @@
-from .external import API
+from typing import Any
+from .external import API, BootstrapStatic, BOOTSTRAP_STATIC
+from .cache import HTTPCache
+from .querycache import QueryCache
+from .snapshot import Snapshot, SnapshotError
+from .ratelimit import TokenBucket
 from .attribute import all_attributes_present, all_field_names, Percentile
-from .percent import to_percent
+from .percent import to_percent, to_group_percents
+
+
+def __getattr__(name: str) -> Any:
+    # `FPLSession` needs `requests`, only imported when first used
+    if name == "FPLSession":
+        from .session import FPLSession
+
+        return FPLSession
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
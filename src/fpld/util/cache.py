@@ -0,0 +1,258 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Optional
+from hashlib import sha256
+from json import dumps, loads
+from threading import Lock
+from time import time
+import os
+from ..constants import URLS
+
+if TYPE_CHECKING:
+    import requests
+
+
+DEFAULT_TTL = {
+    "BOOTSTRAP-STATIC": 5 * 60,  # Prices, news and transfers change during the day
+    "FIXTURES": 30 * 60,
+    "ELEMENT-SUMMARY": 60 * 60
+}  # Seconds a stored response is used before it is revalidated
+
+
+class HTTPCache:
+    """Stores responses from the FPL API on disk, keyed by URL.
+
+    A stored response is used as it is until its TTL runs out.
+    After that, it is revalidated with a conditional request
+    (`If-None-Match` / `If-Modified-Since`), so an unchanged body is never downloaded twice.
+    If the server answers the revalidation with an error (e.g. 429 or 503), the stored response is used.
+    Counters are safe to update from several threads, as in `get_api_bulk()`.
+
+    Example
+    -------
+    ```
+    > API.cache = HTTPCache("~/.cache/fpld")
+    > API(URLS["BOOTSTRAP-STATIC"])  # Miss, downloads and stores response
+    > API(URLS["BOOTSTRAP-STATIC"])  # Hit, read from disk
+    ```
+    """
+
+    def __init__(self, directory: str, ttl: Optional[dict[str, float]] = None, default_ttl: float = 0.0):
+        self.__directory = os.path.expanduser(directory)
+        self.__ttl = DEFAULT_TTL if ttl is None else ttl
+        self.__default_ttl = default_ttl
+        self.__hits = 0
+        self.__misses = 0
+        self.__revalidated = 0
+        self.__stale = 0
+        self.__counts_lock = Lock()
+
+        os.makedirs(self.__directory, exist_ok=True)
+
+    def __str__(self) -> str:
+        return f"HTTPCache(hits={self.hits}, misses={self.misses}, revalidated={self.revalidated}, stale={self.stale})"
+
+    @property
+    def directory(self) -> str:
+        """Folder responses are stored in.
+
+        Returns
+        -------
+        str
+            Absolute or relative path, with '~' expanded.
+        """
+        return self.__directory
+
+    @property
+    def hits(self) -> int:
+        """Responses read from disk without contacting the server.
+
+        Returns
+        -------
+        int
+            Number of hits.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Responses that had to be downloaded in full.
+
+        Returns
+        -------
+        int
+            Number of misses.
+        """
+        return self.__misses
+
+    @property
+    def revalidated(self) -> int:
+        """Stored responses confirmed as unchanged by the server (304 Not Modified).
+
+        Returns
+        -------
+        int
+            Number of revalidated responses.
+        """
+        return self.__revalidated
+
+    @property
+    def stale(self) -> int:
+        """Expired responses used because the server answered their revalidation with an error.
+
+        Returns
+        -------
+        int
+            Number of stale responses used.
+        """
+        return self.__stale
+
+    def ttl_for(self, url: str) -> float:
+        """Time to live for a URL, by the endpoint in `URLS` it belongs to.
+
+        Parameters
+        ----------
+        url : str
+            URL to find TTL for.
+
+        Returns
+        -------
+        float
+            Seconds, `default_ttl` if the URL does not match an endpoint in `ttl`.
+        """
+        for endpoint, ttl in self.__ttl.items():
+            url_stem = URLS[endpoint].split("{}")[0]
+
+            if url.startswith(url_stem):
+                return ttl
+
+        return self.__default_ttl
+
+    def get(self, url: str, session: Optional[requests.Session] = None) -> bytes:
+        """Get the body of a response, from disk if possible.
+
+        Parameters
+        ----------
+        url : str
+            URL to get.
+        session : Optional[requests.Session], optional
+            Session to send requests with, by default None (`requests.get()`)
+
+        Returns
+        -------
+        bytes
+            Body of the response.
+        """
+        meta = self.__load_meta(url)
+
+        if meta is not None and time() - meta["stored_at"] < self.ttl_for(url):
+            with self.__counts_lock:
+                self.__hits += 1
+            return self.__load_body(url)
+
+        headers = {}
+        if meta is not None:
+            if meta["etag"] is not None:
+                headers["If-None-Match"] = meta["etag"]
+            if meta["last_modified"] is not None:
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        if session is None:
+            import requests
+            response = requests.get(url, headers=headers)
+        else:
+            response = session.get(url, headers=headers)
+
+        if meta is not None and response.status_code == 304:
+            with self.__counts_lock:
+                self.__revalidated += 1
+            meta["stored_at"] = time()
+            self.__save_meta(url, meta)
+
+            return self.__load_body(url)
+
+        if meta is not None and response.status_code != 200:  # Kept expired, so the next request revalidates again
+            with self.__counts_lock:
+                self.__stale += 1
+
+            return self.__load_body(url)
+
+        with self.__counts_lock:
+            self.__misses += 1
+
+        content: bytes = response.content
+
+        if response.status_code == 200:
+            self.__save(url, content, response.headers)
+
+        return content
+
+    def clear(self) -> None:
+        """Delete all stored responses and reset counters.
+        """
+        for file_name in os.listdir(self.__directory):
+            os.remove(os.path.join(self.__directory, file_name))
+
+        with self.__counts_lock:
+            self.__hits = 0
+            self.__misses = 0
+            self.__revalidated = 0
+            self.__stale = 0
+
+    def __path(self, url: str, extension: str) -> str:
+        key = sha256(url.encode("utf8")).hexdigest()
+
+        return os.path.join(self.__directory, key + extension)
+
+    def __load_meta(self, url: str) -> Optional[dict[str, Any]]:
+        try:
+            with open(self.__path(url, ".json"), "r", encoding="utf8") as f:
+                meta: dict[str, Any] = loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+        if meta.get("url") != url or not os.path.exists(self.__path(url, ".body")):
+            return None
+
+        return meta
+
+    def __load_body(self, url: str) -> bytes:
+        with open(self.__path(url, ".body"), "rb") as f:
+            return f.read()
+
+    def __save(self, url: str, content: bytes, headers: Any) -> None:
+        _write_atomic(self.__path(url, ".body"), content)
+        self.__save_meta(url, {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "stored_at": time()
+        })
+
+    def __save_meta(self, url: str, meta: dict[str, Any]) -> None:
+        _write_atomic(self.__path(url, ".json"), dumps(meta).encode("utf8"))
+
+
+def _write_atomic(path: str, content: bytes) -> None:
+    """Write to a temporary file first, so readers in other processes never see half a file.
+
+    The temporary file has a unique name, so threads or processes writing the same path never share one.
+
+    Parameters
+    ----------
+    path : str
+        File to write to.
+    content : bytes
+        New file contents.
+    """
+    from tempfile import mkstemp  # Not needed to import the package
+
+    fd, temp_path = mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".", suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
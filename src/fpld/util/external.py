@@ -1,10 +1,30 @@
-from typing import Any
-import requests
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Optional
+from copy import copy
+import os
 from json import loads
-import pandas as pd
+from ..constants import URLS
+from .cache import HTTPCache
+from .snapshot import Snapshot, snapshot_from_env
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import requests
+
+_fast_loads: Optional[Callable[[bytes], Any]] = None
+
+try:  # Optional faster JSON backend, `pip install fpld[fast]`
+    import orjson
+    _fast_loads = orjson.loads
+except ImportError:
+    pass
 
 
 class API:
+    cache: Optional[HTTPCache] = None  # Set to keep responses on disk between runs
+    session: Optional[requests.Session] = None  # Shared by all instances for connection reuse, made on first use
+    snapshot: Optional[Snapshot] = None  # None for live, else record to or replay from a snapshot
+
     def __init__(self, url_link: str):
         self.__url_link = url_link
         self.__set_data()
@@ -17,11 +37,148 @@ class API:
         return self.__data
 
     def __set_data(self) -> None:
-        response = requests.get(self.__url_link)
-        utf8 = response.text.encode("utf8")
-        json_data = utf8.decode("unicode_escape")
-        self.__data = loads(json_data)
+        self.__data = decode_json(self.__get_content())
+
+    def __get_content(self) -> bytes:
+        if API.snapshot is not None and API.snapshot.mode == "replay":
+            return API.snapshot.read(self.__url_link)
+
+        session = API.get_session()
+
+        if API.cache is not None:
+            content = API.cache.get(self.__url_link, session)
+        else:
+            response = session.get(self.__url_link)
+            content = response.content
+
+        if API.snapshot is not None and API.snapshot.mode == "record":
+            API.snapshot.write(self.__url_link, content)
+
+        return content
 
     @property
     def df(self) -> pd.DataFrame:
+        import pandas as pd
+
         return pd.json_normalize(self.data)
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """Session shared by all requests, created on first use so `requests` is not imported with the package.
+
+        Returns
+        -------
+        requests.Session
+            `API.session`, a new `FPLSession` if not set.
+        """
+        if API.session is None:
+            from .session import FPLSession
+            API.session = FPLSession()
+
+        return API.session
+
+
+def decode_json(content: bytes) -> Any:
+    """Parse JSON straight from the bytes of a response, without copying it to a string first.
+
+    Uses `orjson` if it is installed.
+
+    Parameters
+    ----------
+    content : bytes
+        UTF-8 encoded JSON.
+
+    Returns
+    -------
+    Any
+        Parsed JSON.
+    """
+    if _fast_loads is not None:
+        return _fast_loads(content)
+
+    return loads(content)
+
+
+class BootstrapStatic:
+    """Single shared copy of the bootstrap-static endpoint.
+
+    Every element class reads its own section (`elements`, `teams`, `events`, ...)
+    from here, so the payload is only downloaded once.
+    """
+
+    def __init__(self, url_link: str):
+        self.__url_link = url_link
+        self.__data: Optional[dict[str, Any]] = None
+        self.__fetch_count = 0
+        self.__version = 0
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """Full bootstrap-static payload, downloaded on first use.
+
+        Returns
+        -------
+        dict[str, Any]
+            Latest payload fetched.
+        """
+        if self.__data is None:
+            self.refresh()
+
+        assert self.__data is not None
+
+        return self.__data
+
+    @property
+    def fetch_count(self) -> int:
+        """Number of times the payload has been downloaded.
+
+        Returns
+        -------
+        int
+            Starts at 0 before first use.
+        """
+        return self.__fetch_count
+
+    @property
+    def version(self) -> int:
+        """Increases by 1 every time the payload is replaced.
+
+        Used by element classes to tell if their stored data is out of date.
+
+        Returns
+        -------
+        int
+            Current version of the payload.
+        """
+        return self.__version
+
+    def refresh(self) -> None:
+        """Download the latest payload, replacing it for all element classes.
+        """
+        api = API(self.__url_link)
+
+        self.__data = api.data
+        self.__fetch_count += 1
+        self.__version += 1
+
+    def section(self, key: str) -> Any:
+        """Gets one section of the payload, e.g. 'elements'.
+
+        Parameters
+        ----------
+        key : str
+            Key of the section in the payload.
+
+        Returns
+        -------
+        Any
+            Shallow copy of the section, so callers may append to it
+            without editing the shared payload.
+        """
+        return copy(self.data[key])
+
+
+if os.environ.get("FPLD_SNAPSHOT"):  # E.g. 'replay:snapshots/2022-12-10', to run with no network access
+    API.snapshot = snapshot_from_env(os.environ["FPLD_SNAPSHOT"])
+
+BOOTSTRAP_STATIC = BootstrapStatic(URLS["BOOTSTRAP-STATIC"])  # Shared by all element classes
@@ -1,3 +1,6 @@
+from typing import Any
+
+
 def to_percent(numerator: int, denominator: int) -> float:
     if denominator == 0:
         return 0.0
@@ -5,3 +8,31 @@ def to_percent(numerator: int, denominator: int) -> float:
     percent = float((numerator / denominator) * 100)
 
     return percent
+
+
+def to_group_percents(values: Any, *keys: Any) -> Any:
+    """Percent of each value of the total of values with the same keys, the same as `to_percent()` for each value.
+
+    Parameters
+    ----------
+    values : Any
+        Array of numbers.
+    *keys : Any
+        Arrays the same length as `values`, e.g. team IDs, values are grouped by every key.
+
+    Returns
+    -------
+    Any
+        Float array, 0 where the total is 0.
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+
+    if len(values) == 0:
+        return values
+
+    groups = np.unique(np.stack(keys), axis=1, return_inverse=True)[1].ravel()
+    totals = np.bincount(groups, weights=values)[groups]
+
+    return np.divide(values, totals, out=np.zeros(len(values)), where=totals != 0) * 100
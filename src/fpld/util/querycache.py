@@ -0,0 +1,191 @@
+from __future__ import annotations
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Hashable, Optional
+
+
+class QueryCache:
+    """Bounded cache of query results for one element class.
+
+    Least recently used results are evicted past `maxsize`, and results older than `ttl` seconds are not used.
+    Results stored with `pinned=True`, such as indexes every query is answered from, are kept apart,
+    and are never evicted or expired, so many different queries cannot push them out.
+    Every result belongs to one data generation, when the generation changes all results are dropped.
+
+    Example
+    -------
+    ```
+    > cache = Player.query_cache()
+    > cache.hits, cache.misses, cache.evictions
+    (120, 14, 0)
+    ```
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: Optional[float] = None):
+        if maxsize < 1:
+            raise ValueError("'maxsize' must be at least 1.")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.__results: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self.__pinned: dict[Hashable, Any] = {}
+        self.__generation: Optional[Hashable] = None
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self.__results)
+
+    def __str__(self) -> str:
+        return (f"QueryCache(size={len(self)}/{self.maxsize}, pinned={self.pinned}, hits={self.__hits}, misses={self.__misses}, "
+                f"evictions={self.__evictions}, invalidations={self.__invalidations})")
+
+    @property
+    def pinned(self) -> int:
+        """Number of pinned results, not counted in `len()` or `maxsize`.
+
+        Returns
+        -------
+        int
+            Results stored with `pinned=True` for the current generation.
+        """
+        return len(self.__pinned)
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups answered from the cache.
+
+        Returns
+        -------
+        int
+            Hits since created or cleared.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups not in the cache, or expired.
+
+        Returns
+        -------
+        int
+            Misses since created or cleared.
+        """
+        return self.__misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of results removed to stay within `maxsize`, or because they were older than `ttl`.
+
+        Returns
+        -------
+        int
+            Evictions since created or cleared.
+        """
+        return self.__evictions
+
+    @property
+    def invalidations(self) -> int:
+        """Number of results dropped because the data generation changed.
+
+        Returns
+        -------
+        int
+            Results invalidated since created or cleared.
+        """
+        return self.__invalidations
+
+    @property
+    def generation(self) -> Optional[Hashable]:
+        """Data generation the stored results belong to.
+
+        Returns
+        -------
+        Optional[Hashable]
+            None before the first result is stored.
+        """
+        return self.__generation
+
+    def lookup(self, key: Hashable, generation: Hashable) -> tuple[bool, Any]:
+        """Find a stored result.
+
+        Parameters
+        ----------
+        key : Hashable
+            Query, including its arguments.
+        generation : Hashable
+            Current data generation, results from any other generation are dropped.
+
+        Returns
+        -------
+        tuple[bool, Any]
+            Whether the result was found, and the result (None if not found).
+        """
+        self.__set_generation(generation)
+
+        if key in self.__pinned:
+            self.__hits += 1
+            return True, self.__pinned[key]
+
+        entry = self.__results.get(key)
+
+        if entry is not None and self.ttl is not None and monotonic() - entry[1] > self.ttl:
+            del self.__results[key]
+            self.__evictions += 1
+            entry = None
+
+        if entry is None:
+            self.__misses += 1
+            return False, None
+
+        self.__results.move_to_end(key)
+        self.__hits += 1
+
+        return True, entry[0]
+
+    def store(self, key: Hashable, result: Any, generation: Hashable, pinned: bool = False) -> None:
+        """Store a result, evicting the least recently used result if full.
+
+        Parameters
+        ----------
+        key : Hashable
+            Query, including its arguments.
+        result : Any
+            Result of the query.
+        generation : Hashable
+            Data generation the result was made from.
+        pinned : bool, optional
+            Keep the result until the generation changes, by default False
+        """
+        self.__set_generation(generation)
+
+        if pinned:
+            self.__pinned[key] = result
+            return
+
+        self.__results[key] = (result, monotonic())
+        self.__results.move_to_end(key)
+
+        while len(self.__results) > self.maxsize:
+            self.__results.popitem(last=False)
+            self.__evictions += 1
+
+    def clear(self) -> None:
+        """Drop every result and reset counters.
+        """
+        self.__results.clear()
+        self.__pinned.clear()
+        self.__generation = None
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__invalidations = 0
+
+    def __set_generation(self, generation: Hashable) -> None:
+        if generation != self.__generation:
+            self.__invalidations += len(self.__results) + len(self.__pinned)
+            self.__results.clear()
+            self.__pinned.clear()
+            self.__generation = generation
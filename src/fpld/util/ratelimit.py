@@ -0,0 +1,54 @@
+from __future__ import annotations
+from threading import Lock
+from time import monotonic, sleep
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Allows bursts of up to `capacity` calls, then an average of `rate` calls per second.
+
+    Example
+    -------
+    ```
+    > bucket = TokenBucket(rate=10, capacity=5)
+    > bucket.acquire()  # Blocks until a token is free
+    ```
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("'rate' must be positive.")
+        if capacity < 1:
+            raise ValueError("'capacity' must be at least 1.")
+
+        self.__rate = rate
+        self.__capacity = capacity
+        self.__tokens = capacity
+        self.__last_update = monotonic()
+        self.__lock = Lock()
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second.
+
+        Returns
+        -------
+        float
+            Average calls allowed per second.
+        """
+        return self.__rate
+
+    def acquire(self) -> None:
+        """Take one token, waiting until one is available.
+        """
+        with self.__lock:
+            now = monotonic()
+            self.__tokens = min(self.__capacity, self.__tokens + (now - self.__last_update) * self.__rate)
+            self.__last_update = now
+
+            self.__tokens -= 1  # May go negative, reserving a future token
+            wait = -self.__tokens / self.__rate
+
+        if wait > 0:
+            sleep(wait)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+from typing import Any, Union
+from random import uniform
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)  # Statuses worth retrying, the FPL site returns these under load
+
+
+class RetryWithJitter(Retry):
+    """`Retry` policy that adds a random delay to each backoff,
+    so clients that failed together do not retry together.
+    """
+    jitter: float = 0.0
+
+    def new(self, **kwargs: Any) -> RetryWithJitter:
+        new_retry: RetryWithJitter = super().new(**kwargs)
+        new_retry.jitter = self.jitter
+
+        return new_retry
+
+    def get_backoff_time(self) -> float:
+        backoff: float = super().get_backoff_time()
+
+        if backoff <= 0:
+            return 0.0
+
+        return backoff + uniform(0, self.jitter)
+
+
+class FPLSession(requests.Session):
+    """Keep-alive session shared by all `API` objects.
+
+    Connections are pooled per host, so repeated calls to the same site
+    reuse a handful of connections rather than opening one per request.
+
+    Example
+    -------
+    ```
+    > API.session = FPLSession(retries=5, timeout=10)
+    ```
+    """
+
+    def __init__(
+            self, *, pool_size: int = 10, retries: int = 3, backoff_factor: float = 0.5,
+            backoff_jitter: float = 0.5, timeout: Union[float, tuple[float, float]] = (3.05, 30)):
+        super().__init__()
+        self.timeout = timeout
+
+        retry = RetryWithJitter(
+            total=retries, backoff_factor=backoff_factor, status_forcelist=RETRY_STATUSES,
+            raise_on_status=False)
+        retry.jitter = backoff_jitter
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method: Union[str, bytes], url: Union[str, bytes], *args: Any, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        """`requests.Session.request()`, with `self.timeout` used if no timeout is passed.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+
+        return super().request(method, url, *args, **kwargs)
@@ -0,0 +1,189 @@
+from __future__ import annotations
+from datetime import datetime
+from json import dumps, loads
+import os
+from ..constants import URLS
+
+
+SNAPSHOT_FORMAT = 1  # Increase when the directory layout changes
+MODES = ("record", "replay")
+
+
+class SnapshotError(Exception):
+    pass
+
+
+class Snapshot:
+    """Directory of recorded API responses, so the package can run with no network access.
+
+    Layout:
+    ```
+    manifest.json
+    bootstrap-static.json
+    fixtures.json
+    element-summary/{player_id}.json
+    event-live/{event_id}.json
+    ```
+
+    In 'record' mode, every response downloaded by `API` is also saved here.
+    In 'replay' mode, `API` reads from here and never touches the network.
+
+    Example
+    -------
+    ```
+    > API.snapshot = Snapshot("snapshots/2022-12-10", "replay")
+    ```
+    """
+
+    def __init__(self, directory: str, mode: str = "replay"):
+        if mode not in MODES:
+            raise ValueError(f"mode must be in {MODES}")
+
+        self.__directory = os.path.expanduser(directory)
+        self.__mode = mode
+
+        if mode == "record":
+            self.__write_manifest()
+        else:
+            self.__check_manifest()
+
+    def __str__(self) -> str:
+        return f"Snapshot({self.__directory}, mode={self.__mode})"
+
+    @property
+    def directory(self) -> str:
+        """Folder the snapshot is stored in.
+
+        Returns
+        -------
+        str
+            Path, with '~' expanded.
+        """
+        return self.__directory
+
+    @property
+    def mode(self) -> str:
+        """'record' or 'replay'.
+
+        Returns
+        -------
+        str
+            How `API` uses the snapshot.
+        """
+        return self.__mode
+
+    def path_for(self, url: str) -> str:
+        """File a response from `url` is stored in.
+
+        Parameters
+        ----------
+        url : str
+            URL from `URLS`.
+
+        Returns
+        -------
+        str
+            Path of file in snapshot directory.
+
+        Raises
+        ------
+        SnapshotError
+            If `url` is not an endpoint stored in snapshots.
+        """
+        if url == URLS["BOOTSTRAP-STATIC"]:
+            return os.path.join(self.__directory, "bootstrap-static.json")
+        if url == URLS["FIXTURES"]:
+            return os.path.join(self.__directory, "fixtures.json")
+
+        for endpoint, folder in (("ELEMENT-SUMMARY", "element-summary"), ("EVENT-LIVE", "event-live")):
+            url_stem, url_end = URLS[endpoint].split("{}")
+            if url.startswith(url_stem) and url.endswith(url_end):
+                id_ = url[len(url_stem):len(url) - len(url_end)].strip("/")
+                return os.path.join(self.__directory, folder, f"{id_}.json")
+
+        raise SnapshotError(f"'{url}' is not stored in snapshots.")
+
+    def read(self, url: str) -> bytes:
+        """Recorded body of the response from `url`.
+
+        Parameters
+        ----------
+        url : str
+            URL to read response for.
+
+        Returns
+        -------
+        bytes
+            Response body.
+
+        Raises
+        ------
+        SnapshotError
+            If `url` has not been recorded.
+        """
+        path = self.path_for(url)
+
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            raise SnapshotError(f"'{url}' not recorded in '{self.__directory}'.")
+
+    def write(self, url: str, content: bytes) -> None:
+        """Record the body of the response from `url`.
+
+        Parameters
+        ----------
+        url : str
+            URL response came from.
+        content : bytes
+            Response body.
+        """
+        path = self.path_for(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "wb") as f:
+            f.write(content)
+
+    def __manifest_path(self) -> str:
+        return os.path.join(self.__directory, "manifest.json")
+
+    def __write_manifest(self) -> None:
+        os.makedirs(self.__directory, exist_ok=True)
+        manifest = {"format": SNAPSHOT_FORMAT, "created": datetime.now().isoformat(timespec="seconds")}
+
+        with open(self.__manifest_path(), "w", encoding="utf8") as f:
+            f.write(dumps(manifest))
+
+    def __check_manifest(self) -> None:
+        try:
+            with open(self.__manifest_path(), "r", encoding="utf8") as f:
+                manifest = loads(f.read())
+        except FileNotFoundError:
+            raise SnapshotError(f"'{self.__directory}' is not a snapshot, no manifest.json found.")
+
+        if manifest.get("format") != SNAPSHOT_FORMAT:
+            raise SnapshotError(
+                f"Snapshot format is {manifest.get('format')}, expected {SNAPSHOT_FORMAT}. Record it again.")
+
+
+def snapshot_from_env(value: str) -> Snapshot:
+    """Create a `Snapshot` from the `FPLD_SNAPSHOT` environment variable.
+
+    Parameters
+    ----------
+    value : str
+        In the form 'mode:directory', e.g. 'replay:snapshots/2022-12-10'.
+        A directory on its own means 'replay'.
+
+    Returns
+    -------
+    Snapshot
+        Snapshot described by `value`.
+    """
+    mode, sep, directory = value.partition(":")
+
+    if sep == "" or mode not in MODES:  # No mode given, may be a Windows drive letter
+        return Snapshot(value, "replay")
+
+    return Snapshot(directory, mode)
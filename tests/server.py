@@ -0,0 +1,83 @@
+from __future__ import annotations
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from hashlib import md5
+from threading import Thread
+from time import sleep
+from typing import Any
+
+
+class StandInServer:
+    """Local stand-in for the FPL API, so HTTP behaviour can be tested without network access.
+
+    Serves `routes` (path to body) with an ETag, answering conditional requests with 304.
+    The next `failures[path]` requests to a path get a 503 instead.
+    `connect_delay` is slept for each new connection, to stand in for a TCP + TLS handshake,
+    and `response_delay` for each request, to stand in for server latency.
+    """
+
+    def __init__(self, routes: dict[str, bytes]):
+        self.routes = routes
+        self.failures: dict[str, int] = {}
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.connections = 0
+        self.connect_delay = 0.0
+        self.response_delay = 0.0
+        self.__server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(self))
+        self.__thread = Thread(target=self.__server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    def __enter__(self) -> StandInServer:
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    def url(self, path: str) -> str:
+        host, port = self.__server.server_address[:2]
+        return f"http://{host!s}:{port}{path}"
+
+
+def _handler_for(server: StandInServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive
+        disable_nagle_algorithm = True
+
+        def setup(self) -> None:
+            server.connections += 1
+            sleep(server.connect_delay)
+            super().setup()
+
+        def do_GET(self) -> None:
+            server.requests.append((self.path, dict(self.headers)))
+            sleep(server.response_delay)
+
+            if server.failures.get(self.path, 0) > 0:
+                server.failures[self.path] -= 1
+                self.__respond(503, b"", {})
+                return
+
+            if self.path not in server.routes:
+                self.__respond(404, b"{}", {})
+                return
+
+            body = server.routes[self.path]
+            etag = '"' + md5(body).hexdigest() + '"'
+
+            if self.headers.get("If-None-Match") == etag:
+                self.__respond(304, b"", {"ETag": etag})
+            else:
+                self.__respond(200, body, {"ETag": etag, "Content-Type": "application/json"})
+
+        def __respond(self, status: int, body: bytes, headers: dict[str, str]) -> None:
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    return Handler
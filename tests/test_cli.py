@@ -0,0 +1,50 @@
+import pytest
+import json
+from typing import Any
+from fpld import cli, util
+from fpld.constants import URLS
+from .server import StandInServer
+
+
+ROUTES = {
+    "/bootstrap-static/": json.dumps({"elements": [{"id": 1}, {"id": 2}], "game_settings": {}}).encode("utf8"),
+    "/fixtures/": b"[]",
+    "/element-summary/1/": b'{"history": [], "history_past": []}',
+    "/element-summary/2/": b'{"history": [], "history_past": []}'
+}
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> Any:
+    with StandInServer(dict(ROUTES)) as server:
+        monkeypatch.setitem(URLS, "BOOTSTRAP-STATIC", server.url("/bootstrap-static/"))
+        monkeypatch.setitem(URLS, "FIXTURES", server.url("/fixtures/"))
+        monkeypatch.setitem(URLS, "ELEMENT-SUMMARY", server.url("/element-summary/{}/"))
+        monkeypatch.setattr(util.API, "snapshot", None)
+
+        yield server
+
+
+class TestSnapshotCommand:
+    def test_records_all_players(self, server: StandInServer, tmp_path: Any) -> None:
+        assert cli.main(["snapshot", str(tmp_path)]) == 0
+
+        assert (tmp_path / "manifest.json").exists()
+        assert (tmp_path / "bootstrap-static.json").read_bytes() == ROUTES["/bootstrap-static/"]
+        assert (tmp_path / "fixtures.json").read_bytes() == ROUTES["/fixtures/"]
+        assert sorted(p.name for p in (tmp_path / "element-summary").iterdir()) == ["1.json", "2.json"]
+
+    def test_records_chosen_players(self, server: StandInServer, tmp_path: Any) -> None:
+        assert cli.main(["snapshot", str(tmp_path), "--players", "2"]) == 0
+
+        assert [p.name for p in (tmp_path / "element-summary").iterdir()] == ["2.json"]
+
+    def test_failed_player(self, server: StandInServer, tmp_path: Any) -> None:
+        assert cli.main(["snapshot", str(tmp_path), "--players", "1,3"]) == 1
+
+    def test_replay(self, server: StandInServer, tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+        cli.main(["snapshot", str(tmp_path)])
+        monkeypatch.setattr(util.API, "snapshot", util.Snapshot(str(tmp_path), "replay"))
+        server.routes.clear()
+
+        assert util.API(URLS["ELEMENT-SUMMARY"].format(1)).data == {"history": [], "history_past": []}
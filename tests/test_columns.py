@@ -0,0 +1,298 @@
+import pytest
+from typing import Any
+import numpy as np
+from fpld import elements as elems
+from fpld.elements.columns import Column, ColumnStore
+from fpld.elements.element import ElementGroup
+
+
+QUERIES: list[dict[str, Any]] = [
+    {"team": (1, 2, 3), "now_cost__lt": 60},
+    {"method_": "or", "status": "i", "form__gt": 5},
+    {"total_points__between": (20, 80), "element_type__ne": 1},
+    {"web_name__ge": "M"},
+    {"chance_of_playing_next_round": None},
+    {"news__ne": ""}
+]
+
+
+@pytest.fixture
+def players() -> tuple[ElementGroup[Any], ElementGroup[Any]]:
+    """All players backed by the column store, and the same players in a plain group."""
+    columnar = elems.Player.get_all()
+
+    return columnar, ElementGroup(columnar.to_list())
+
+
+def ids(group: ElementGroup[Any]) -> list[int]:
+    return [elem.unique_id for elem in group]
+
+
+class TestColumn:
+    def test_numbers(self) -> None:
+        column = Column.from_values([1, 2, 3])
+
+        assert column.kind == "number" and column.values.dtype == np.int64 and column.nulls is None
+
+    def test_missing_numbers(self) -> None:
+        column = Column.from_values([1, None, 3.5])
+
+        assert column.values.dtype == np.float64
+        assert column.nulls is not None and column.nulls.tolist() == [False, True, False]
+
+    def test_strings_encoded(self) -> None:
+        column = Column.from_values(["b", "a", None, "b"])
+
+        assert column.kind == "string"
+        assert column.categories == ("a", "b")
+        assert column.values.tolist() == [1, 0, -1, 1]
+        assert column.decoded().tolist() == ["b", "a", None, "b"]
+
+    def test_bools(self) -> None:
+        assert Column.from_values([True, False]).kind == "bool"
+
+    def test_objects(self) -> None:
+        column = Column.from_values([[1, 2], [3]])
+
+        assert column.kind == "object" and column.values.shape == (2,)
+
+
+class TestColumnStore:
+    def test_columns_built_on_use(self) -> None:
+        store = ColumnStore(elems.Player.get_all().to_list())
+        store.column("now_cost")
+
+        assert store.built == ["now_cost"]
+
+    def test_linked_by_id(self) -> None:
+        store = elems.Player.get_all().columns()
+        column = store.column("team")
+
+        assert column is not None and column.linked
+        assert column.values.tolist() == [player.team.id for player in store.elements]
+
+    def test_not_a_field(self) -> None:
+        assert elems.Player.get_all().columns().column("unique_id") is None
+
+
+class TestToDf:
+    def test_dtypes(self) -> None:
+        df = elems.Player.get_all().to_df("now_cost", "form", "in_dreamteam", "web_name", "ppm")
+
+        assert [str(dtype) for dtype in df.dtypes[:3]] == ["int64", "float64", "bool"]
+        assert df["ppm"].tolist() == [player.ppm for player in elems.Player.get_all()]
+
+    def test_all_fields(self) -> None:
+        df = elems.Team.get_all().to_df("name", all_fields=True)
+
+        assert list(df.columns) == ["name"] + [name for name in elems.Team.get_all().columns().fields if name != "name"]
+        assert list(df.index) == list(range(1, 21))
+
+    def test_links_as_ids(self) -> None:
+        players = elems.Player.get(element_type=4)
+        df = players.to_df("team", "element_type", links="id")
+
+        assert df["team"].dtype == np.int64
+        assert df["team"].tolist() == [player.team.id for player in players]
+        assert df["element_type"].tolist() == [4] * len(players)
+
+    def test_missing_ids(self) -> None:
+        column = elems.Event.get_all().to_df("most_selected", links="id")["most_selected"]
+
+        assert str(column.dtype) == "Int64" and column.isna().sum() == 1
+
+    def test_links_as_category(self) -> None:
+        players = elems.Player.get_all()
+        column = players.to_df("team", links="category")["team"]
+
+        assert column.dtype == "category"
+        assert list(column.cat.categories) == sorted(team.name for team in elems.Team.get_all())
+        assert column.astype(str).tolist() == [player.team.name for player in players]
+
+    def test_links_as_elements(self) -> None:
+        players = elems.Player.get(team=1)
+
+        assert players.to_df("team")["team"].tolist() == [player.team for player in players]
+
+    def test_incorrect_links(self) -> None:
+        with pytest.raises(ValueError):
+            elems.Player.get_all().to_df("team", links="name")
+
+
+class TestAggregate:
+    def test_sum_by_team_and_position(self) -> None:
+        players = elems.Player.get_all()
+        expected: dict[tuple[Any, Any], int] = {}
+        for player in players:
+            expected[(player.team, player.element_type)] = expected.get((player.team, player.element_type), 0) + player.total_points
+
+        df = players.aggregate(by=("team", "element_type"), total_points="sum")
+
+        assert list(df.index.names) == ["team", "element_type"]
+        assert df["total_points"].to_dict() == dict(sorted(expected.items()))
+
+    @pytest.mark.parametrize("func", ["sum", "mean", "count", "min", "max", "median", "std"])
+    def test_same_as_pandas(self, func: str) -> None:
+        players = elems.Player.get_all().filter(minutes__gt=0)
+        df = players.to_df("team", "status", "now_cost", "in_dreamteam", "form", links="id")
+        expected = df.groupby(["team", "status"]).agg(
+            now_cost=("now_cost", func), in_dreamteam=("in_dreamteam", func), form=("form", func))
+
+        actual = players.aggregate(by=("team", "status"), links="id", now_cost=func, in_dreamteam=func, form=func)
+
+        assert np.allclose(actual.to_numpy(dtype=float), expected.to_numpy(dtype=float), equal_nan=True)
+        assert actual.index.equals(expected.index)
+
+    def test_missing_values(self) -> None:
+        events = elems.Event.get_all()
+
+        assert events.aggregate(by="most_selected", links="id", id="count")["id"].sum() == len(events)
+
+    def test_category_index(self) -> None:
+        df = elems.Player.get_all().aggregate(by="element_type", links="category", id="count")
+
+        assert sorted(df.index) == sorted(position.singular_name for position in elems.Position.get_all())
+        assert df["id"].sum() == len(elems.Player.get_all())
+
+    @pytest.mark.parametrize("by,attr_to_func", [((), {"id": "sum"}), ("team", {}), ("team", {"id": "total"})])
+    def test_incorrect_args(self, by: Any, attr_to_func: dict[str, str]) -> None:
+        with pytest.raises(ValueError):
+            elems.Player.get_all().aggregate(by=by, **attr_to_func)
+
+    def test_incorrect_attr(self) -> None:
+        with pytest.raises(AttributeError):
+            elems.Player.get_all().aggregate(by="team", foo="sum")
+
+
+class TestDerived:
+    @pytest.fixture
+    def minutes_per_point(self) -> Any:
+        elems.Player.derive("minutes_per_point", ("minutes", "total_points"),
+                            lambda minutes, points: np.divide(minutes, points, out=np.zeros(len(points)), where=points > 0))
+        yield
+        del elems.Player._derived["minutes_per_point"]  # type: ignore[index]
+        elems.Player.query_cache().clear()
+
+    @pytest.mark.parametrize("attr", ["ppm", "goal_contributions", "transfer_diff", "percent_pos", "percent_team"])
+    def test_same_as_properties(self, attr: str) -> None:
+        players = elems.Player.get_all()
+        column = players.columns().column(attr)
+
+        assert column is not None and column.decoded().tolist() == [getattr(player, attr) for player in players]
+
+    def test_subset_from_every_element(self) -> None:
+        players = ElementGroup(elems.Player.get(element_type=4).to_list())
+
+        assert players.to_df("percent_pos")["percent_pos"].tolist() == [player.percent_pos for player in players]
+
+    def test_registered(self, minutes_per_point: None) -> None:
+        players = elems.Player.get_all()
+        expected = {player.unique_id: player.minutes / player.total_points if player.total_points > 0 else 0.0
+                    for player in players}
+
+        assert players.to_df("id", "minutes_per_point").set_index("id")["minutes_per_point"].to_dict() == expected
+        assert ids(players.sort("minutes_per_point")) == sorted(expected, key=lambda id_: expected[id_], reverse=True)
+        assert ids(elems.Player.get(minutes_per_point__gt=90)) == [id_ for id_, value in expected.items() if value > 90]
+        assert ids(ElementGroup(players.to_list()).top_n("minutes_per_point", 3)) == ids(players.sort("minutes_per_point")[:3])
+
+    @pytest.mark.parametrize("name,depends_on", [("now_cost", ("total_points",)), ("foo", ("foo",))])
+    def test_incorrect_args(self, name: str, depends_on: tuple[str, ...]) -> None:
+        with pytest.raises(ValueError):
+            elems.Player.derive(name, depends_on, np.negative)
+
+    def test_incorrect_length(self) -> None:
+        elems.Player.derive("foo", ("now_cost",), lambda cost: cost[:1])
+
+        try:
+            with pytest.raises(ValueError):
+                elems.Player.get_all().sort("foo")
+        finally:
+            del elems.Player._derived["foo"]  # type: ignore[index]
+            elems.Player.query_cache().clear()
+
+
+class TestColumnarGroup:
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_filter_same_as_elements(self, players: tuple[ElementGroup[Any], ElementGroup[Any]], query: dict[str, Any]) -> None:
+        columnar, plain = players
+
+        assert ids(columnar.filter(**query)) == ids(plain.filter(**query))
+
+    @pytest.mark.parametrize("attr", ["now_cost", "web_name", "form", "in_dreamteam"])
+    @pytest.mark.parametrize("reverse", [True, False])
+    def test_sort_same_as_elements(self, players: tuple[ElementGroup[Any], ElementGroup[Any]], attr: str, reverse: bool) -> None:
+        columnar, plain = players
+
+        assert ids(columnar.sort(attr, reverse=reverse)) == ids(plain.sort(attr, reverse=reverse))
+        assert ids(columnar[10:50].sort(attr, reverse=reverse)) == ids(plain[10:50].sort(attr, reverse=reverse))
+
+    def test_to_df_same_as_elements(self, players: tuple[ElementGroup[Any], ElementGroup[Any]]) -> None:
+        columnar, plain = players
+        attrs = ("web_name", "now_cost", "form", "team", "chance_of_playing_next_round", "in_dreamteam")
+
+        assert columnar.filter(team=2).to_df(*attrs).equals(plain.filter(team=2).to_df(*attrs))
+
+    def test_to_df_keeps_no_store(self, players: tuple[ElementGroup[Any], ElementGroup[Any]]) -> None:
+        _, plain = players
+        plain.to_df("web_name", "ppm", "team", all_fields=True, links="id")
+
+        assert plain.columns().built == []  # A new store, not one kept from the export
+
+    @pytest.mark.parametrize("keys,reverse", [(("element_type", "now_cost"), (False, True)),
+                                              (("total_points", "web_name"), True),
+                                              (("in_dreamteam", "form", "id"), (True, False, False))])
+    def test_multi_key_sort_same_as_elements(self, players: tuple[ElementGroup[Any], ElementGroup[Any]],
+                                             keys: tuple[str, ...], reverse: Any) -> None:
+        columnar, plain = players
+
+        assert ids(columnar.sort(*keys, reverse=reverse)) == ids(plain.sort(*keys, reverse=reverse))
+        assert ids(columnar.filter(team=3).sort(*keys, reverse=reverse)) == ids(plain.filter(team=3).sort(*keys, reverse=reverse))
+
+    def test_multi_key_order(self, players: tuple[ElementGroup[Any], ElementGroup[Any]]) -> None:
+        columnar, _ = players
+        pairs = [(player.element_type.id, player.now_cost) for player in columnar.sort("element_type", "now_cost", reverse=(False, True))]
+
+        assert pairs == sorted(pairs, key=lambda pair: (pair[0], -pair[1]))
+
+    @pytest.mark.parametrize("attr", ["total_points", "now_cost", "web_name", "bonus"])
+    @pytest.mark.parametrize("n", [0, 1, 10, 700, 800])
+    def test_top_n_same_as_sort(self, players: tuple[ElementGroup[Any], ElementGroup[Any]], attr: str, n: int) -> None:
+        columnar, plain = players
+
+        for group in (columnar, plain, columnar.filter(element_type=2), columnar[100:5:-3]):
+            assert ids(group.top_n(attr, n)) == ids(group.sort(attr)[:n])
+            assert ids(group.bottom_n(attr, n)) == ids(group.sort(attr, reverse=False)[:n])
+
+    def test_order_kept(self) -> None:
+        store = ColumnStore(elems.Player.get_all().to_list())
+
+        assert store.order(["total_points"], [True]) is store.order(["total_points"], [True])
+
+    def test_to_df_all_fields_same_as_elements(self, players: tuple[ElementGroup[Any], ElementGroup[Any]]) -> None:
+        columnar, plain = players
+
+        assert columnar[::7].to_df("ppm", all_fields=True, links="id").equals(plain[::7].to_df("ppm", all_fields=True, links="id"))
+
+    def test_chained(self, players: tuple[ElementGroup[Any], ElementGroup[Any]]) -> None:
+        columnar, plain = players
+
+        def chain(group: ElementGroup[Any]) -> list[int]:
+            return ids(group.filter(now_cost__lt=70).sort("total_points")[:20].filter(element_type=3))
+
+        assert chain(columnar) == chain(plain)
+
+    def test_uncomparable_falls_back(self, players: tuple[ElementGroup[Any], ElementGroup[Any]]) -> None:
+        columnar, _ = players
+
+        with pytest.raises(TypeError):
+            columnar.filter(now_cost__gt="cheap")
+
+    def test_take(self, players: tuple[ElementGroup[Any], ElementGroup[Any]]) -> None:
+        columnar, plain = players
+
+        assert ids(columnar.take([5, 1, 3])) == ids(plain.take([5, 1, 3]))
+
+    def test_get_same_as_filter(self) -> None:
+        found = elems.Player.get(team=1)
+
+        assert ids(found) == ids(elems.Player.get_all().filter(team=1))
@@ -1,7 +1,9 @@
 from abc import ABC
+import json
 import pytest
 from fpld import elements as elems
-from fpld.util import Percentile
+from fpld.elements.query import filter_for, parse_conditions
+from fpld.util import Percentile, QueryCache
 from typing import Any, Callable, SupportsIndex, TypeVar, Generic, Union
 import pandas as pd
 from .examples import TEAM_DF
@@ -177,6 +179,11 @@ class TestElementGroupCases:
         with pytest.raises(NotImplementedError):
             group[idx]
 
+    @pytest.mark.parametrize("sort_by,reverse", [((), True), (("now_cost", "form"), (True,))])
+    def test_sort_incorrect_args(self, sort_by: tuple[str, ...], reverse: Any) -> None:
+        with pytest.raises(ValueError):
+            elems.Player.get_all().sort(*sort_by, reverse=reverse)
+
     @pytest.mark.parametrize("group,kwargs", [(elems.Team.get_all(), {"foo": 123})])
     def test_filter_invalid_attr(self, group: elems.ElementGroup[_element], kwargs: dict[str, Any]) -> None:
         with pytest.raises(AttributeError):
@@ -208,6 +215,43 @@ class TestElementGroupCases:
         assert group.to_string_list() == expected
 
 
+class TestOrderedSet:
+    def test_repeats_removed(self) -> None:
+        teams = elems.Team.get_all().to_list()
+
+        assert elems.ElementGroup([teams[2], teams[0], teams[2], teams[1], teams[0]]).to_list() == [teams[2], teams[0], teams[1]]
+
+    def test_contains(self) -> None:
+        players = elems.Player.get(team=1)
+
+        assert players[0] in players
+        assert elems.Player.get(team=2)[0] not in players
+        assert "Kane" not in players
+
+    @pytest.mark.parametrize("group", [elems.Player.get_all(), elems.ElementGroup(elems.Player.get_all().to_list())])
+    def test_split(self, group: elems.ElementGroup[Any]) -> None:
+        cheap, rest = group.split(now_cost__lt=60)
+
+        assert cheap == group.filter(now_cost__lt=60)
+        assert rest.to_list() == [player for player in group if player.now_cost >= 60]
+
+    @pytest.mark.parametrize("columnar", [True, False])
+    def test_set_operations(self, columnar: bool) -> None:
+        def group(**attr_to_value: Any) -> elems.ElementGroup[Any]:
+            found = elems.Player.get_all().filter(**attr_to_value)
+            return found if columnar else elems.ElementGroup(found.to_list())
+
+        spurs, keepers = group(team=18), group(element_type=1)
+
+        assert (spurs | keepers).to_list() == spurs.to_list() + [p for p in keepers if p.team.id != 18]
+        assert (spurs & keepers).to_list() == [p for p in spurs if p.element_type.id == 1]
+        assert (spurs - keepers).to_list() == [p for p in spurs if p.element_type.id != 1]
+
+    def test_set_operation_incorrect_type(self) -> None:
+        with pytest.raises(NotImplementedError):
+            elems.Player.get(team=1) & 5  # type: ignore[operator]
+
+
 class TestIDUniquenessCheck:
     def test_one_result(self) -> None:
         players = elems.Player.get(web_name="Kane")
@@ -230,6 +274,367 @@ class TestIDUniquenessCheck:
             elems.element.id_uniqueness_check(fixtures)
 
 
+@pytest.fixture
+def renamed_team(monkeypatch: pytest.MonkeyPatch) -> Any:
+    teams = elems.Team.get_latest_api()
+    teams[0] = dict(teams[0], name="Renamed")
+    monkeypatch.setattr(elems.Team, "get_latest_api", classmethod(lambda cls: teams))
+
+    yield teams[0]["id"]
+
+    monkeypatch.undo()
+    elems.Team.get_api(refresh_api=True)
+
+
+class TestGenerationCache:
+    def test_queries_cached(self) -> None:
+        assert elems.Player.get_all() is elems.Player.get_all()
+        assert elems.Player.get(team=1) is elems.Player.get(team=1)
+        assert elems.Player.get_by_id(1) is elems.Player.get_by_id(1)
+
+    def test_refresh_rebuilds(self) -> None:
+        players = elems.Player.get_all()
+
+        elems.Player.get_api(refresh_api=True)
+
+        assert elems.Player.get_all() is not players
+
+    def test_refresh_new_data(self, renamed_team: int) -> None:
+        elems.Team.get_by_id(renamed_team)
+        elems.Team.get_api(refresh_api=True)
+
+        team = elems.Team.get_by_id(renamed_team)
+        assert team is not None and team.name == "Renamed"
+
+    def test_linked_classes_rebuilt(self) -> None:
+        fixtures = elems.Fixture.get_all()
+        events = elems.Event.get_all()
+
+        elems.Player.get_api(refresh_api=True)  # Fixture -> Event -> Player
+
+        assert elems.Fixture.get_all() is not fixtures
+        assert elems.Event.get_all() is not events
+
+        fixture = elems.Fixture.get_all()[0]
+        assert fixture.event.most_selected is elems.Player.get_by_id(fixture.event.most_selected.id)
+
+    def test_unlinked_classes_kept(self) -> None:
+        players = elems.Player.get_all()
+
+        elems.Fixture.get_api(refresh_api=True)
+
+        assert elems.Player.get_all() is players
+
+    def test_generation_changes(self) -> None:
+        generation = elems.Fixture.data_generation()
+
+        elems.Position.get_api(refresh_api=True)  # Fixture -> Team, Event -> Player -> Position
+
+        assert elems.Fixture.data_generation() != generation
+
+    def test_cache_per_class(self) -> None:
+        assert elems.Player.query_cache() is not elems.Team.query_cache()
+        assert elems.Player.query_cache() is elems.Player.query_cache()
+
+    def test_cache_counts(self) -> None:
+        cache = elems.Team.query_cache()
+        elems.Team.get(short_name="ARS")
+        hits = cache.hits
+
+        elems.Team.get(short_name="ARS")
+
+        assert cache.hits == hits + 1
+        assert len(cache) <= cache.maxsize
+
+    def test_cache_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(elems.Position, "_query_cache", QueryCache(maxsize=2))
+
+        for id_ in range(1, 5):
+            elems.Position.get(id=id_)
+
+        assert len(elems.Position.query_cache()) == 2
+        assert elems.Position.query_cache().evictions > 0
+
+    def test_indexes_not_evicted(self) -> None:
+        elems.Player.query_cache().clear()
+        id_index = elems.Player.id_index()
+        players = elems.Player.get_all()
+
+        for cost in range(elems.Player.QUERY_CACHE_SIZE + 100):
+            elems.Player.get(now_cost__gt=cost)
+
+        cache = elems.Player.query_cache()
+        assert cache.evictions > 0 and len(cache) == cache.maxsize
+        assert elems.Player.id_index() is id_index
+        assert elems.Player.get_all() is players
+
+
+class TestCompactElements:
+    @pytest.mark.parametrize("class_", [elems.Player, elems.Team, elems.Position, elems.Event, elems.Fixture])
+    def test_no_instance_dict(self, class_: Any) -> None:
+        assert not hasattr(class_.get_all()[0], "__dict__")
+
+    def test_strings_interned(self) -> None:
+        data = json.loads(json.dumps(elems.Player.get_api()[0]))  # New string objects
+        player = elems.Player.get_by_id(data["id"])
+
+        assert player is not None
+        assert elems.Player.from_dict(data).web_name is player.web_name
+
+
+class TestLoader:
+    def test_strings_to_floats(self) -> None:
+        player = elems.Player.get_all()[0]
+
+        for attr in ("ep_next", "selected_by_percent", "points_per_game", "form", "influence"):
+            assert isinstance(getattr(player, attr), float)
+
+    def test_numeric_sort(self) -> None:
+        values = [player.selected_by_percent for player in elems.Player.get_all().sort("selected_by_percent")]
+
+        assert values == sorted(values, reverse=True)
+
+    def test_same_as_from_dict(self) -> None:
+        api_data = elems.Fixture.get_api()[:20]
+
+        assert elems.Fixture.from_dicts(api_data) == [elems.Fixture.from_dict(elem) for elem in api_data]
+
+    def test_links(self) -> None:
+        api_data = elems.Player.get_api()[0]
+        player = elems.Player.from_dicts([api_data])[0]
+
+        assert player.team is elems.Team.get_by_id(api_data["team"])
+        assert elems.BasePlayer.from_dicts([api_data])[0].team == api_data["team"]
+
+    def test_missing_field(self) -> None:
+        api_data = [dict(elem) for elem in elems.Team.get_api()]
+        del api_data[3]["short_name"]
+
+        with pytest.raises(KeyError, match="short_name"):
+            elems.Team.from_dicts(api_data)
+
+    def test_compiled_once(self) -> None:
+        assert elems.Player.loader() is elems.Player.loader()
+        assert elems.Player.loader() is not elems.BasePlayer.loader()
+
+
+LINKED_CLASSES = (elems.Fixture, elems.Event, elems.Player, elems.Team, elems.Position)
+
+
+def built() -> list[str]:
+    return [class_.__name__ for class_ in LINKED_CLASSES if len(class_._built[1]) > 0]
+
+
+class TestLinkedFields:
+    @pytest.fixture
+    def cold(self) -> None:
+        for class_ in LINKED_CLASSES:
+            class_.query_cache().clear()
+            class_._built = ({}, {})
+
+    def test_links_not_built(self, cold: None) -> None:
+        elems.Fixture.get_all()
+
+        assert built() == ["Fixture"]
+
+    def test_found_when_read(self) -> None:
+        fixture = elems.Fixture.get_all()[0]
+
+        assert fixture.team_h is elems.Team.get_by_id(elems.Fixture.get_api()[0]["team_h"])
+        assert fixture.team_h is fixture.team_h
+
+    def test_id_without_building(self, cold: None) -> None:
+        event = elems.Event.get_by_id(1)
+        assert event is not None
+
+        assert elems.Event.linked_fields()["top_element"].linked_id(event) == elems.Event.get_api()[0]["top_element"]
+        assert built() == ["Event"]
+
+    def test_missing_link(self) -> None:
+        assert elems.Event.get_by_id(0).most_selected is None  # type: ignore[union-attr]
+
+    def test_installed(self) -> None:
+        assert set(elems.Fixture.linked_fields()) == {"event", "team_h", "team_a"}
+        assert elems.BasePlayer.linked_fields() == {}
+
+
+class TestIncrementalRefresh:
+    def test_nothing_changed(self) -> None:
+        team = elems.Team.get_by_id(1)
+
+        assert elems.Team.refresh() == frozenset()
+        assert elems.Team.get_by_id(1) is team
+
+    def test_only_changed_rebuilt(self, renamed_team: int) -> None:
+        teams = elems.Team.get_all()
+
+        assert elems.Team.refresh() == {renamed_team}
+
+        for old_team, new_team in zip(teams, elems.Team.get_all()):
+            assert (old_team is new_team) == (old_team.id != renamed_team)
+
+    def test_linked_elements_rebuilt(self, renamed_team: int) -> None:
+        players = {player.id: player for player in elems.Player.get_all() if player.team is not None}  # Links read
+
+        elems.Team.refresh()
+        renamed_players = {player.id for player in elems.Player.get_all() if player.team.id == renamed_team}
+
+        assert elems.Player._changed_ids == renamed_players
+        for player in elems.Player.get_all():
+            assert (player is players[player.id]) == (player.id not in renamed_players)
+            assert player.team is elems.Team.get_by_id(player.team.id)
+
+    def test_unread_links_kept(self, renamed_team: int) -> None:
+        elems.Player.get_api(refresh_api=True)
+        players = elems.Player.get_all().to_list()
+
+        elems.Team.refresh()
+
+        assert elems.Player.get_all().to_list() == players and elems.Player._changed_ids == frozenset()
+        renamed = next(player for player in elems.Player.get_all() if player.team.id == renamed_team)
+        assert renamed.team.name == "Renamed"
+
+    def test_removed_reported(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        positions = elems.Position.get_latest_api()
+        elems.Position.get_all()
+        monkeypatch.setattr(elems.Position, "get_latest_api", classmethod(lambda cls: positions[1:]))
+
+        assert elems.Position.refresh() == {positions[0]["id"]}
+
+        monkeypatch.undo()
+        assert elems.Position.refresh() == {positions[0]["id"]}
+
+
+class TestIDIndex:
+    def test_index_matches_get_all(self) -> None:
+        index, repeated_ids = elems.Player.id_index()
+
+        assert list(index.values()) == list(elems.Player.get_all())
+        assert repeated_ids == frozenset()
+        assert index[427] is elems.Player.get_by_id(427)
+
+    def test_missing_id(self) -> None:
+        assert elems.Player.get_by_id(-1) is None
+
+    def test_repeated_id(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        positions = elems.Position.get_latest_api()
+        monkeypatch.setattr(elems.Position, "get_latest_api", classmethod(lambda cls: positions + positions[:1]))
+        elems.Position.get_api(refresh_api=True)
+
+        with pytest.raises(elems.element.IDNotUnique):
+            elems.Position.get_by_id(positions[0]["id"])
+        assert elems.Position.get_by_id(positions[1]["id"]) is not None
+
+        monkeypatch.undo()
+        elems.Position.get_api(refresh_api=True)
+
+
+class TestAttrIndex:
+    @pytest.mark.parametrize("method_,kwargs", [
+        ("all", {"team": 1}),
+        ("all", {"team": (1, 2), "element_type": 4}),
+        ("all", {"team": (), "element_type": 4}),
+        ("or", {"team": 1, "element_type": 1}),
+        ("all", {"web_name": "Kane"})
+    ])
+    def test_matches_filter(self, method_: str, kwargs: dict[str, Any]) -> None:
+        expected = elems.Player.get_all().filter(method_=method_, **dict(kwargs))
+
+        assert elems.Player.get(method_=method_, **kwargs).to_list() == expected.to_list()
+
+    def test_elements_as_values(self) -> None:
+        team = elems.Team.get_by_id(1)
+        fixtures = elems.Fixture.get(method_="or", team_h=team, team_a=team)
+
+        assert fixtures.to_list() == elems.Fixture.get_all_team_fixtures(1).to_list()
+        assert len(fixtures) > 0
+
+    def test_index(self) -> None:
+        index = elems.Player.attr_index("element_type")
+        players = elems.Player.get_all()
+
+        assert index is not None
+        assert all(players[position].element_type.id == 4 for position in index[4])
+
+    def test_unhashable_falls_back(self) -> None:
+        assert elems.Event.attr_index("chip_plays") is None
+        assert len(elems.Event.get(chip_plays="none")) == 0
+
+    def test_invalid_attr(self) -> None:
+        with pytest.raises(AttributeError):
+            elems.Player.get(foo=1)
+
+    def test_players_by_pos(self) -> None:
+        team = elems.Team.get_by_id(1)
+        position = elems.Position.get_by_id(3)
+
+        assert team is not None and position is not None
+        assert team.players_by_pos(position).to_list() == team.players.filter(element_type=position).to_list()
+
+
+class TestQueryOperators:
+    @pytest.mark.parametrize("kwargs,check", [
+        ({"now_cost__between": (45, 80)}, lambda p: 45 <= p.now_cost <= 80),
+        ({"now_cost__gt": 100}, lambda p: p.now_cost > 100),
+        ({"now_cost__ge": 100}, lambda p: p.now_cost >= 100),
+        ({"total_points__lt": 10}, lambda p: p.total_points < 10),
+        ({"total_points__le": 10}, lambda p: p.total_points <= 10),
+        ({"form__gt": 5}, lambda p: p.form > 5),
+        ({"status__in": ("i", "s")}, lambda p: p.status in ("i", "s")),
+        ({"status__ne": "a"}, lambda p: p.status != "a"),
+        ({"team__eq": 1}, lambda p: p.team.id == 1),
+        ({"team__between": (1, 3)}, lambda p: 1 <= p.team.id <= 3),
+        ({"chance_of_playing_next_round__lt": 50},
+         lambda p: p.chance_of_playing_next_round is not None and p.chance_of_playing_next_round < 50),
+        ({"now_cost__gt": 60, "element_type": 4}, lambda p: p.now_cost > 60 and p.element_type.id == 4)
+    ])
+    def test_get_and_filter(self, kwargs: dict[str, Any], check: Callable[[Any], bool]) -> None:
+        expected = [player for player in elems.Player.get_all() if check(player)]
+
+        assert elems.Player.get_all().filter(**kwargs).to_list() == expected
+        assert elems.Player.get(**kwargs).to_list() == expected
+        assert elems.element.ElementGroup(elems.Player.get_all().to_list()).filter(**kwargs).to_list() == expected
+
+    @pytest.mark.parametrize("method_", ["all", "or"])
+    def test_plain_group(self, method_: str) -> None:
+        players = elems.element.ElementGroup(elems.Player.get_all().to_list())  # Not backed by a column store
+        check = all if method_ == "all" else any
+        expected = [player for player in players if check((player.team.id == 1, player.now_cost > 60))]
+
+        assert players.filter(method_=method_, team=elems.Team.get_by_id(1), now_cost__gt=60).to_list() == expected
+        assert players.split(method_=method_, team=1, now_cost__gt=60)[0].to_list() == expected
+
+    def test_compiled_filter_reused(self) -> None:
+        player = elems.Player.get_by_id(1)
+        conditions = parse_conditions({"now_cost__gt": 60, "team": 1})
+
+        assert filter_for(conditions, all, player) is filter_for(parse_conditions({"now_cost__gt": 60, "team": 1}), all, player)
+        assert filter_for(conditions, all, player) is not filter_for(conditions, any, player)
+        assert filter_for(parse_conditions({"team": [1]}), all, player)([player]) == []  # Unhashable, compiled each time
+
+    def test_or(self) -> None:
+        expected = [player for player in elems.Player.get_all() if player.now_cost > 120 or player.total_points > 100]
+
+        assert elems.Player.get(method_="or", now_cost__gt=120, total_points__gt=100).to_list() == expected
+
+    def test_sorted_index(self) -> None:
+        sorted_index = elems.Player.sorted_index("now_cost")
+        players = elems.Player.get_all()
+
+        assert sorted_index is not None
+        values, positions = sorted_index
+        assert values == sorted(values)
+        assert [players[position].now_cost for position in positions] == values
+
+    def test_between_needs_pair(self) -> None:
+        with pytest.raises(ValueError):
+            elems.Player.get_all().filter(now_cost__between=50)
+
+    def test_single_value(self) -> None:
+        with pytest.raises(ValueError):
+            elems.Player.get_all().filter(now_cost__gt=(50, 60))
+
+
 class TestMethodChoice:
     @ pytest.mark.parametrize("input,expected_return", [("all", all), ("or", any)])
     def test_in_choices(self, input: str, expected_return: Callable) -> None:
@@ -4,7 +4,7 @@ from typing import Union, Any
 from fpld.elements.element import ElementGroup
 from .test_elements import Element, ElementClass
 from fpld.elements.fplelems import Event, Fixture, Team
-from fpld.elements.fixture import _fixture, BaseFixture
+from fpld.elements.fixture import _fixture, BaseFixture, FixtureStats
 
 
 class FixtureElement(Element[_fixture]):
@@ -139,3 +139,33 @@ class TestFixtureClass(ElementClass[Fixture]):
                              )
     def test_get_fixtures_in_event(self, fixture_group: ElementGroup[Fixture], event: Event, expected_output: ElementGroup[Fixture]) -> None:
         assert Fixture.get_fixtures_in_event(fixture_group, event) == expected_output
+
+
+STATS = [
+    {"identifier": "goals_scored", "a": [{"value": 1, "element": 283}], "h": [{"value": 2, "element": 10}]},
+    {"identifier": "bps", "a": [{"value": 31, "element": 283}, {"value": -2, "element": 290}], "h": []}
+]
+
+
+class TestFixtureStats:
+    def test_sides(self) -> None:
+        stats = FixtureStats.from_api(STATS)
+
+        assert stats.home("goals_scored") == {10: 2}
+        assert stats.away("bps") == {283: 31, 290: -2}
+        assert stats.home("saves") == {}
+
+    def test_for_player(self) -> None:
+        assert FixtureStats.from_api(STATS).for_player(283) == {"goals_scored": 1, "bps": 31}
+
+    def test_round_trip(self) -> None:
+        stats = FixtureStats.from_api(STATS)
+
+        assert stats.to_list() == STATS
+        assert list(stats) == ["goals_scored", "bps"] and "bps" in stats
+
+    def test_fixture_stats(self) -> None:
+        fixture = Fixture.get_by_id(1)
+
+        assert fixture is not None and isinstance(fixture.stats, FixtureStats)
+        assert fixture.stats.to_list() == Fixture.get_api()[0]["stats"]
@@ -0,0 +1,56 @@
+import os
+import re
+import subprocess
+import sys
+import fpld
+
+
+IMPORT_BUDGET_MS = 95  # Fastest cumulative `import fpld` time from `-X importtime`, ~60-80ms expected
+IMPORT_RUNS = 5  # The fastest of several runs, as one run can be slowed by other processes
+HEAVY_MODULES = ("pandas", "numpy", "requests", "urllib3", "pulp", "asyncio")
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    env = dict(os.environ)
+    env.pop("FPLD_SNAPSHOT", None)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(fpld.__file__)), env.get("PYTHONPATH", "")])
+
+    return subprocess.run(
+        [sys.executable, *options, "-c", code], env=env, capture_output=True, text=True, check=True)
+
+
+class TestImport:
+    def test_no_heavy_modules(self) -> None:
+        code = f"import sys, fpld; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+
+        assert run_python(code).stdout.strip() == "[]"
+
+    def test_no_network(self) -> None:
+        code = "\n".join([
+            "import socket",
+            "def refuse(*args, **kwargs): raise OSError('network used on import')",
+            "socket.socket.connect = refuse",
+            "socket.create_connection = refuse",
+            "import fpld",
+            "print(fpld.util.BOOTSTRAP_STATIC.fetch_count)"
+        ])
+
+        assert run_python(code).stdout.strip() == "0"
+
+    def test_import_time_budget(self) -> None:
+        times = []
+
+        for _ in range(IMPORT_RUNS):
+            stderr = run_python("import fpld", "-X", "importtime").stderr
+            fpld_line = re.search(r"\|\s*(\d+)\s*\|\s*fpld$", stderr, re.MULTILINE)
+
+            assert fpld_line is not None
+            times.append(int(fpld_line.group(1)) / 1000)
+
+        assert min(times) < IMPORT_BUDGET_MS
+
+    def test_lazy_attributes(self) -> None:
+        code = "import sys, fpld; fpld.Squad; print('pulp' in sys.modules)"
+
+        assert run_python(code).stdout.strip() == "True"
@@ -1,7 +1,7 @@
 import pytest
 from typing import Union, Any
 from .test_elements import Element, ElementClass
-from fpld.elements.fplelems import Label
+from fpld.elements.fplelems import Label, get_players
 
 
 class TestLabelExample(Element[Label]):
@@ -28,3 +28,18 @@ class TestLabelClass(ElementClass[Label]):
                              )
     def test_get_by_id(self, id_input: int, expected_output: Union[Label, None]) -> None:
         return super().test_get_by_id(id_input, expected_output)
+
+    def test_add(self) -> None:
+        Label.add(label="Points per Million", name="ppm")
+
+        try:
+            assert Label.get_by_id("ppm") == Label(label="Points per Million", name="ppm")
+            assert get_players(sort_by="Points per Million").columns.tolist() == ["player", "team", "element_type", "ppm"]
+        finally:
+            Label.remove("ppm")
+
+        assert Label.get_by_id("ppm") is None
+
+    def test_remove_not_added(self) -> None:
+        with pytest.raises(KeyError):
+            Label.remove("ppm")
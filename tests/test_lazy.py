@@ -0,0 +1,89 @@
+import pytest
+from typing import Any, Callable
+from fpld import elements as elems
+from fpld.elements.element import ElementGroup
+from fpld.elements.query import parse_conditions
+
+
+CHAINS: list[tuple[Callable[[Any], Any], Callable[[Any], Any]]] = [
+    (lambda q: q.filter(team=(1, 2, 3)).filter(now_cost__lt=60),
+     lambda g: g.filter(team=(1, 2, 3)).filter(now_cost__lt=60)),
+    (lambda q: q.sort("now_cost").filter(element_type=3).top_n("total_points", 5),
+     lambda g: g.sort("now_cost").filter(element_type=3).top_n("total_points", 5)),
+    (lambda q: q.filter(method_="or", status="i", form__gt=5).sort("form", reverse=False).filter(team__ne=1),
+     lambda g: g.filter(method_="or", status="i", form__gt=5).sort("form", reverse=False).filter(team__ne=1)),
+    (lambda q: q.top_n("form", 50).filter(element_type=4).head(3),
+     lambda g: g.top_n("form", 50).filter(element_type=4)[:3]),
+    (lambda q: q.filter(now_cost__gt=50).filter(now_cost__lt=60).sort("web_name", reverse=False).sort("total_points"),
+     lambda g: g.filter(now_cost__gt=50).filter(now_cost__lt=60).sort("web_name", reverse=False).sort("total_points")),
+    (lambda q: q.head(100).bottom_n("ppm", 5).head(10),
+     lambda g: g[:100].bottom_n("ppm", 5)[:10]),
+    (lambda q: q.filter(method_="or"),
+     lambda g: g.filter(method_="or")),
+]
+
+
+def ids(group: Any) -> list[int]:
+    return [elem.unique_id for elem in group]
+
+
+class TestLazyQuery:
+    @pytest.mark.parametrize("lazy,eager", CHAINS)
+    def test_same_as_eager(self, lazy: Callable[[Any], Any], eager: Callable[[Any], Any]) -> None:
+        players = elems.Player.get_all()
+        plain = ElementGroup(players.to_list())
+
+        assert ids(lazy(elems.Player.lazy())) == ids(eager(players))
+        assert ids(lazy(players.lazy())) == ids(eager(players))
+        assert ids(lazy(plain.lazy())) == ids(eager(plain))
+
+    def test_plan(self) -> None:
+        query = elems.Player.lazy().sort("now_cost").filter(element_type=3).filter(form__gt=2) \
+            .filter(method_="or", status="a", news="").get_top_n_elements("total_points", 5)
+
+        assert query.plan() == [("where", "all", tuple(parse_conditions({"element_type": 3, "form__gt": 2}))),
+                                ("filter", "or", tuple(parse_conditions({"status": "a", "news": ""}))),
+                                ("sort", ("total_points", "now_cost"), (True, True), 5)]
+        assert query.explain().splitlines()[1:] == [
+            "1. where(element_type=3, form__gt=2) from indexes",
+            "2. filter(method_='or', status='a', news='')",
+            "3. top 5 by total_points desc, now_cost desc, sort"
+        ]
+
+    def test_filters_not_moved_past_head(self) -> None:
+        query = elems.Player.get_all().lazy().filter(team=1).top_n("form", 10).filter(element_type=2)
+
+        assert [step[0] for step in query.plan()] == ["filter", "sort", "filter"]
+
+    def test_steps_not_run(self) -> None:
+        query = elems.Player.lazy().filter(foo=1)
+
+        with pytest.raises(AttributeError):
+            query.collect()
+
+    def test_to_df(self) -> None:
+        query = elems.Player.lazy().filter(element_type=4).top_n("total_points", 3)
+
+        assert query.to_df("web_name", links="id").equals(query.collect().to_df("web_name", links="id"))
+        assert query.to_list() == list(query)
+
+    @pytest.mark.parametrize("step", [lambda q: q.sort(), lambda q: q.sort("form", reverse=(True, False)),
+                                      lambda q: q.filter(method_="any", form=1)])
+    def test_incorrect_args(self, step: Callable[[Any], Any]) -> None:
+        with pytest.raises(ValueError):
+            step(elems.Player.lazy())
+
+
+class TestWhere:
+    @pytest.mark.parametrize("query", [{"team": (1, 2), "now_cost__lt": 60}, {"method_": "or", "status": "i", "form__gt": 5}])
+    def test_same_as_get(self, query: dict[str, Any]) -> None:
+        method_ = query.pop("method_", "all")
+        conditions = tuple(parse_conditions(query))
+
+        assert ids(elems.Player.where(conditions, method_=method_)) == ids(elems.Player.get(method_=method_, **query))
+        assert ids(elems.Player.get_all().where(conditions, method_=method_)) == ids(elems.Player.get(method_=method_, **query))
+
+    def test_same_attribute_twice(self) -> None:
+        conditions = tuple(parse_conditions({"now_cost__gt": 50}) + parse_conditions({"now_cost__gt": 60}))
+
+        assert ids(elems.Player.where(conditions)) == ids(elems.Player.get(now_cost__gt=60))
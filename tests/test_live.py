@@ -0,0 +1,82 @@
+import pytest
+import asyncio
+import json
+from typing import Any
+from fpld import util
+from fpld.constants import URLS
+from fpld.elements.fplelems import Event
+from fpld.elements.live import LiveFeed
+from .server import StandInServer
+
+
+PATH = "/event/1/live/"
+
+
+def live_body(points: dict[int, int]) -> bytes:
+    elements = [{"id": id_, "stats": {"total_points": pts, "minutes": 90 if pts else 0, "influence": f"{pts}.0"},
+                 "explain": []} for id_, pts in points.items()]
+
+    return json.dumps({"elements": elements}).encode("utf8")
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> Any:
+    with StandInServer({PATH: live_body({1: 0, 2: 2, 3: 0})}) as server:
+        monkeypatch.setitem(URLS, "EVENT-LIVE", server.url("/event/{}/live/"))
+        monkeypatch.setattr(util.API, "snapshot", None)
+
+        yield server
+
+
+class TestLiveFeed:
+    def test_first_poll(self, server: StandInServer) -> None:
+        feed = LiveFeed(1)
+
+        assert feed.poll() == {2: {"total_points": 2, "minutes": 90, "influence": 2.0}}
+        assert feed.points == {1: 0, 2: 2, 3: 0}
+
+    def test_unchanged_not_modified(self, server: StandInServer) -> None:
+        feed = LiveFeed(1)
+        feed.poll()
+
+        assert feed.poll() == {}
+        assert feed.not_modified == 1
+        assert "If-None-Match" in server.requests[-1][1]
+
+    def test_only_changes(self, server: StandInServer) -> None:
+        feed = LiveFeed(1)
+        feed.poll()
+        server.routes[PATH] = live_body({1: 0, 2: 8, 3: 0})
+
+        assert feed.poll() == {2: {"total_points": 6, "influence": 6.0}}
+        assert feed.points[2] == 8
+
+    def test_iterator(self, server: StandInServer) -> None:
+        feed = LiveFeed(1, interval=0)
+
+        assert len(list(feed.iter_deltas(max_polls=3))) == 1
+        assert feed.polls == 3
+
+    def test_async_callbacks(self, server: StandInServer) -> None:
+        feed = LiveFeed(1, interval=0)
+        received: list[Any] = []
+
+        async def async_callback(deltas: Any) -> None:
+            received.append(deltas)
+
+        feed.add_callback(async_callback)
+        feed.add_callback(received.append)
+        asyncio.run(feed.run(max_polls=2))
+
+        assert len(received) == 2
+        assert received[0] == received[1]
+
+    def test_invalid_interval(self) -> None:
+        with pytest.raises(ValueError):
+            LiveFeed(1, interval=-1)
+
+    def test_event_live(self) -> None:
+        event = Event.get_by_id(1)
+
+        assert event is not None
+        assert event.live().url == URLS["EVENT-LIVE"].format(1)
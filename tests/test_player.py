@@ -4,8 +4,11 @@ from fpld.elements.element import ElementGroup
 from .examples import PLAYERS
 from .test_elements import Element, ElementClass
 from fpld.elements.fplelems import Player
-from fpld.elements.player import BasePlayer
+from fpld.elements.player import BasePlayer, BasePlayerFullDf
 from fpld.elements.player import _player
+from fpld.constants import URLS
+from fpld.util import API
+from .server import StandInServer
 
 
 class PlayerElement(Element[_player]):
@@ -54,6 +57,17 @@ class TestPlayerExample(PlayerElement[Player]):
     def test_in_full(self) -> None:
         self.element_to_test.in_full()
 
+    def test_percents(self) -> None:
+        players = self.element_to_test.team.players
+        in_position = players.filter(element_type=self.element_to_test.element_type)
+        team_total = sum(player.goal_contributions for player in players)
+        position_total = sum(player.goal_contributions for player in in_position)
+
+        assert self.element_to_test.percent_team == (
+            self.element_to_test.goal_contributions / team_total * 100 if team_total else 0)
+        assert self.element_to_test.percent_pos == (
+            self.element_to_test.goal_contributions / position_total * 100 if position_total else 0)
+
 
 class TestPlayerClass(ElementClass[Player]):
     class_to_test = Player
@@ -83,3 +97,45 @@ class TestPlayerClass(ElementClass[Player]):
 
         group = self.class_to_test.in_cost_range(player_pool, lower=lower, upper=upper, include_boundaries=include_boundaries)
         assert group.to_list() == expected_output.to_list()
+
+    def test_contribution_percents(self) -> None:
+        players = self.class_to_test.get_all()
+        output = self.class_to_test.contribution_percents()
+
+        assert output.index.tolist() == list(range(1, len(players) + 1))
+        assert output["percent_pos"].tolist() == [player.percent_pos for player in players]
+        assert output["percent_team"].tolist() == [player.percent_team for player in players]
+
+
+class TestBasePlayerFullDfBulk:
+    routes = {
+        f"/element-summary/{i}/": b'{"fixtures": [], "history": [{"fixture": 1, "total_points": 2}], "history_past": []}'
+        for i in range(1, 21)
+    }
+
+    @pytest.fixture(autouse=True)
+    def live(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(API, "snapshot", None)
+
+    def test_from_player_ids(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        with StandInServer(dict(self.routes)) as server:
+            monkeypatch.setitem(URLS, "ELEMENT-SUMMARY", server.url("/element-summary/{}/"))
+            errors: dict[int, Exception] = {}
+
+            output = BasePlayerFullDf.from_player_ids([*range(1, 21), 999], concurrency=4, rate=1000, errors=errors)
+
+            assert sorted(output) == list(range(1, 21))
+            assert all(isinstance(player_full, BasePlayerFullDf) for player_full in output.values())
+            assert list(output[1].history["total_points"]) == [2]
+            assert list(errors) == [999]
+
+    def test_get_api_bulk_isolates_errors(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        with StandInServer(dict(self.routes)) as server:
+            monkeypatch.setitem(URLS, "ELEMENT-SUMMARY", server.url("/element-summary/{}/"))
+            server.routes["/element-summary/2/"] = b'"The game is being updated."'
+
+            output = BasePlayerFullDf.get_api_bulk([1, 2, 1], concurrency=2, rate=1000)
+
+            assert list(output) == [1, 2]
+            assert isinstance(output[1], dict)
+            assert isinstance(output[2], ValueError)
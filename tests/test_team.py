@@ -1,7 +1,7 @@
 import pytest
 from typing import Union, Any
 from .test_elements import Element, ElementClass
-from fpld.elements.fplelems import Team
+from fpld.elements.fplelems import Team, Position
 
 
 class TestTeamExample(Element[Team]):
@@ -12,6 +12,12 @@ class TestTeamExample(Element[Team]):
         "unique_id": 1,
     }
 
+    @pytest.mark.parametrize("by_position", [None, *Position.get_all()])
+    def test_total_goal_contributions(self, by_position: Union[Position, None]) -> None:
+        output = self.element_to_test.total_goal_contributions(by_position=by_position)
+
+        assert output == self.element_to_test.player_total("goals_scored", "assists", by_position=by_position)
+
 
 class TestTeamClass(ElementClass[Team]):
     class_to_test = Team
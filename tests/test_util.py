@@ -1,8 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
 import pytest
+from typing import Any
 from fpld import util
 import fpld
 import pandas as pd
 import requests
+import time
+from fpld.util.cache import _write_atomic
+from fpld.util.session import RetryWithJitter
+from .server import StandInServer
 
 
 class TestPercent:
@@ -20,8 +27,371 @@ class TestAPI:
         assert isinstance(api.df, pd.DataFrame)
         assert str(api.data) == str(api)
 
-    def test_invalid_url(self) -> None:
+    def test_invalid_url(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(util.API, "snapshot", None)  # Live, even if running from a snapshot
         url = ""
 
         with pytest.raises(requests.exceptions.MissingSchema):
             util.API(url)
+
+
+class TestBootstrapStatic:
+    sections = ["elements", "teams", "events", "element_types", "element_stats", "game_settings"]
+
+    def test_single_download(self) -> None:
+        store = util.BootstrapStatic(fpld.constants.URLS["BOOTSTRAP-STATIC"])
+
+        assert store.fetch_count == 0
+
+        for section in self.sections:
+            store.section(section)
+
+        assert store.fetch_count == 1
+
+    def test_refresh(self) -> None:
+        store = util.BootstrapStatic(fpld.constants.URLS["BOOTSTRAP-STATIC"])
+        store.data
+        version = store.version
+
+        store.refresh()
+
+        assert store.fetch_count == 2
+        assert store.version == version + 1
+
+    def test_section_is_copy(self) -> None:
+        store = util.BootstrapStatic(fpld.constants.URLS["BOOTSTRAP-STATIC"])
+        events = store.section("events")
+        events.append({})
+
+        assert len(store.section("events")) == len(events) - 1
+
+    def test_element_classes_share_download(self) -> None:
+        util.BOOTSTRAP_STATIC.data
+        fetch_count = util.BOOTSTRAP_STATIC.fetch_count
+
+        for class_ in (fpld.Player, fpld.Team, fpld.Event, fpld.Position, fpld.Label):
+            class_.get_api()
+        fpld.team.validation.FPLSquadSettings().squad_size
+
+        assert util.BOOTSTRAP_STATIC.fetch_count == fetch_count
+
+    def test_refresh_updates_all_classes(self) -> None:
+        team_api = fpld.Team.get_api()
+        fetch_count = util.BOOTSTRAP_STATIC.fetch_count
+
+        fpld.Player.get_api(refresh_api=True)
+
+        assert util.BOOTSTRAP_STATIC.fetch_count == fetch_count + 1
+        assert id(fpld.Team.get_api()) != id(team_api)
+
+
+class TestHTTPCache:
+    routes = {"/bootstrap-static/": b'{"events": []}'}
+
+    def test_miss_then_hit(self, tmp_path: Any) -> None:
+        with StandInServer(dict(self.routes)) as server:
+            cache = util.HTTPCache(str(tmp_path), default_ttl=60)
+            url = server.url("/bootstrap-static/")
+
+            assert cache.get(url) == self.routes["/bootstrap-static/"]
+            assert cache.get(url) == self.routes["/bootstrap-static/"]
+
+            assert (cache.hits, cache.misses, cache.revalidated) == (1, 1, 0)
+            assert len(server.requests) == 1
+
+    def test_revalidated(self, tmp_path: Any) -> None:
+        with StandInServer(dict(self.routes)) as server:
+            cache = util.HTTPCache(str(tmp_path), default_ttl=0)
+            url = server.url("/bootstrap-static/")
+
+            cache.get(url)
+            assert cache.get(url) == self.routes["/bootstrap-static/"]
+
+            assert (cache.hits, cache.misses, cache.revalidated) == (0, 1, 1)
+            assert "If-None-Match" in server.requests[1][1]
+
+    def test_changed_body(self, tmp_path: Any) -> None:
+        with StandInServer(dict(self.routes)) as server:
+            cache = util.HTTPCache(str(tmp_path), default_ttl=0)
+            url = server.url("/bootstrap-static/")
+
+            cache.get(url)
+            server.routes["/bootstrap-static/"] = b'{"events": [1]}'
+
+            assert cache.get(url) == b'{"events": [1]}'
+            assert cache.misses == 2
+
+    def test_stale_on_error(self, tmp_path: Any) -> None:
+        with StandInServer(dict(self.routes)) as server:
+            cache = util.HTTPCache(str(tmp_path), default_ttl=0)
+            url = server.url("/bootstrap-static/")
+
+            cache.get(url)
+            server.failures["/bootstrap-static/"] = 1
+
+            assert cache.get(url) == self.routes["/bootstrap-static/"]
+            assert cache.get(url) == self.routes["/bootstrap-static/"]  # Still expired, so revalidated again
+            assert (cache.misses, cache.stale, cache.revalidated) == (1, 1, 1)
+
+    def test_counts_from_threads(self, tmp_path: Any) -> None:
+        with StandInServer(dict(self.routes)) as server:
+            cache = util.HTTPCache(str(tmp_path), default_ttl=60)
+            url = server.url("/bootstrap-static/")
+            cache.get(url)
+
+            with ThreadPoolExecutor(8) as executor:
+                list(executor.map(lambda _: cache.get(url), range(400)))
+
+            assert (cache.hits, cache.misses) == (400, 1)
+
+    def test_atomic_writes_from_threads(self, tmp_path: Any) -> None:
+        path = str(tmp_path / "body")
+        contents = [bytes([i]) * 100_000 for i in range(16)]
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(lambda content: _write_atomic(path, content), contents * 4))
+
+        with open(path, "rb") as f:
+            assert f.read() in contents
+        assert os.listdir(tmp_path) == ["body"]
+
+    def test_persists_between_instances(self, tmp_path: Any) -> None:
+        with StandInServer(dict(self.routes)) as server:
+            url = server.url("/bootstrap-static/")
+            util.HTTPCache(str(tmp_path), default_ttl=60).get(url)
+
+            cache = util.HTTPCache(str(tmp_path), default_ttl=60)
+            cache.get(url)
+
+            assert cache.hits == 1
+            assert len(server.requests) == 1
+
+    def test_not_found_not_stored(self, tmp_path: Any) -> None:
+        with StandInServer(dict(self.routes)) as server:
+            cache = util.HTTPCache(str(tmp_path), default_ttl=60)
+            url = server.url("/foo/")
+
+            cache.get(url)
+            cache.get(url)
+
+            assert cache.misses == 2
+
+    @pytest.mark.parametrize("url,expected",
+                             [
+                                 (fpld.constants.URLS["BOOTSTRAP-STATIC"], 1),
+                                 (fpld.constants.URLS["FIXTURES"], 2),
+                                 (fpld.constants.URLS["ELEMENT-SUMMARY"].format(427), 3),
+                                 ("http://127.0.0.1/", 0)
+                             ]
+                             )
+    def test_ttl_for(self, tmp_path: Any, url: str, expected: float) -> None:
+        ttl = {"BOOTSTRAP-STATIC": 1, "FIXTURES": 2, "ELEMENT-SUMMARY": 3}
+        cache = util.HTTPCache(str(tmp_path), ttl=ttl)
+
+        assert cache.ttl_for(url) == expected
+
+    def test_api_uses_cache(self, tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(util.API, "snapshot", None)
+
+        with StandInServer(dict(self.routes)) as server:
+            util.API.cache = util.HTTPCache(str(tmp_path), default_ttl=60)
+
+            try:
+                api = util.API(server.url("/bootstrap-static/"))
+                api_2 = util.API(server.url("/bootstrap-static/"))
+            finally:
+                util.API.cache = None
+
+            assert api.data == api_2.data == {"events": []}
+            assert len(server.requests) == 1
+
+
+class TestFPLSession:
+    routes = {f"/element-summary/{i}/": b'{"history": []}' for i in range(1, 51)}
+
+    def test_connections_reused(self) -> None:
+        with StandInServer(dict(self.routes)) as server:
+            session = util.FPLSession()
+
+            for path in self.routes:
+                session.get(server.url(path))
+
+            assert len(server.requests) == 50
+            assert server.connections == 1
+
+    def test_retry_on_server_error(self) -> None:
+        with StandInServer(dict(self.routes)) as server:
+            session = util.FPLSession(backoff_factor=0)
+            server.failures["/element-summary/1/"] = 2
+
+            response = session.get(server.url("/element-summary/1/"))
+
+            assert response.status_code == 200
+            assert len(server.requests) == 3
+
+    def test_retries_bounded(self) -> None:
+        with StandInServer(dict(self.routes)) as server:
+            session = util.FPLSession(retries=1, backoff_factor=0)
+            server.failures["/element-summary/1/"] = 5
+
+            response = session.get(server.url("/element-summary/1/"))
+
+            assert response.status_code == 503
+            assert len(server.requests) == 2
+
+    def test_backoff_jitter(self) -> None:
+        retry = RetryWithJitter(total=3, backoff_factor=1)
+        retry.jitter = 0.5
+        retry = retry.increment(method="GET", url="/").increment(method="GET", url="/")
+
+        assert retry.jitter == 0.5
+        assert 2 <= retry.get_backoff_time() <= 2.5
+
+    def test_default_timeout(self) -> None:
+        assert util.FPLSession(timeout=1.5).timeout == 1.5
+
+
+class TestTokenBucket:
+    def test_burst_then_rate(self) -> None:
+        bucket = util.TokenBucket(rate=100, capacity=5)
+        start = time.monotonic()
+
+        for _ in range(15):
+            bucket.acquire()
+
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.parametrize("rate,capacity", [(0, 1), (1, 0)])
+    def test_invalid(self, rate: float, capacity: float) -> None:
+        with pytest.raises(ValueError):
+            util.TokenBucket(rate, capacity)
+
+
+class TestQueryCache:
+    def test_hit_and_miss(self) -> None:
+        cache = util.QueryCache()
+
+        assert cache.lookup("a", 0) == (False, None)
+        cache.store("a", 1, 0)
+        assert cache.lookup("a", 0) == (True, 1)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_least_recently_used_evicted(self) -> None:
+        cache = util.QueryCache(maxsize=2)
+        cache.store("a", 1, 0)
+        cache.store("b", 2, 0)
+        cache.lookup("a", 0)
+        cache.store("c", 3, 0)
+
+        assert cache.lookup("b", 0) == (False, None)
+        assert cache.lookup("a", 0) == (True, 1)
+        assert len(cache) == 2 and cache.evictions == 1
+
+    def test_pinned_not_evicted(self) -> None:
+        cache = util.QueryCache(maxsize=1, ttl=0.01)
+        cache.store("index", 1, 0, pinned=True)
+        cache.store("a", 2, 0)
+        cache.store("b", 3, 0)
+        time.sleep(0.02)
+
+        assert cache.lookup("index", 0) == (True, 1)
+        assert len(cache) == 1 and cache.pinned == 1
+        assert cache.lookup("index", 1) == (False, None)
+        assert cache.pinned == 0
+
+    def test_ttl(self) -> None:
+        cache = util.QueryCache(ttl=0.01)
+        cache.store("a", 1, 0)
+        time.sleep(0.02)
+
+        assert cache.lookup("a", 0) == (False, None)
+        assert cache.evictions == 1
+
+    def test_generation_change(self) -> None:
+        cache = util.QueryCache()
+        cache.store("a", 1, 0)
+        cache.store("b", 2, 0)
+
+        assert cache.lookup("a", 1) == (False, None)
+        assert cache.invalidations == 2 and cache.generation == 1
+
+    def test_clear(self) -> None:
+        cache = util.QueryCache()
+        cache.store("a", 1, 0)
+        cache.lookup("a", 0)
+        cache.clear()
+
+        assert len(cache) == 0 and cache.hits == 0 and cache.generation is None
+
+    def test_invalid_maxsize(self) -> None:
+        with pytest.raises(ValueError):
+            util.QueryCache(maxsize=0)
+
+
+class TestSnapshot:
+    def test_path_for(self, tmp_path: Any) -> None:
+        snapshot = util.Snapshot(str(tmp_path), "record")
+        urls = fpld.constants.URLS
+
+        assert snapshot.path_for(urls["BOOTSTRAP-STATIC"]) == str(tmp_path / "bootstrap-static.json")
+        assert snapshot.path_for(urls["FIXTURES"]) == str(tmp_path / "fixtures.json")
+        assert snapshot.path_for(urls["ELEMENT-SUMMARY"].format(427)) == str(tmp_path / "element-summary" / "427.json")
+        assert snapshot.path_for(urls["EVENT-LIVE"].format(16)) == str(tmp_path / "event-live" / "16.json")
+
+        with pytest.raises(util.SnapshotError):
+            snapshot.path_for("https://example.com/")
+
+    def test_record_then_replay(self, tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+        with StandInServer({"/fixtures/": b'[{"id": 1}]'}) as server:
+            monkeypatch.setitem(fpld.constants.URLS, "FIXTURES", server.url("/fixtures/"))
+            monkeypatch.setattr(util.API, "snapshot", util.Snapshot(str(tmp_path), "record"))
+
+            recorded = util.API(server.url("/fixtures/")).data
+
+        monkeypatch.setattr(util.API, "snapshot", util.Snapshot(str(tmp_path), "replay"))
+        replayed = util.API(fpld.constants.URLS["FIXTURES"]).data
+
+        assert recorded == replayed == [{"id": 1}]
+
+    def test_replay_not_recorded(self, tmp_path: Any) -> None:
+        util.Snapshot(str(tmp_path), "record")
+        snapshot = util.Snapshot(str(tmp_path), "replay")
+
+        with pytest.raises(util.SnapshotError):
+            snapshot.read(fpld.constants.URLS["FIXTURES"])
+
+    def test_replay_not_a_snapshot(self, tmp_path: Any) -> None:
+        with pytest.raises(util.SnapshotError):
+            util.Snapshot(str(tmp_path), "replay")
+
+    def test_invalid_mode(self, tmp_path: Any) -> None:
+        with pytest.raises(ValueError):
+            util.Snapshot(str(tmp_path), "foo")
+
+    @pytest.mark.parametrize("value,expected_mode", [("record:{}", "record"), ("replay:{}", "replay"), ("{}", "replay")])
+    def test_snapshot_from_env(self, tmp_path: Any, value: str, expected_mode: str) -> None:
+        util.Snapshot(str(tmp_path), "record")
+        snapshot = util.snapshot.snapshot_from_env(value.format(tmp_path))
+
+        assert snapshot.mode == expected_mode
+        assert snapshot.directory == str(tmp_path)
+
+
+class TestDecodeJSON:
+    @pytest.fixture(params=[True, False], ids=["fast", "json"])
+    def backend(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+        if not request.param:
+            monkeypatch.setattr(util.external, "_fast_loads", None)
+        elif util.external._fast_loads is None:
+            pytest.skip("orjson not installed")
+
+    @pytest.mark.parametrize("content,expected",
+                             [
+                                 ('{"web_name": "Canós"}'.encode("utf8"), {"web_name": "Canós"}),
+                                 (b'{"web_name": "Can\\u00f3s"}', {"web_name": "Canós"}),
+                                 (b'{"news": "Said \\"ok\\""}', {"news": 'Said "ok"'}),
+                                 (b'"The game is being updated."', "The game is being updated.")
+                             ]
+                             )
+    def test_decode_json(self, backend: None, content: bytes, expected: Any) -> None:
+        assert util.external.decode_json(content) == expected